@@ -26,6 +26,8 @@ from services.admin_routes import admin_bp
 from auth.middleware import require_citizen, require_service_operator, require_auth, require_inspector
 from utils import error_response, validate_wallet_address, normalize_wallet_address
 from services.cleanup import cleanup_old_files
+from database.db import engine
+from database.partitions import ensure_monthly_partitions
 from services.blockchain_service import blockchain_service
 from services.recycling_declaration_service import recycling_declaration_service
 
@@ -73,6 +75,12 @@ def scheduled_cleanup():
     logger.info("Running scheduled cleanup job...")
     cleanup_old_files(UPLOAD_FOLDER, max_age_days=180) # 6 months
 
+# Monthly partition maintenance (Postgres + PARTITION_TIME_SERIES only)
+@scheduler.task('cron', id='ensure_partitions', day=1, hour=2, minute=0)
+def scheduled_partition_maintenance():
+    logger.info("Ensuring monthly time-series partitions...")
+    ensure_monthly_partitions(engine)
+
 # Register Blueprints
 app.register_blueprint(auth_bp)
 app.register_blueprint(admin_bp)
@@ -25,6 +25,13 @@ DATABASE_URL = os.getenv(
     "sqlite:///./ecocivic_demo.db" # Default to SQLite for easy demo setup
 )
 
+# Postgres: water_meter_readings / fraud_reports tablolarini created_at'e
+# gore aylik RANGE partition olarak olustur (diger dialect'lerde yok sayilir)
+PARTITION_TIME_SERIES = (
+    DATABASE_URL.startswith("postgresql")
+    and os.getenv("PARTITION_TIME_SERIES", "false").lower() == "true"
+)
+
 # ==============================
 # AI / ML CONFIG
 # ==============================
@@ -4,11 +4,18 @@ MySQL database bağlantı yönetimi
 """
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
 from config import DATABASE_URL
 
+# executemany INSERT'leri sayfa basina tek cok satirli VALUES olarak gonderilir
+engine_options = {"insertmanyvalues_page_size": 10_000}
+if make_url(DATABASE_URL).get_dialect().driver == "psycopg2":
+    # psycopg2: RETURNING'siz executemany'ler de execute_batch ile gruplanir
+    engine_options["executemany_mode"] = "values_plus_batch"
+
 # Create database engine
 engine = create_engine(
     DATABASE_URL,
@@ -16,7 +23,8 @@ engine = create_engine(
     pool_size=10,
     max_overflow=20,
     pool_recycle=3600,  # Recycle connections after 1 hour
-    echo=False  # Set to True for SQL query logging
+    echo=False,  # Set to True for SQL query logging
+    **engine_options
 )
 
 # Create session factory
@@ -50,4 +58,7 @@ def init_db():
     """
     Initialize database tables
     """
+    from database.partitions import ensure_monthly_partitions
+
     Base.metadata.create_all(bind=engine)
+    ensure_monthly_partitions(engine)
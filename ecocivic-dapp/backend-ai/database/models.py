@@ -2,10 +2,146 @@
 Database Models
 SQLAlchemy ORM modelleri
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, Index, Enum as SQLEnum
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, DateTime, Boolean, Text, Index, JSON, LargeBinary, FetchedValue, ForeignKey, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from database.db import Base
+from config import PARTITION_TIME_SERIES
 import enum
+import re
+
+
+_WALLET_RE = re.compile(r"0[xX][0-9a-fA-F]{40}")
+
+
+class WalletAddress(TypeDecorator):
+    """
+    EVM cüzdan adresi kolonu
+
+    Postgres'te 20 byte'lık BYTEA olarak saklanır (VARCHAR(42)'ye göre
+    yarı boyutta index, sabit uzunluklu karşılaştırma). Diğer dialect'lerde
+    String(42). Adresler her dialect'te küçük harfe çevrilerek yazılır ve
+    küçük harfli "0x..." olarak okunur; checksum'lı filtre değerleri de eşleşir.
+
+    Adres olmayan işaret değerleri ("ADMIN", "unknown", "statistical_system")
+    Postgres'te UTF-8 metin byte'ları olarak saklanır. 20 byte'lık değerler
+    her zaman adres okunduğu için tam 20 byte'lık metne bir NUL eklenir.
+    Geçersiz bir filtre değeri böylece hata vermez, hiçbir adresle eşleşmez.
+    """
+    impl = String(42)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(LargeBinary(20))
+        return dialect.type_descriptor(String(42))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        is_address = _WALLET_RE.fullmatch(value) is not None
+        if dialect.name != "postgresql":
+            return value.lower() if is_address else value
+        if is_address:
+            return bytes.fromhex(value[2:])
+        raw = value.encode("utf-8")
+        return raw + b"\x00" if len(raw) == 20 else raw
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if dialect.name != "postgresql":
+            return value.lower() if _WALLET_RE.fullmatch(value) else value
+        value = bytes(value)
+        if len(value) == 20:
+            return "0x" + value.hex()
+        if len(value) == 21 and value.endswith(b"\x00"):
+            value = value[:-1]
+        return value.decode("utf-8")
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Sabit değer kümesini (Enum üyeleri veya string'ler) SMALLINT kodu
+    olarak saklar. Uygulama tarafı orijinal değeri görür; index girdisi
+    enum adı/string yerine 2 byte'tır.
+
+    Eski kayıtlarda kalan isim/string değerleri de okunabilir.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes):
+        super().__init__()
+        self.codes = tuple(codes.items()) if isinstance(codes, dict) else tuple(codes)
+        self._to_code = dict(self.codes)
+        self._from_code = {code: value for value, code in self.codes}
+        self._legacy = {}
+        for value, _ in self.codes:
+            if isinstance(value, enum.Enum):
+                self._legacy[value.name] = value
+                self._legacy[value.value] = value
+            else:
+                self._legacy[value] = value
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._to_code[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            if not value.isdigit():
+                return self._legacy[value]
+            value = int(value)
+        return self._from_code[value]
+
+
+def _time_partition_args():
+    """PARTITION_TIME_SERIES açıkken created_at'e göre aylık RANGE partition"""
+    if PARTITION_TIME_SERIES:
+        return {"postgresql_partition_by": "RANGE (created_at)"}
+    return {}
+
+
+def scaled_amount(column_name, scale):
+    """
+    Tam sayı alt birimde (milli-m³, kuruş, gram) saklanan kolonu ondalık
+    birimde gösteren hybrid property. Okuma/yazma ve sorgu ifadeleri eski
+    Float kolon adıyla çalışmaya devam eder; SUM gibi toplamalar DB'de
+    tam sayı üzerinden yapılır.
+    """
+    def fget(self):
+        value = getattr(self, column_name)
+        return None if value is None else value / scale
+
+    def fset(self, value):
+        setattr(self, column_name, to_units(value))
+
+    def expr(cls):
+        return getattr(cls, column_name) / float(scale)
+
+    def to_units(value):
+        return None if value is None else int(round(value * scale))
+
+    def update_expr(cls, value):
+        return [(getattr(cls, column_name), to_units(value))]
+
+    return _ScaledAmount(fget, fset, expr=expr, update_expr=update_expr)
+
+
+class _ScaledAmount(hybrid_property):
+    """
+    Sınıf özniteliği adını hybrid'e bildirir; aksi halde ad iç fget
+    fonksiyonundan gelir ve query.update({Model.alan: v}) gibi öznitelik
+    anahtarlı toplu güncellemeler proxy_key bulamaz.
+    """
+    def __set_name__(self, owner, name):
+        self.__name__ = name
 
 
 class UserRole(enum.Enum):
@@ -25,13 +161,31 @@ class UserRole(enum.Enum):
     ORACLE = "oracle"                        # Oracle - dış veri sağlayıcı
 
 
+# UserRole -> SMALLINT kodu (değerler kalıcıdır, değiştirmeyin)
+USER_ROLE_CODES = {
+    UserRole.CITIZEN: 1,
+    UserRole.SERVICE_OPERATOR: 2,
+    UserRole.MUNICIPALITY_ADMIN: 3,
+    UserRole.MUNICIPALITY_STAFF: 4,
+    UserRole.ORACLE: 5,
+}
+
+# FraudReport.risk_level -> SMALLINT kodu
+RISK_LEVEL_CODES = {
+    "low": 0,
+    "medium": 1,
+    "high": 2,
+    "critical": 3,
+}
+
+
 class User(Base):
     """Kullanıcı modeli - Wallet-based authentication"""
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, unique=True, index=True)
-    role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.CITIZEN, index=True)
+    wallet_address = Column(WalletAddress, nullable=False, unique=True, index=True)
+    role = Column(SmallIntEnum(USER_ROLE_CODES), nullable=False, default=UserRole.CITIZEN, index=True)
     email = Column(String(255), nullable=True)
     name = Column(String(255), nullable=True)
     is_active = Column(Boolean, default=True)
@@ -44,7 +198,7 @@ class User(Base):
     # Pending rewards (Accumulate & Claim)
     pending_reward_balance = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # trigger ile
     last_login = Column(DateTime(timezone=True), nullable=True)
     
     __table_args__ = (
@@ -56,13 +210,15 @@ class WaterMeterReading(Base):
     """Su sayacı okuma kayıtları"""
     __tablename__ = "water_meter_readings"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     meter_no = Column(String(50), nullable=False, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    wallet_address = Column(WalletAddress, nullable=False)  # idx_meter_wallet_created ile indeksli
     reading_index = Column(Integer, nullable=False)
     previous_index = Column(Integer, nullable=True)
-    consumption_m3 = Column(Float, nullable=False)
-    bill_amount = Column(Float, nullable=False)
+    consumption_milli_m3 = Column(Integer, nullable=False)  # m³ x 1000
+    bill_amount_kurus = Column(Integer, nullable=False)  # TL x 100
+    consumption_m3 = scaled_amount("consumption_milli_m3", 1000)
+    bill_amount = scaled_amount("bill_amount_kurus", 100)
     reward_amount = Column(Integer, nullable=False, default=0)
     image_path = Column(String(255), nullable=True)
     # Fotoğraf hash'i blockchain'de saklanacak
@@ -73,15 +229,20 @@ class WaterMeterReading(Base):
     user_confirmed_low_consumption = Column(Boolean, default=False)
     # Admin fiziksel kontrol onayı
     admin_approval_status = Column(String(20), default="pending")  # pending, approved, fraud
-    admin_approved_by = Column(String(42), nullable=True)
-    validated_by = Column(String(42), nullable=True)  # Service operator wallet address
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    admin_approved_by = Column(WalletAddress, nullable=True)
+    validated_by_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Service operator
+    # Partition anahtari Postgres'te primary key'e dahil olmak zorunda
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), primary_key=PARTITION_TIME_SERIES)
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # trigger ile
     
     __table_args__ = (
         Index('idx_meter_wallet', 'meter_no', 'wallet_address'),
-        Index('idx_created_at', 'created_at'),
+        # "kullanicinin son okumalari" ve tarih araligi sorgulari
+        Index('idx_meter_wallet_created', wallet_address, created_at.desc()),
+        _time_partition_args(),
     )
+    # ORM kimliği her konfigürasyonda sadece id; composite PK yalnızca DDL'de
+    __mapper_args__ = {"primary_key": [id]}
 
 
 class RecyclingSubmission(Base):
@@ -89,9 +250,10 @@ class RecyclingSubmission(Base):
     __tablename__ = "recycling_submissions"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    wallet_address = Column(WalletAddress, nullable=False, index=True)
     material_type = Column(String(20), nullable=False)  # glass, paper, metal, plastic, electronic
-    amount_kg = Column(Float, nullable=False)
+    amount_g = Column(Integer, nullable=False)  # kg x 1000
+    amount_kg = scaled_amount("amount_g", 1000)
     qr_token_id = Column(String(100), nullable=False, unique=True, index=True)
     qr_hash = Column(String(64), nullable=False, unique=True, index=True)
     reward_amount = Column(Integer, nullable=False)
@@ -99,10 +261,10 @@ class RecyclingSubmission(Base):
     is_processed = Column(Boolean, default=False)
     # Admin onay sistemi
     admin_approval_status = Column(String(20), default="pending")  # pending, approved, fraud
-    admin_approved_by = Column(String(42), nullable=True)
+    admin_approved_by = Column(WalletAddress, nullable=True)
     is_fraud = Column(Boolean, default=False)
     fraud_reason = Column(Text, nullable=True)
-    validated_by = Column(String(42), nullable=True)  # Service operator wallet address
+    validated_by_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Service operator
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     processed_at = Column(DateTime(timezone=True), nullable=True)
     
@@ -120,7 +282,7 @@ class RecyclingDeclaration(Base):
     __tablename__ = "recycling_declarations"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    wallet_address = Column(WalletAddress, nullable=False, index=True)
     
     # Tüm atık türleri için miktar (kg)
     plastic_kg = Column(Float, default=0)
@@ -141,7 +303,7 @@ class RecyclingDeclaration(Base):
     
     # Admin onay sistemi
     admin_approval_status = Column(String(20), default="pending")  # pending, approved, fraud
-    admin_approved_by = Column(String(42), nullable=True)
+    admin_approved_by = Column(WalletAddress, nullable=True)
     is_fraud = Column(Boolean, default=False)
     fraud_reason = Column(Text, nullable=True)
     
@@ -163,12 +325,13 @@ class UserDeposit(Base):
     __tablename__ = "user_deposits"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, unique=True, index=True)
-    deposit_amount = Column(Float, nullable=False)
+    wallet_address = Column(WalletAddress, nullable=False, unique=True, index=True)
+    deposit_amount_kurus = Column(Integer, nullable=False)  # x 100
+    deposit_amount = scaled_amount("deposit_amount_kurus", 100)
     deposit_token = Column(String(42), nullable=False)  # Token contract address
     transaction_hash = Column(String(66), nullable=True, unique=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # trigger ile
 
 
 class PenaltyRecord(Base):
@@ -176,13 +339,14 @@ class PenaltyRecord(Base):
     __tablename__ = "penalty_records"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    wallet_address = Column(WalletAddress, nullable=False, index=True)
     penalty_type = Column(String(50), nullable=False)  # late_payment, violation, etc.
-    penalty_amount = Column(Float, nullable=False)
+    penalty_amount_kurus = Column(Integer, nullable=False)  # x 100
+    penalty_amount = scaled_amount("penalty_amount_kurus", 100)
     description = Column(Text, nullable=True)
     transaction_hash = Column(String(66), nullable=True, unique=True, index=True)
     is_paid = Column(Boolean, default=False)
-    created_by = Column(String(42), nullable=True)  # Municipality admin wallet address
+    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Municipality admin
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     paid_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -192,7 +356,7 @@ class FraudRecord(Base):
     __tablename__ = "fraud_records"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    wallet_address = Column(WalletAddress, nullable=False, index=True)
     fraud_type = Column(String(50), nullable=False)  # ai_detected, inspection_detected
     detection_method = Column(String(50), nullable=True)  # ocr_anomaly, consumption_drop, physical_inspection
     penalty_amount = Column(Float, nullable=True)
@@ -201,7 +365,7 @@ class FraudRecord(Base):
     underpayment_amount = Column(Float, nullable=True)  # Eksik ödenen tutar
     interest_charged = Column(Float, nullable=True)  # Faiz tutarı
     transaction_hash = Column(String(66), nullable=True, index=True)
-    detected_by = Column(String(42), nullable=True)  # AI system or inspector wallet
+    detected_by = Column(WalletAddress, nullable=True)  # AI system or inspector wallet
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
@@ -216,10 +380,10 @@ class InspectionSchedule(Base):
     __tablename__ = "inspection_schedules"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    wallet_address = Column(WalletAddress, nullable=False, index=True)
     meter_no = Column(String(50), nullable=False)
     scheduled_date = Column(DateTime(timezone=True), nullable=False)
-    inspector_wallet = Column(String(42), nullable=True, index=True)
+    inspector_wallet = Column(WalletAddress, nullable=True, index=True)
     status = Column(String(20), default="pending", index=True)  # pending, completed, fraud_found, cancelled
     actual_reading = Column(Integer, nullable=True)
     notes = Column(Text, nullable=True)
@@ -262,13 +426,13 @@ class FraudReport(Base):
     """
     __tablename__ = "fraud_reports"
     
-    id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    wallet_address = Column(WalletAddress, nullable=False)  # idx_fraud_report_hot ile indeksli
     
     # AI Scoring
     ai_score = Column(Integer, nullable=False)  # 0-100
-    risk_level = Column(String(20), nullable=False)  # low, medium, high, critical
-    anomalies = Column(Text, nullable=True)  # JSON list of anomalies
+    risk_level = Column(SmallIntEnum(RISK_LEVEL_CODES), nullable=False)  # low, medium, high, critical
+    anomalies = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # JSON list of anomalies
     
     # Confirmation
     is_confirmed = Column(Boolean, default=False)  # Kullanıcı onayladı mı
@@ -291,15 +455,29 @@ class FraudReport(Base):
     has_gps = Column(Boolean, default=True)
     was_edited = Column(Boolean, default=False)
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Partition anahtari Postgres'te primary key'e dahil olmak zorunda
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), primary_key=PARTITION_TIME_SERIES)
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # trigger ile
     
     __table_args__ = (
-        Index('idx_fraud_report_wallet', 'wallet_address'),
-        Index('idx_fraud_report_score', 'ai_score'),
-        Index('idx_fraud_report_confirmed', 'is_confirmed'),
-        Index('idx_fraud_report_created', 'created_at'),
+        # Dashboard sorgusu: wallet + onay durumu, ai_score'a gore azalan
+        # (Postgres'te INCLUDE kolonlari ile index-only scan)
+        Index(
+            'idx_fraud_report_hot',
+            wallet_address, is_confirmed, ai_score.desc(),
+            postgresql_include=['created_at', 'action_taken'],
+        ),
+        Index('idx_fraud_report_wallet_created', wallet_address, created_at.desc()),
+        # anomalies @> '["..."]' containment sorgulari icin (sadece Postgres)
+        Index(
+            'idx_fraud_report_anomalies_gin', 'anomalies',
+            postgresql_using='gin',
+            postgresql_ops={'anomalies': 'jsonb_path_ops'},
+        ).ddl_if(dialect='postgresql'),
+        _time_partition_args(),
     )
+    # ORM kimliği her konfigürasyonda sadece id; composite PK yalnızca DDL'de
+    __mapper_args__ = {"primary_key": [id]}
 
 
 class MaterialMultiplier(Base):
@@ -316,7 +494,7 @@ class MaterialMultiplier(Base):
     description = Column(String(255), nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # trigger ile
 
 
 # Default material multipliers
@@ -337,7 +515,7 @@ class Notification(Base):
     __tablename__ = "notifications"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)  # "ADMIN" for admin notifications
+    wallet_address = Column(WalletAddress, nullable=False, index=True)  # "ADMIN" for admin notifications
     notification_type = Column(String(50), nullable=False)  # declaration_rejected, fraud_marked, etc.
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
@@ -358,12 +536,12 @@ class FraudAppeal(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     declaration_id = Column(Integer, nullable=False, index=True)  # ilgili beyan
-    citizen_wallet = Column(String(42), nullable=False, index=True)  # vatandaş
-    staff_wallet = Column(String(42), nullable=False)  # fraud işareti koyan personel
+    citizen_wallet = Column(WalletAddress, nullable=False, index=True)  # vatandaş
+    staff_wallet = Column(WalletAddress, nullable=False)  # fraud işareti koyan personel
     reason = Column(Text, nullable=True)  # fraud sebebi
     status = Column(String(20), default="pending", index=True)  # pending, approved, rejected
     admin_decision = Column(Text, nullable=True)  # yönetici kararı
-    admin_wallet = Column(String(42), nullable=True)  # karar veren yönetici
+    admin_wallet = Column(WalletAddress, nullable=True)  # karar veren yönetici
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     resolved_at = Column(DateTime(timezone=True), nullable=True)
     
@@ -390,7 +568,7 @@ class AnomalySignal(Base):
     __tablename__ = "anomaly_signals"
     
     id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    wallet_address = Column(WalletAddress, nullable=False, index=True)
     
     # Sinyal bilgileri
     signal_type = Column(String(50), nullable=False)  # consumption_drop, index_decreased, photo_metadata_suspicious
@@ -401,7 +579,7 @@ class AnomalySignal(Base):
     status = Column(String(30), default="pending_review", index=True)  # pending_review, reviewed_ok, reviewed_fraud, dismissed
     
     # Review bilgileri
-    reviewed_by = Column(String(42), nullable=True)  # Personel veya admin wallet
+    reviewed_by = Column(WalletAddress, nullable=True)  # Personel veya admin wallet
     review_notes = Column(Text, nullable=True)
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
     
@@ -414,7 +592,7 @@ class AnomalySignal(Base):
     related_declaration_id = Column(Integer, nullable=True)  # İlgili recycling declaration ID
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue())  # trigger ile
     
     __table_args__ = (
         Index('idx_anomaly_signal_wallet', 'wallet_address'),
@@ -422,3 +600,85 @@ class AnomalySignal(Base):
         Index('idx_anomaly_signal_type', 'signal_type'),
         Index('idx_anomaly_signal_created', 'created_at'),
     )
+
+
+# ==============================
+# UPDATED_AT TRIGGERS
+# ==============================
+
+TOUCH_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def updated_at_trigger_ddl(table_name, dialect_name):
+    """
+    updated_at kolonunu UPDATE sırasında sunucu tarafında güncelleyen
+    trigger DDL'leri (dialect'e göre). Model'lerde onupdate yerine
+    server_onupdate=FetchedValue() kullanılır.
+    """
+    trigger = f"trg_{table_name}_updated_at"
+    if dialect_name == "postgresql":
+        return [
+            TOUCH_UPDATED_AT_FUNCTION,
+            f"DROP TRIGGER IF EXISTS {trigger} ON {table_name}",
+            f"CREATE TRIGGER {trigger} BEFORE UPDATE ON {table_name} "
+            f"FOR EACH ROW EXECUTE FUNCTION touch_updated_at()",
+        ]
+    if dialect_name == "mysql":
+        return [
+            f"DROP TRIGGER IF EXISTS {trigger}",
+            f"CREATE TRIGGER {trigger} BEFORE UPDATE ON {table_name} "
+            f"FOR EACH ROW SET NEW.updated_at = CURRENT_TIMESTAMP",
+        ]
+    if dialect_name == "sqlite":
+        return [
+            f"DROP TRIGGER IF EXISTS {trigger}",
+            f"CREATE TRIGGER {trigger} AFTER UPDATE ON {table_name} "
+            f"FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at "
+            f"BEGIN UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END",
+        ]
+    return []
+
+
+def _install_updated_at_trigger(target, connection, **kw):
+    for statement in updated_at_trigger_ddl(target.name, connection.dialect.name):
+        connection.exec_driver_sql(statement)
+
+
+for _table in Base.metadata.tables.values():
+    if "updated_at" in _table.c:
+        event.listen(_table, "after_create", _install_updated_at_trigger)
+
+
+# ==============================
+# HOT UPDATE FILLFACTOR (Postgres)
+# ==============================
+# Sık UPDATE alan tablolarda sayfada boşluk bırakılır; böylece
+# updated_at/durum güncellemeleri HOT update olur, index'lere dokunmaz.
+HOT_UPDATE_FILLFACTOR = 80
+HOT_UPDATE_TABLES = ("users", "fraud_reports", "user_deposits", "recycling_submissions")
+
+
+def fillfactor_ddl(table_name, dialect_name):
+    """Tabloya fillfactor ayarını uygulayan DDL (sadece Postgres)"""
+    if dialect_name != "postgresql":
+        return []
+    # Partitioned parent tabloda storage parametresi olmaz; partition'lara verilir
+    if PARTITION_TIME_SERIES and table_name == "fraud_reports":
+        return []
+    return [f"ALTER TABLE {table_name} SET (fillfactor = {HOT_UPDATE_FILLFACTOR})"]
+
+
+def _apply_fillfactor(target, connection, **kw):
+    for statement in fillfactor_ddl(target.name, connection.dialect.name):
+        connection.exec_driver_sql(statement)
+
+
+for _name in HOT_UPDATE_TABLES:
+    event.listen(Base.metadata.tables[_name], "after_create", _apply_fillfactor)
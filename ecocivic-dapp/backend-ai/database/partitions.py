@@ -0,0 +1,49 @@
+"""
+Time-series Partition Maintenance
+water_meter_readings / fraud_reports için aylık Postgres partition'ları
+
+Sadece PARTITION_TIME_SERIES açıkken (Postgres) çalışır; diğer
+durumlarda hiçbir şey yapmaz.
+"""
+from datetime import datetime
+from config import PARTITION_TIME_SERIES
+from database.models import HOT_UPDATE_FILLFACTOR, HOT_UPDATE_TABLES
+
+PARTITIONED_TABLES = ("water_meter_readings", "fraud_reports")
+
+
+def _add_months(year, month, delta):
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def ensure_monthly_partitions(engine, months_back=12, months_ahead=3, now=None):
+    """
+    Geçmiş months_back ve gelecek months_ahead ay için eksik partition'ları
+    oluştur. Aralık dışına düşen kayıtlar için DEFAULT partition da açılır.
+
+    Returns:
+        Oluşturulması istenen partition tablo adları
+    """
+    if not PARTITION_TIME_SERIES or engine.dialect.name != "postgresql":
+        return []
+
+    now = now or datetime.utcnow()
+    created = []
+    with engine.begin() as conn:
+        for table in PARTITIONED_TABLES:
+            storage = f" WITH (fillfactor = {HOT_UPDATE_FILLFACTOR})" if table in HOT_UPDATE_TABLES else ""
+            for delta in range(-months_back, months_ahead + 1):
+                year, month = _add_months(now.year, now.month, delta)
+                next_year, next_month = _add_months(year, month, 1)
+                name = f"{table}_{year:04d}_{month:02d}"
+                conn.exec_driver_sql(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{year:04d}-{month:02d}-01') "
+                    f"TO ('{next_year:04d}-{next_month:02d}-01'){storage}"
+                )
+                created.append(name)
+            conn.exec_driver_sql(
+                f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT{storage}"
+            )
+    return created
@@ -10,12 +10,21 @@ Kullanim:
     
     python database/seed_data.py
 """
+import os
 import sys
 import io
 # Windows encoding fix
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate
+from types import SimpleNamespace
+from sqlalchemy import text, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from config import PARTITION_TIME_SERIES
 from database.db import get_db, init_db
 from database.models import (
     User, UserRole,
@@ -31,39 +40,242 @@ from database.models import (
     DEFAULT_MATERIAL_MULTIPLIERS
 )
 import hashlib
-import uuid
+import secrets
+
+_sha256 = hashlib.sha256
+_blake2b = hashlib.blake2b
 
 
 # ==============================
 # TEST WALLET ADDRESSES
 # ==============================
 # Her rol icin benzersiz test wallet adresleri
+# (gecerli 20 byte hex olmali - Postgres'te BYTEA olarak saklanir)
 WALLETS = {
-    "citizen_1": "0xCitizen00100000000000000000000000000001",
-    "citizen_2": "0xCitizen00200000000000000000000000000002",
-    "citizen_fraud": "0xCitizenFraud0000000000000000000000003",
-    "staff": "0xStaff00100000000000000000000000000000001",
-    "operator": "0xOperator001000000000000000000000000001",
-    "admin": "0xAdmin00100000000000000000000000000000001",
-    "oracle": "0xOracle0010000000000000000000000000000001",
-    "inspector": "0xInspector01000000000000000000000000001",
+    "citizen_1": "0xc100000000000000000000000000000000000001",
+    "citizen_2": "0xc200000000000000000000000000000000000002",
+    "citizen_fraud": "0xcf00000000000000000000000000000000000003",
+    "staff": "0x5f00000000000000000000000000000000000001",
+    "operator": "0x0b00000000000000000000000000000000000001",
+    "admin": "0xad00000000000000000000000000000000000001",
+    "oracle": "0x0c00000000000000000000000000000000000001",
+    "inspector": "0x1e00000000000000000000000000000000000001",
 }
 
+# Seed fonksiyonlarinda attribute erisimi icin: W.citizen_1
+W = SimpleNamespace(**WALLETS)
+
+# Seed ciktisinda kullanilan (rol, wallet) ciftleri
+WALLET_ITEMS = tuple(WALLETS.items())
+
+# Materyal carpani satirlari - her seed cagrisinda yeniden kurulmaz
+_MATERIAL_INSERT_ROWS = tuple(
+    {
+        "material_type": material,
+        "multiplier": data["multiplier"],
+        "base_token_rate": data["base_rate"],
+        "description": data["description"],
+        "is_active": True,
+    }
+    for material, data in DEFAULT_MATERIAL_MULTIPLIERS.items()
+)
+
+# Seed faturalarinda kullanilan m3 birim fiyati (TL)
+WATER_UNIT_PRICE = 5.5
+
+# Sabit sahte zincir degerleri (depozito kayitlari)
+NULL_TOKEN = "0x" + "0" * 40
+FAKE_TX_B = "0x" + "b" * 64
+FAKE_TX_C = "0x" + "c" * 64
+FAKE_TX_D = "0x" + "d" * 64
+
+
+def _meter_columns(start_index, consumptions):
+    """
+    Tuketim serisinden okuma kolonlarini tek seferde uret.
+    Her ay icin (tuketim, onceki endeks, yeni endeks, fatura) dondurur.
+    """
+    indexes = list(accumulate(consumptions, initial=start_index))
+    return list(zip(
+        map(float, consumptions),
+        indexes[:-1],
+        indexes[1:],
+        [c * WATER_UNIT_PRICE for c in consumptions],
+    ))
+
+
+def _photo_hashes(prefix, count):
+    """prefix + sira no (bytes) icin SHA-256 hex listesi - dongu disinda bir kerede"""
+    return [_sha256(b"%s%d" % (prefix, i)).hexdigest() for i in range(count)]
+
+
+def _tx_hashes(prefix, tokens):
+    """
+    Her (sira no, QR token) icin deterministik sahte tx hash - dongu disinda bir kerede.
+    Girdi bytes olarak kurulur: prefix bytes, token ham 16 byte (encode yok).
+    """
+    return [
+        "0x" + _sha256(b"%s_%d_%s" % (prefix, i, raw)).hexdigest()
+        for i, (_, _, raw) in enumerate(tokens)
+    ]
+
+
+def _new_qr_tokens(count):
+    """
+    count adet QR token id'si ve hash'i uret: [(token_id, qr_hash, raw), ...]
+    Tek bir rastgele buffer alinip 16 byte'lik parcalara bolunur; token id
+    parcanin hex'i, hash ise str'e cevirmeden ham byte'lar uzerinden alinir
+    (uuid nesnesi, str formatlama ve encode adimi yok).
+    """
+    buf = secrets.token_bytes(16 * count)
+    chunks = [buf[i:i + 16] for i in range(0, 16 * count, 16)]
+    # Seed hash'i sadece unique anahtar; kriptografik olmasi gerekmiyor
+    return [(chunk.hex(), _blake2b(chunk, digest_size=32).hexdigest(), chunk) for chunk in chunks]
+
+
+def _execute_rows(db, stmt, rows):
+    """
+    Core executemany; ayni kolon setine sahip satirlar tek seferde yazilir.
+    (Core INSERT kolonlari ilk satirdan alir, eksik anahtarlar kolon
+    default'una kalsin diye farkli setler ayri gonderilir.)
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(row), []).append(row)
+    for group in groups.values():
+        db.execute(stmt, group)
+
+
+def _insert_rows(db, model, rows):
+    """
+    Satirlari ORM nesnesi kurmadan Core INSERT ile ekle.
+    (bulk_save_objects(..., return_defaults=False) da executemany yapar ama
+    once her satir icin nesne kurar; dict satirlarla Core INSERT daha ucuz.)
+    """
+    _execute_rows(db, insert(model.__table__), rows)
+
+
+def _insert_ignore_stmt(db, model, conflict_column):
+    """Unique kolonda cakisan satirlari atlayan dialect'e uygun INSERT"""
+    table = model.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return pg_insert(table).on_conflict_do_nothing(index_elements=[conflict_column])
+    if dialect == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing(index_elements=[conflict_column])
+    if dialect == "mysql":
+        return insert(table).prefix_with("IGNORE")
+    return insert(table)
+
+
+def _insert_ignore(db, model, rows, conflict_column):
+    """
+    Satirlari tek INSERT ile ekle, unique kolonda cakisanlari atla.
+    Onceden SELECT ile varlik kontrolu yapmaya gerek kalmaz.
+    """
+    _execute_rows(db, _insert_ignore_stmt(db, model, conflict_column), rows)
+
+
+def _user_ids(db):
+    """
+    Seed edilen kullanicilarin wallet -> users.id eslemesi.
+    seed_users RETURNING ile doldurduysa session'dan okunur, yoksa tek sorgu.
+    """
+    ids = db.info.get("seed_user_ids")
+    if ids is None:
+        ids = db.info["seed_user_ids"] = dict(db.query(User.wallet_address, User.id).all())
+    return ids
+
+
+# Seed sirasinda WAL'a yazilmadan doldurulacak tablolar (SEED_UNLOGGED=1, Postgres)
+# Diger tablolardan referans almayan "yaprak" tablolar secildi
+UNLOGGED_SEED_TABLES = (
+    "water_meter_readings",
+    "recycling_submissions",
+    "recycling_declarations",
+    "fraud_reports",
+)
+
+
+@contextmanager
+def unlogged_tables(db):
+    """Seed suresince tablolari UNLOGGED yap, bitince tekrar LOGGED'a cevir"""
+    if db.get_bind().dialect.name != "postgresql" or os.getenv("SEED_UNLOGGED") != "1":
+        yield
+        return
+    
+    # Partitioned parent tablolar UNLOGGED yapilamaz
+    partitioned = {"water_meter_readings", "fraud_reports"} if PARTITION_TIME_SERIES else set()
+    tables = [t for t in UNLOGGED_SEED_TABLES if t not in partitioned]
+    
+    print("[DB] Seed tablolari UNLOGGED moda aliniyor...")
+    for table in tables:
+        db.execute(text(f"ALTER TABLE {table} SET UNLOGGED"))
+    db.commit()
+    try:
+        yield
+    finally:
+        for table in tables:
+            db.execute(text(f"ALTER TABLE {table} SET LOGGED"))
+        db.commit()
+        print("[DB] Seed tablolari tekrar LOGGED")
+
+
+# SEED_FAST=1 iken SQLite seed baglantisinda kullanilan PRAGMA'lar
+# (seed verisi atilabilir; commit basina fsync beklemeye gerek yok)
+SEED_FAST_PRAGMAS = {
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "temp_store": "MEMORY",
+}
+
+
+@contextmanager
+def sqlite_fast_pragmas(db):
+    """Seed suresince SQLite dayaniklilik ayarlarini gevset, bitince geri al"""
+    if db.get_bind().dialect.name != "sqlite" or os.getenv("SEED_FAST") != "1":
+        yield
+        return
+    
+    # PRAGMA'lar baglanti bazli: commit sonrasi session baglantiyi havuza
+    # birakabilecegi icin geri alma ayni DBAPI baglantisi uzerinden yapilir
+    raw = db.connection().connection.dbapi_connection
+    previous = {name: raw.execute(f"PRAGMA {name}").fetchone()[0] for name in SEED_FAST_PRAGMAS}
+    for name, value in SEED_FAST_PRAGMAS.items():
+        raw.execute(f"PRAGMA {name}={value}")
+    print("[DB] SQLite hizli seed modu (synchronous=OFF, journal_mode=MEMORY)")
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            raw.execute(f"PRAGMA {name}={value}")
+
+
+# Seed'in temizledigi tablolar (FK sirasina gore: once bagimli tablolar)
+SEED_TABLES = (
+    FraudReport,
+    InspectionSchedule,
+    FraudRecord,
+    PenaltyRecord,
+    UserDeposit,
+    RecyclingDeclaration,
+    RecyclingSubmission,
+    WaterMeterReading,
+    MaterialMultiplier,
+    User,
+)
+
 
 def clear_all_data(db):
     """Mevcut tum verileri sil"""
     print("[DELETE] Mevcut veriler temizleniyor...")
-    db.query(FraudReport).delete()
-    db.query(InspectionSchedule).delete()
-    db.query(FraudRecord).delete()
-    db.query(PenaltyRecord).delete()
-    db.query(UserDeposit).delete()
-    db.query(RecyclingDeclaration).delete()
-    db.query(RecyclingSubmission).delete()
-    db.query(WaterMeterReading).delete()
-    db.query(MaterialMultiplier).delete()
-    db.query(User).delete()
-    db.commit()
+    names = [model.__tablename__ for model in SEED_TABLES]
+    if db.get_bind().dialect.name == "postgresql":
+        # Satir taramadan, tek komutta; id sayaclari da sifirlanir
+        db.execute(text(f"TRUNCATE TABLE {', '.join(names)} RESTART IDENTITY CASCADE"))
+    else:
+        for name in names:
+            db.execute(text(f"DELETE FROM {name}"))
     print("[OK] Veriler temizlendi")
 
 
@@ -73,63 +285,63 @@ def seed_users(db):
     
     users = [
         # Normal vatandaslar
-        User(
-            wallet_address=WALLETS["citizen_1"],
+        dict(
+            wallet_address=W.citizen_1,
             role=UserRole.CITIZEN,
             name="Ahmet Yilmaz",
             email="ahmet@test.com",
             is_active=True
         ),
-        User(
-            wallet_address=WALLETS["citizen_2"],
+        dict(
+            wallet_address=W.citizen_2,
             role=UserRole.CITIZEN,
             name="Ayse Demir",
             email="ayse@test.com",
             is_active=True
         ),
         # Fraud suphelisi vatandas
-        User(
-            wallet_address=WALLETS["citizen_fraud"],
+        dict(
+            wallet_address=W.citizen_fraud,
             role=UserRole.CITIZEN,
             name="Mehmet Supheli",
             email="mehmet@test.com",
             is_active=True
         ),
         # Belediye personeli (fiziksel kontrol)
-        User(
-            wallet_address=WALLETS["staff"],
+        dict(
+            wallet_address=W.staff,
             role=UserRole.MUNICIPALITY_STAFF,
             name="Fatma Kontrol",
             email="fatma@belediye.gov.tr",
             is_active=True
         ),
         # Service operator (AI dogrulama)
-        User(
-            wallet_address=WALLETS["operator"],
+        dict(
+            wallet_address=W.operator,
             role=UserRole.SERVICE_OPERATOR,
             name="AI Operator",
             email="operator@ecocivic.com",
             is_active=True
         ),
         # Admin
-        User(
-            wallet_address=WALLETS["admin"],
+        dict(
+            wallet_address=W.admin,
             role=UserRole.MUNICIPALITY_ADMIN,
             name="Yonetici Admin",
             email="admin@belediye.gov.tr",
             is_active=True
         ),
         # Oracle
-        User(
-            wallet_address=WALLETS["oracle"],
+        dict(
+            wallet_address=W.oracle,
             role=UserRole.ORACLE,
             name="Data Oracle",
             email="oracle@ecocivic.com",
             is_active=True
         ),
         # Inspector (staff rolunde ama fiziksel kontrol icin)
-        User(
-            wallet_address=WALLETS["inspector"],
+        dict(
+            wallet_address=W.inspector,
             role=UserRole.MUNICIPALITY_STAFF,
             name="Ali Mufettis",
             email="ali@belediye.gov.tr",
@@ -137,22 +349,36 @@ def seed_users(db):
         ),
     ]
     
-    for user in users:
-        db.add(user)
-    
-    db.commit()
+    if db.get_bind().dialect.insert_executemany_returning:
+        # id'ler INSERT ile ayni round trip'te doner; sonradan SELECT gerekmez
+        table = User.__table__
+        stmt = _insert_ignore_stmt(db, User, "wallet_address").returning(table.c.wallet_address, table.c.id)
+        ids = dict(db.execute(stmt, users).all())
+        # Cakisip atlanan satir varsa eksik kalir; o durumda _user_ids sorgular
+        if len(ids) == len(users):
+            db.info["seed_user_ids"] = ids
+    else:
+        _insert_ignore(db, User, users, "wallet_address")
     print(f"[OK] {len(users)} kullanici olusturuldu")
     
-    for user in users:
-        print(f"   - [{user.role.value}] {user.name}: {user.wallet_address}")
+    # Satir satir print yerine tek yazim
+    sys.stdout.write("".join(
+        f"   - [{user['role'].value}] {user['name']}: {user['wallet_address']}\n" for user in users
+    ))
 
 
 def seed_water_meter_readings(db):
     """Su sayaci okumalarini olustur - 5 aylik veriler"""
     print("\n[WATER] Su sayaci okumalari olusturuluyor (5 aylik)...")
     
+    wallet_c1, wallet_c2, wallet_fraud, wallet_admin, wallet_operator = (
+        W.citizen_1, W.citizen_2, W.citizen_fraud, W.admin, W.operator
+    )
     now = datetime.now()
+    operator_id = _user_ids(db)[wallet_operator]
     readings = []
+    # Her sayac icin ayni 5 aylik okuma tarihleri
+    monthly = [now - timedelta(days=30 * (5 - i)) for i in range(5)]
     
     # ==============================
     # Citizen 1 - Normal tuketim gecmisi (5 ay)
@@ -160,27 +386,25 @@ def seed_water_meter_readings(db):
     # ==============================
     meter_no_1 = "WSM-2024-001"
     citizen1_consumptions = [15, 17, 16, 18, 19]  # Normal, tutarli
-    prev_index = 1000
-    for i, consumption in enumerate(citizen1_consumptions):
-        new_index = prev_index + consumption
-        photo_hash = hashlib.sha256(f"photo_citizen1_{i}".encode()).hexdigest()
-        readings.append(WaterMeterReading(
+    photo_hashes = _photo_hashes(b"photo_citizen1_", len(citizen1_consumptions))
+    for i, ((consumption, prev_index, new_index, bill), photo_hash) in enumerate(
+            zip(_meter_columns(1000, citizen1_consumptions), photo_hashes)):
+        readings.append(dict(
             meter_no=meter_no_1,
-            wallet_address=WALLETS["citizen_1"],
+            wallet_address=wallet_c1,
             reading_index=new_index,
             previous_index=prev_index,
-            consumption_m3=float(consumption),
-            bill_amount=float(consumption * 5.5),
+            consumption_milli_m3=round(consumption * 1000),
+            bill_amount_kurus=round(bill * 100),
             reward_amount=10 if consumption < 20 else 0,
             photo_hash=photo_hash,
             is_valid=True,
             anomaly_detected=False,
             user_confirmed_low_consumption=False,
             admin_approval_status="approved",
-            validated_by=WALLETS["operator"],
-            created_at=now - timedelta(days=30 * (5 - i))
+            validated_by_id=operator_id,
+            created_at=monthly[i]
         ))
-        prev_index = new_index
     
     # ==============================
     # Citizen 2 - %50+ dusus senaryosu (5 ay)
@@ -188,33 +412,30 @@ def seed_water_meter_readings(db):
     # ==============================
     meter_no_2 = "WSM-2024-002"
     citizen2_consumptions = [20, 22, 21, 8, 9]  # 4. ayda %60 dusus!
-    prev_index = 2000
-    for i, consumption in enumerate(citizen2_consumptions):
-        new_index = prev_index + consumption
-        photo_hash = hashlib.sha256(f"photo_citizen2_{i}".encode()).hexdigest()
-        
+    photo_hashes = _photo_hashes(b"photo_citizen2_", len(citizen2_consumptions))
+    for i, ((consumption, prev_index, new_index, bill), photo_hash) in enumerate(
+            zip(_meter_columns(2000, citizen2_consumptions), photo_hashes)):
         # 4. ve 5. ay icin anomali ve onay gerektiren durumlar
         is_anomaly = i >= 3  # 4. ve 5. ay
         user_confirmed = i == 3  # Kullanici 4. ayda onayladi
         admin_status = "pending" if i == 4 else "approved"
         
-        readings.append(WaterMeterReading(
+        readings.append(dict(
             meter_no=meter_no_2,
-            wallet_address=WALLETS["citizen_2"],
+            wallet_address=wallet_c2,
             reading_index=new_index,
             previous_index=prev_index,
-            consumption_m3=float(consumption),
-            bill_amount=float(consumption * 5.5),
+            consumption_milli_m3=round(consumption * 1000),
+            bill_amount_kurus=round(bill * 100),
             reward_amount=10 if not is_anomaly else 0,
             photo_hash=photo_hash,
             is_valid=True,
             anomaly_detected=is_anomaly,
             user_confirmed_low_consumption=user_confirmed,
             admin_approval_status=admin_status,
-            validated_by=WALLETS["operator"] if not is_anomaly else None,
-            created_at=now - timedelta(days=30 * (5 - i))
+            validated_by_id=operator_id if not is_anomaly else None,
+            created_at=monthly[i]
         ))
-        prev_index = new_index
     
     # ==============================
     # Citizen Fraud - Fraud senaryosu (5 ay)
@@ -222,38 +443,33 @@ def seed_water_meter_readings(db):
     # ==============================
     meter_no_fraud = "WSM-2024-003"
     fraud_consumptions = [25, 24, 5, 3, 2]  # 3. aydan itibaren kusku verici dusus
-    prev_index = 3000
-    for i, consumption in enumerate(fraud_consumptions):
-        new_index = prev_index + consumption
-        photo_hash = hashlib.sha256(f"photo_fraud_{i}".encode()).hexdigest()
+    photo_hashes = _photo_hashes(b"photo_fraud_", len(fraud_consumptions))
+    for i, ((consumption, prev_index, new_index, bill), photo_hash) in enumerate(
+            zip(_meter_columns(3000, fraud_consumptions), photo_hashes)):
         
         is_anomaly = i >= 2  # 3. aydan itibaren anomali
         is_fraud = i >= 3  # 4. aydan itibaren fraud
         admin_status = "fraud" if is_fraud else ("pending" if is_anomaly else "approved")
         
-        readings.append(WaterMeterReading(
+        readings.append(dict(
             meter_no=meter_no_fraud,
-            wallet_address=WALLETS["citizen_fraud"],
+            wallet_address=wallet_fraud,
             reading_index=new_index,
             previous_index=prev_index,
-            consumption_m3=float(consumption),
-            bill_amount=float(consumption * 5.5),
+            consumption_milli_m3=round(consumption * 1000),
+            bill_amount_kurus=round(bill * 100),
             reward_amount=0,
             photo_hash=photo_hash,
             is_valid=not is_fraud,
             anomaly_detected=is_anomaly,
             user_confirmed_low_consumption=is_anomaly,
             admin_approval_status=admin_status,
-            admin_approved_by=WALLETS["admin"] if is_fraud else None,
-            validated_by=WALLETS["operator"] if i < 2 else None,
-            created_at=now - timedelta(days=30 * (5 - i))
+            admin_approved_by=wallet_admin if is_fraud else None,
+            validated_by_id=operator_id if i < 2 else None,
+            created_at=monthly[i]
         ))
-        prev_index = new_index
-    
-    for reading in readings:
-        db.add(reading)
     
-    db.commit()
+    _insert_rows(db, WaterMeterReading, readings)
     print(f"[OK] {len(readings)} su sayaci okumasi olusturuldu")
 
 
@@ -261,74 +477,77 @@ def seed_recycling_submissions(db):
     """Geri donusum kayitlarini olustur - 3 farkli zamanda"""
     print("\n[RECYCLE] Geri donusum kayitlari olusturuluyor (3 farkli zaman)...")
     
+    TD = timedelta
+    wallet_c1, wallet_c2, wallet_fraud, wallet_admin, wallet_staff, wallet_operator = (
+        W.citizen_1, W.citizen_2, W.citizen_fraud, W.admin, W.staff, W.operator
+    )
     now = datetime.now()
+    one_hour, two_hours, one_day = TD(hours=1), TD(hours=2), TD(days=1)
+    operator_id = _user_ids(db)[wallet_operator]
     submissions = []
     
     # ==============================
     # Citizen 1 - Normal beyanlari (3 farkli zaman)
     # Senaryo: Tutarli, onaylanmis beyanlar
+    # (reward: kg * 10, elektronik adet * 25 - fixture'da hazir)
     # ==============================
     citizen1_submissions = [
-        {"material": "glass", "amount": 5.0, "days_ago": 60, "status": "approved"},
-        {"material": "plastic", "amount": 3.0, "days_ago": 30, "status": "approved"},
-        {"material": "metal", "amount": 2.0, "days_ago": 7, "status": "approved"},
+        {"material": "glass", "amount": 5.0, "reward": 50, "days_ago": 60, "status": "approved"},
+        {"material": "plastic", "amount": 3.0, "reward": 30, "days_ago": 30, "status": "approved"},
+        {"material": "metal", "amount": 2.0, "reward": 20, "days_ago": 7, "status": "approved"},
     ]
     
-    for i, sub in enumerate(citizen1_submissions):
-        token_id = str(uuid.uuid4())
-        qr_hash = hashlib.sha256(token_id.encode()).hexdigest()
-        tx_hash = "0x" + hashlib.sha256(f"tx_c1_{i}_{token_id}".encode()).hexdigest()
+    tokens = _new_qr_tokens(len(citizen1_submissions))
+    tx_hashes = _tx_hashes(b"tx_c1", tokens)
+    for sub, (token_id, qr_hash, _), tx_hash in zip(citizen1_submissions, tokens, tx_hashes):
+        created = now - TD(days=sub["days_ago"])
         
-        submissions.append(RecyclingSubmission(
-            wallet_address=WALLETS["citizen_1"],
+        submissions.append(dict(
+            wallet_address=wallet_c1,
             material_type=sub["material"],
-            amount_kg=sub["amount"],
+            amount_g=round(sub["amount"] * 1000),
             qr_token_id=token_id,
             qr_hash=qr_hash,
-            reward_amount=int(sub["amount"] * 10),
+            reward_amount=sub["reward"],
             transaction_hash=tx_hash,
             is_processed=True,
             admin_approval_status=sub["status"],
-            admin_approved_by=WALLETS["staff"],
+            admin_approved_by=wallet_staff,
             is_fraud=False,
-            validated_by=WALLETS["operator"],
-            created_at=now - timedelta(days=sub["days_ago"]),
-            processed_at=now - timedelta(days=sub["days_ago"] - 1)
+            validated_by_id=operator_id,
+            created_at=created,
+            processed_at=created + one_day
         ))
     
     # ==============================
     # Citizen 2 - Karisik beyanlar (1 onaylandi, 1 bekliyor, 1 suresi doldu)
     # ==============================
     citizen2_submissions = [
-        {"material": "paper", "amount": 10.0, "days_ago": 45, "status": "approved"},
-        {"material": "glass", "amount": 4.0, "hours_ago": 2, "status": "pending"},  # Bekleyen
-        {"material": "electronic", "amount": 1, "hours_ago": 5, "status": "pending"},  # QR suresi yaklasik dolacak
+        {"material": "paper", "amount": 10.0, "reward": 100, "days_ago": 45, "status": "approved"},
+        {"material": "glass", "amount": 4.0, "reward": 40, "hours_ago": 2, "status": "pending"},  # Bekleyen
+        {"material": "electronic", "amount": 1, "reward": 25, "hours_ago": 5, "status": "pending"},  # QR suresi yaklasik dolacak
     ]
     
-    for i, sub in enumerate(citizen2_submissions):
-        token_id = str(uuid.uuid4())
-        qr_hash = hashlib.sha256(token_id.encode()).hexdigest()
-        tx_hash = "0x" + hashlib.sha256(f"tx_c2_{i}_{token_id}".encode()).hexdigest() if sub["status"] == "approved" else None
-        
-        days_ago = sub.get("days_ago", 0)
-        hours_ago = sub.get("hours_ago", 0)
-        created = now - timedelta(days=days_ago, hours=hours_ago)
+    tokens = _new_qr_tokens(len(citizen2_submissions))
+    tx_hashes = _tx_hashes(b"tx_c2", tokens)
+    for sub, (token_id, qr_hash, _), tx_hash in zip(citizen2_submissions, tokens, tx_hashes):
+        created = now - TD(days=sub.get("days_ago", 0), hours=sub.get("hours_ago", 0))
         
-        submissions.append(RecyclingSubmission(
-            wallet_address=WALLETS["citizen_2"],
+        submissions.append(dict(
+            wallet_address=wallet_c2,
             material_type=sub["material"],
-            amount_kg=float(sub["amount"]),
+            amount_g=round(sub["amount"] * 1000),
             qr_token_id=token_id,
             qr_hash=qr_hash,
-            reward_amount=int(sub["amount"] * 10) if sub["material"] != "electronic" else int(sub["amount"] * 25),
-            transaction_hash=tx_hash,
+            reward_amount=sub["reward"],
+            transaction_hash=tx_hash if sub["status"] == "approved" else None,
             is_processed=(sub["status"] == "approved"),
             admin_approval_status=sub["status"],
-            admin_approved_by=WALLETS["staff"] if sub["status"] == "approved" else None,
+            admin_approved_by=wallet_staff if sub["status"] == "approved" else None,
             is_fraud=False,
-            validated_by=WALLETS["operator"] if sub["status"] == "approved" else None,
+            validated_by_id=operator_id if sub["status"] == "approved" else None,
             created_at=created,
-            processed_at=created + timedelta(hours=1) if sub["status"] == "approved" else None
+            processed_at=created + one_hour if sub["status"] == "approved" else None
         ))
     
     # ==============================
@@ -341,36 +560,30 @@ def seed_recycling_submissions(db):
         {"material": "plastic", "amount": 5.0, "hours_ago": 1, "status": "pending"},  # Yeni beyan, henuz kontrol edilmedi
     ]
     
-    for i, sub in enumerate(fraud_submissions):
-        token_id = str(uuid.uuid4())
-        qr_hash = hashlib.sha256(token_id.encode()).hexdigest()
+    tokens = _new_qr_tokens(len(fraud_submissions))
+    for sub, (token_id, qr_hash, _) in zip(fraud_submissions, tokens):
         
-        days_ago = sub.get("days_ago", 0)
-        hours_ago = sub.get("hours_ago", 0)
-        created = now - timedelta(days=days_ago, hours=hours_ago)
+        created = now - TD(days=sub.get("days_ago", 0), hours=sub.get("hours_ago", 0))
         
-        submissions.append(RecyclingSubmission(
-            wallet_address=WALLETS["citizen_fraud"],
+        submissions.append(dict(
+            wallet_address=wallet_fraud,
             material_type=sub["material"],
-            amount_kg=float(sub["amount"]),
+            amount_g=round(sub["amount"] * 1000),
             qr_token_id=token_id,
             qr_hash=qr_hash,
             reward_amount=0,  # Fraud oldugu icin odul yok
             transaction_hash=None,
             is_processed=(sub["status"] == "fraud"),
             admin_approval_status=sub["status"],
-            admin_approved_by=WALLETS["admin"] if sub["status"] == "fraud" else None,
+            admin_approved_by=wallet_admin if sub["status"] == "fraud" else None,
             is_fraud=(sub["status"] == "fraud"),
             fraud_reason=sub.get("reason"),
-            validated_by=None,
+            validated_by_id=None,
             created_at=created,
-            processed_at=created + timedelta(hours=2) if sub["status"] == "fraud" else None
+            processed_at=created + two_hours if sub["status"] == "fraud" else None
         ))
     
-    for submission in submissions:
-        db.add(submission)
-    
-    db.commit()
+    _insert_ignore(db, RecyclingSubmission, submissions, "qr_token_id")
     print(f"[OK] {len(submissions)} geri donusum kaydi olusturuldu")
 
 
@@ -380,28 +593,28 @@ def seed_recycling_declarations(db):
     
     now = datetime.now()
     declarations = []
+    (token_id_1, qr_hash_1, raw_1), (token_id_2, qr_hash_2, _), (token_id_3, qr_hash_3, _) = _new_qr_tokens(3)
     
     # ==============================
     # Citizen 1 - Tam beyan (tum turler)
     # ==============================
-    token_id_1 = str(uuid.uuid4())
-    declarations.append(RecyclingDeclaration(
-        wallet_address=WALLETS["citizen_1"],
+    declarations.append(dict(
+        wallet_address=W.citizen_1,
         plastic_kg=2.5,
         glass_kg=3.0,
         metal_kg=1.5,
         paper_kg=4.0,
         electronic_count=0,
         qr_token_id=token_id_1,
-        qr_hash=hashlib.sha256(token_id_1.encode()).hexdigest(),
+        qr_hash=qr_hash_1,
         qr_expires_at=now - timedelta(days=5),  # Kullanilmis
         is_qr_expired=True,
         is_qr_used=True,
         total_reward_amount=110,
         admin_approval_status="approved",
-        admin_approved_by=WALLETS["staff"],
+        admin_approved_by=W.staff,
         is_fraud=False,
-        transaction_hash="0x" + hashlib.sha256(f"decl_{token_id_1}".encode()).hexdigest(),
+        transaction_hash="0x" + _sha256(b"decl_" + raw_1).hexdigest(),
         created_at=now - timedelta(days=5),
         processed_at=now - timedelta(days=5, hours=-1)
     ))
@@ -409,16 +622,15 @@ def seed_recycling_declarations(db):
     # ==============================
     # Citizen 2 - Aktif QR (3 saat icinde kullanilmali)
     # ==============================
-    token_id_2 = str(uuid.uuid4())
-    declarations.append(RecyclingDeclaration(
-        wallet_address=WALLETS["citizen_2"],
+    declarations.append(dict(
+        wallet_address=W.citizen_2,
         plastic_kg=0,
         glass_kg=5.0,
         metal_kg=2.0,
         paper_kg=0,
         electronic_count=1,
         qr_token_id=token_id_2,
-        qr_hash=hashlib.sha256(token_id_2.encode()).hexdigest(),
+        qr_hash=qr_hash_2,
         qr_expires_at=now + timedelta(hours=2),  # 2 saat kaldi
         is_qr_expired=False,
         is_qr_used=False,
@@ -431,32 +643,28 @@ def seed_recycling_declarations(db):
     # ==============================
     # Citizen Fraud - Fraud beyan
     # ==============================
-    token_id_3 = str(uuid.uuid4())
-    declarations.append(RecyclingDeclaration(
-        wallet_address=WALLETS["citizen_fraud"],
+    declarations.append(dict(
+        wallet_address=W.citizen_fraud,
         plastic_kg=50.0,  # Asiri yuksek
         glass_kg=100.0,   # Asiri yuksek
         metal_kg=30.0,
         paper_kg=0,
         electronic_count=10,  # Supheli
         qr_token_id=token_id_3,
-        qr_hash=hashlib.sha256(token_id_3.encode()).hexdigest(),
+        qr_hash=qr_hash_3,
         qr_expires_at=now - timedelta(days=3),
         is_qr_expired=True,
         is_qr_used=False,
         total_reward_amount=0,
         admin_approval_status="fraud",
-        admin_approved_by=WALLETS["admin"],
+        admin_approved_by=W.admin,
         is_fraud=True,
         fraud_reason="Gercekci olmayan yuksek miktarlar beyan edildi",
         created_at=now - timedelta(days=3),
         processed_at=now - timedelta(days=3, hours=-2)
     ))
     
-    for declaration in declarations:
-        db.add(declaration)
-    
-    db.commit()
+    _insert_rows(db, RecyclingDeclaration, declarations)
     print(f"[OK] {len(declarations)} coklu atik beyani olusturuldu")
 
 
@@ -465,30 +673,27 @@ def seed_deposits(db):
     print("\n[DEPOSIT] Depozitolar olusturuluyor...")
     
     deposits = [
-        UserDeposit(
-            wallet_address=WALLETS["citizen_1"],
-            deposit_amount=100.0,
-            deposit_token="0x" + "0" * 40,
-            transaction_hash=f"0x{'b' * 64}"
+        dict(
+            wallet_address=W.citizen_1,
+            deposit_amount_kurus=10000,  # 100.00
+            deposit_token=NULL_TOKEN,
+            transaction_hash=FAKE_TX_B
         ),
-        UserDeposit(
-            wallet_address=WALLETS["citizen_2"],
-            deposit_amount=150.0,
-            deposit_token="0x" + "0" * 40,
-            transaction_hash=f"0x{'c' * 64}"
+        dict(
+            wallet_address=W.citizen_2,
+            deposit_amount_kurus=15000,  # 150.00
+            deposit_token=NULL_TOKEN,
+            transaction_hash=FAKE_TX_C
         ),
-        UserDeposit(
-            wallet_address=WALLETS["citizen_fraud"],
-            deposit_amount=200.0,  # Slashing icin depozit mevcut
-            deposit_token="0x" + "0" * 40,
-            transaction_hash=f"0x{'d' * 64}"
+        dict(
+            wallet_address=W.citizen_fraud,
+            deposit_amount_kurus=20000,  # 200.00 - slashing icin depozit mevcut
+            deposit_token=NULL_TOKEN,
+            transaction_hash=FAKE_TX_D
         ),
     ]
     
-    for deposit in deposits:
-        db.add(deposit)
-    
-    db.commit()
+    _insert_ignore(db, UserDeposit, deposits, "wallet_address")
     print(f"[OK] {len(deposits)} depozito olusturuldu")
 
 
@@ -500,8 +705,8 @@ def seed_fraud_records(db):
     
     fraud_records = [
         # AI tarafindan tespit edilen fraud
-        FraudRecord(
-            wallet_address=WALLETS["citizen_fraud"],
+        dict(
+            wallet_address=W.citizen_fraud,
             fraud_type="ai_detected",
             detection_method="consumption_drop",
             penalty_amount=100.0,
@@ -509,16 +714,13 @@ def seed_fraud_records(db):
             actual_reading=None,  # Henuz fiziksel kontrol yapilmadi
             underpayment_amount=110.0,
             interest_charged=5.5,
-            detected_by=WALLETS["operator"],
+            detected_by=W.operator,
             notes="Tuketimde %80 ani dusus tespit edildi. Fiziksel kontrol gerekli.",
             created_at=now - timedelta(days=2)
         ),
     ]
     
-    for record in fraud_records:
-        db.add(record)
-    
-    db.commit()
+    _insert_rows(db, FraudRecord, fraud_records)
     print(f"[OK] {len(fraud_records)} fraud kaydi olusturuldu")
 
 
@@ -530,11 +732,11 @@ def seed_fraud_reports(db):
     
     reports = [
         # Yuksek riskli rapor - onay bekliyor
-        FraudReport(
-            wallet_address=WALLETS["citizen_fraud"],
+        dict(
+            wallet_address=W.citizen_fraud,
             ai_score=85,
             risk_level="critical",
-            anomalies='["consumption_drop_80%", "no_photo_metadata"]',
+            anomalies=["consumption_drop_80%", "no_photo_metadata"],
             is_confirmed=False,
             current_reading=3055,
             current_consumption=5.0,
@@ -546,11 +748,11 @@ def seed_fraud_reports(db):
             created_at=now - timedelta(days=1)
         ),
         # Dusuk riskli - otomatik gecti
-        FraudReport(
-            wallet_address=WALLETS["citizen_1"],
+        dict(
+            wallet_address=W.citizen_1,
             ai_score=15,
             risk_level="low",
-            anomalies='[]',
+            anomalies=[],
             is_confirmed=True,
             confirmed_at=now - timedelta(days=5),
             current_reading=1085,
@@ -564,10 +766,7 @@ def seed_fraud_reports(db):
         ),
     ]
     
-    for report in reports:
-        db.add(report)
-    
-    db.commit()
+    _insert_rows(db, FraudReport, reports)
     print(f"[OK] {len(reports)} fraud raporu olusturuldu")
 
 
@@ -579,20 +778,20 @@ def seed_inspections(db):
     
     inspections = [
         # Bekleyen kontrol
-        InspectionSchedule(
-            wallet_address=WALLETS["citizen_fraud"],
+        dict(
+            wallet_address=W.citizen_fraud,
             meter_no="WSM-2024-003",
             scheduled_date=now + timedelta(days=3),
-            inspector_wallet=WALLETS["inspector"],
+            inspector_wallet=W.inspector,
             status="pending",
             notes="AI fraud tespiti sonrasi planlanan kontrol"
         ),
         # Tamamlanmis kontrol - fraud bulundu
-        InspectionSchedule(
-            wallet_address=WALLETS["citizen_2"],
+        dict(
+            wallet_address=W.citizen_2,
             meter_no="WSM-2024-002",
             scheduled_date=now - timedelta(days=30),
-            inspector_wallet=WALLETS["inspector"],
+            inspector_wallet=W.inspector,
             status="completed",
             actual_reading=2061,
             notes="6 aylik rutin kontrol - sorun yok",
@@ -600,10 +799,7 @@ def seed_inspections(db):
         ),
     ]
     
-    for inspection in inspections:
-        db.add(inspection)
-    
-    db.commit()
+    _insert_rows(db, InspectionSchedule, inspections)
     print(f"[OK] {len(inspections)} kontrol planlamasi olusturuldu")
 
 
@@ -612,23 +808,21 @@ def seed_penalties(db):
     print("\n[PENALTY] Ceza kayitlari olusturuluyor...")
     
     now = datetime.now()
+    admin_id = _user_ids(db)[W.admin]
     
     penalties = [
-        PenaltyRecord(
-            wallet_address=WALLETS["citizen_fraud"],
+        dict(
+            wallet_address=W.citizen_fraud,
             penalty_type="fraud_detection",
-            penalty_amount=50.0,
+            penalty_amount_kurus=5000,  # 50.00
             description="AI tarafindan tespit edilen tuketim anomalisi - depozito kesintisi",
             is_paid=False,
-            created_by=WALLETS["admin"],
+            created_by_id=admin_id,
             created_at=now - timedelta(days=1)
         ),
     ]
     
-    for penalty in penalties:
-        db.add(penalty)
-    
-    db.commit()
+    _insert_rows(db, PenaltyRecord, penalties)
     print(f"[OK] {len(penalties)} ceza kaydi olusturuldu")
 
 
@@ -636,18 +830,46 @@ def seed_material_multipliers(db):
     """Materyal carpanlarini olustur"""
     print("\n[MATERIAL] Materyal carpanlari olusturuluyor...")
     
-    for material, data in DEFAULT_MATERIAL_MULTIPLIERS.items():
-        multiplier = MaterialMultiplier(
-            material_type=material,
-            multiplier=data["multiplier"],
-            base_token_rate=data["base_rate"],
-            description=data["description"],
-            is_active=True
-        )
-        db.add(multiplier)
-    
+    # Birkac satir: executemany yerine tek cok satirli INSERT ... VALUES
+    stmt = _insert_ignore_stmt(db, MaterialMultiplier, "material_type")
+    db.execute(stmt.values(list(_MATERIAL_INSERT_ROWS)))
+    print(f"[OK] {len(_MATERIAL_INSERT_ROWS)} materyal carpani olusturuldu")
+
+
+# Sadece users tablosuna dayanan, birbirinden bagimsiz seed'ler
+INDEPENDENT_SEEDERS = (
+    seed_deposits,
+    seed_fraud_records,
+    seed_fraud_reports,
+    seed_inspections,
+    seed_penalties,
+    seed_material_multipliers,
+)
+
+
+def _run_seeder(seeder):
+    with get_db() as db:
+        db.autoflush = False
+        seeder(db)
+
+
+def run_independent_seeders(db):
+    """
+    Bagimsiz seed'leri calistir.
+    PARALLEL_SEED=1 iken her biri kendi session'inda paralel calisir;
+    aksi halde (ve SQLite'ta) ayni transaction'da sirayla calisir.
+    """
+    if os.getenv("PARALLEL_SEED") != "1" or db.get_bind().dialect.name == "sqlite":
+        for seeder in INDEPENDENT_SEEDERS:
+            seeder(db)
+        return
+    
+    # Ayri session'lar kullanicilari gorebilsin diye once commit
     db.commit()
-    print(f"[OK] {len(DEFAULT_MATERIAL_MULTIPLIERS)} materyal carpani olusturuldu")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_run_seeder, seeder) for seeder in INDEPENDENT_SEEDERS]
+        for future in futures:
+            future.result()
 
 
 def seed_all():
@@ -662,20 +884,19 @@ def seed_all():
     print("[OK] Tablolar hazir")
     
     with get_db() as db:
-        # Once mevcut verileri temizle
-        clear_all_data(db)
-        
-        # Sirayla seed fonksiyonlarini calistir
-        seed_users(db)
-        seed_water_meter_readings(db)
-        seed_recycling_submissions(db)
-        seed_recycling_declarations(db)
-        seed_deposits(db)
-        seed_fraud_records(db)
-        seed_fraud_reports(db)
-        seed_inspections(db)
-        seed_penalties(db)
-        seed_material_multipliers(db)
+        # Seed sorgulari oncesi autoflush taramasi gereksiz; SessionLocal
+        # varsayilani degisse de seed bundan etkilenmesin
+        db.autoflush = False
+        with sqlite_fast_pragmas(db), unlogged_tables(db):
+            # Temizlik ve tum seed'ler tek transaction'da, tek commit ile
+            # (PARALLEL_SEED=1 haric)
+            clear_all_data(db)
+            seed_users(db)
+            seed_water_meter_readings(db)
+            seed_recycling_submissions(db)
+            seed_recycling_declarations(db)
+            run_independent_seeders(db)
+            db.commit()
     
     print("\n" + "=" * 50)
     print("[SUCCESS] Tum seed verileri basariyla olusturuldu!")
@@ -683,8 +904,7 @@ def seed_all():
     
     print("\n[INFO] Test Kullanicilari:")
     print("-" * 50)
-    for role, wallet in WALLETS.items():
-        print(f"  {role.ljust(15)}: {wallet}")
+    sys.stdout.write("".join(f"  {role.ljust(15)}: {wallet}\n" for role, wallet in WALLET_ITEMS))
     
     print("\n[RUN] Backend'i baslatmak icin: python app.py")
     print("[API] API test: curl http://localhost:8000/api/health")
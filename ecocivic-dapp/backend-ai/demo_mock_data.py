@@ -7,9 +7,25 @@ v1 Not: Bu dosya demo/sunum için mock veriler içerir.
 Gerçek ortamda kullanılmamalıdır.
 """
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+import base64
 import hashlib
+import json
 import secrets
 
+
+def _frozen(value):
+    """
+    Salt okunur demo verisi: iç içe dict'ler MappingProxyType, listeler tuple olur.
+    Önbellekteki ve modül seviyesindeki veriyi çağıranlar değiştiremez.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    return value
+
 # ==============================
 # DEMO ANOMALY SIGNALS
 # ==============================
@@ -17,63 +33,67 @@ import secrets
 Anomali sinyal örnekleri - personel incelemesi için
 Her sinyal bir istatistiksel tespit temsil eder (ML/AI DEĞİL)
 """
-DEMO_ANOMALY_SIGNALS = [
-    {
-        "id": 1,
-        "wallet": "0x1234567890abcdef1234567890abcdef12345678",
-        "wallet_display": "0x1234...5678",
-        "signal_type": "consumption_drop",
-        "signal_score": 65,
-        "signal_level": "high",
-        "details": "Tüketim %58 düştü (ortalama: 25m³, mevcut: 10.5m³)",
-        "status": "pending_review",
-        "detected_by": "statistical_analysis",
-        "created_at": (datetime.utcnow() - timedelta(hours=2)).isoformat() + "Z",
-        "recommendation": "Personel incelemesi önerilir"
-    },
-    {
-        "id": 2,
-        "wallet": "0xabcdef1234567890abcdef1234567890abcdef12",
-        "wallet_display": "0xabcd...ef12",
-        "signal_type": "index_decreased",
-        "signal_score": 95,
-        "signal_level": "critical",
-        "details": "Sayaç endeksi geriye gitti: 1250 → 1189 (imkansız durum)",
-        "status": "pending_review",
-        "detected_by": "ocr_validation",
-        "created_at": (datetime.utcnow() - timedelta(hours=5)).isoformat() + "Z",
-        "recommendation": "Personel incelemesi gerekli"
-    },
-    {
-        "id": 3,
-        "wallet": "0x9876543210fedcba9876543210fedcba98765432",
-        "wallet_display": "0x9876...5432",
-        "signal_type": "photo_metadata_suspicious",
-        "signal_score": 45,
-        "signal_level": "medium",
-        "details": "Fotoğraf 8 dakika önce çekilmiş, GPS verisi yok",
-        "status": "reviewed_ok",
-        "detected_by": "metadata_check",
-        "reviewed_by": "0xstaff123...abc",
-        "review_notes": "Kullanıcı telefon GPS'i kapalı olduğunu belirtti, kabul edildi",
-        "created_at": (datetime.utcnow() - timedelta(hours=12)).isoformat() + "Z",
-        "reviewed_at": (datetime.utcnow() - timedelta(hours=10)).isoformat() + "Z",
-        "recommendation": "İzlemeye devam"
-    },
-    {
-        "id": 4,
-        "wallet": "0xfedcba9876543210fedcba9876543210fedcba98",
-        "wallet_display": "0xfedc...ba98",
-        "signal_type": "excessive_consumption",
-        "signal_score": 72,
-        "signal_level": "high",
-        "details": "Aşırı tüketim: 180m³ (önceki ay ortalaması: 22m³ - 8 katı artış)",
-        "status": "pending_review",
-        "detected_by": "consumption_analysis",
-        "created_at": (datetime.utcnow() - timedelta(hours=1)).isoformat() + "Z",
-        "recommendation": "Personel incelemesi gerekli"
-    }
-]
+@lru_cache(maxsize=1)
+def demo_anomaly_signals():
+    """Demo anomali sinyalleri (ilk çağrıda oluşturulur, import anında değil)"""
+    now = datetime.utcnow()
+    return _frozen([
+        {
+            "id": 1,
+            "wallet": "0x1234567890abcdef1234567890abcdef12345678",
+            "wallet_display": "0x1234...5678",
+            "signal_type": "consumption_drop",
+            "signal_score": 65,
+            "signal_level": "high",
+            "details": "Tüketim %58 düştü (ortalama: 25m³, mevcut: 10.5m³)",
+            "status": "pending_review",
+            "detected_by": "statistical_analysis",
+            "created_at": (now - timedelta(hours=2)).isoformat() + "Z",
+            "recommendation": "Personel incelemesi önerilir"
+        },
+        {
+            "id": 2,
+            "wallet": "0xabcdef1234567890abcdef1234567890abcdef12",
+            "wallet_display": "0xabcd...ef12",
+            "signal_type": "index_decreased",
+            "signal_score": 95,
+            "signal_level": "critical",
+            "details": "Sayaç endeksi geriye gitti: 1250 → 1189 (imkansız durum)",
+            "status": "pending_review",
+            "detected_by": "ocr_validation",
+            "created_at": (now - timedelta(hours=5)).isoformat() + "Z",
+            "recommendation": "Personel incelemesi gerekli"
+        },
+        {
+            "id": 3,
+            "wallet": "0x9876543210fedcba9876543210fedcba98765432",
+            "wallet_display": "0x9876...5432",
+            "signal_type": "photo_metadata_suspicious",
+            "signal_score": 45,
+            "signal_level": "medium",
+            "details": "Fotoğraf 8 dakika önce çekilmiş, GPS verisi yok",
+            "status": "reviewed_ok",
+            "detected_by": "metadata_check",
+            "reviewed_by": "0xstaff123...abc",
+            "review_notes": "Kullanıcı telefon GPS'i kapalı olduğunu belirtti, kabul edildi",
+            "created_at": (now - timedelta(hours=12)).isoformat() + "Z",
+            "reviewed_at": (now - timedelta(hours=10)).isoformat() + "Z",
+            "recommendation": "İzlemeye devam"
+        },
+        {
+            "id": 4,
+            "wallet": "0xfedcba9876543210fedcba9876543210fedcba98",
+            "wallet_display": "0xfedc...ba98",
+            "signal_type": "excessive_consumption",
+            "signal_score": 72,
+            "signal_level": "high",
+            "details": "Aşırı tüketim: 180m³ (önceki ay ortalaması: 22m³ - 8 katı artış)",
+            "status": "pending_review",
+            "detected_by": "consumption_analysis",
+            "created_at": (now - timedelta(hours=1)).isoformat() + "Z",
+            "recommendation": "Personel incelemesi gerekli"
+        }
+    ])
 
 # ==============================
 # DEMO TX HASHES
@@ -82,7 +102,7 @@ DEMO_ANOMALY_SIGNALS = [
 Örnek blockchain transaction hash'leri
 Demo/sunum için kullanılır, gerçek işlemler DEĞİL
 """
-DEMO_TX_HASHES = {
+DEMO_TX_HASHES = _frozen({
     "water_reading_success": "0xa1b2c3d4e5f6789012345678901234567890abcdef1234567890abcdef123456",
     "water_reading_pending": "0xpending123456789012345678901234567890abcdef1234567890abcdef12",
     "recycling_reward": "0xf6e5d4c3b2a19876543210987654321098765432fedbca987654321098765432",
@@ -91,7 +111,7 @@ DEMO_TX_HASHES = {
     "staff_decision_fraud": "0xstaff_fraud_c3d4e5f6789012345678901234567890abcdef1234567890ab",
     "admin_appeal_approve": "0xadmin_approve_9876543210fedcba9876543210fedcba98765432fedcba98",
     "admin_appeal_reject": "0xadmin_reject_0fedcba9876543210fedcba98765432fedcba9876543210"
-}
+})
 
 # ==============================
 # DEMO QR DATA
@@ -101,66 +121,90 @@ DEMO_TX_HASHES = {
 3 saatlik geçerlilik süresi ile
 """
 def generate_demo_qr_data(wallet_address: str, plastic_kg: float = 2.5, glass_kg: float = 1.0):
-    """Demo için QR data oluştur"""
-    token_id = secrets.token_urlsafe(24)
-    qr_hash = hashlib.sha256(
-        f"{token_id}:{wallet_address}:{datetime.utcnow().isoformat()}".encode()
-    ).hexdigest()
+    """Demo için QR data oluştur (her çağrıda yeni, tek kullanımlık token)"""
+    return generate_demo_qr_data_batch([wallet_address], plastic_kg, glass_kg)[0]
+
+
+def generate_demo_qr_data_batch(wallet_addresses, plastic_kg: float = 2.5, glass_kg: float = 1.0):
+    """
+    Birden çok wallet için demo QR data oluştur.
+    Zaman, rastgele byte'lar ve beyan alanları tüm parti için bir kez hazırlanır;
+    her wallet için sadece token kodlama ve hash kalır.
+    """
+    wallet_addresses = list(wallet_addresses)
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
+    expires_at = (now + timedelta(hours=3)).isoformat() + "Z"
+    total_reward = int(plastic_kg * 10 + glass_kg * 12)
     
-    return {
-        "token_id": token_id,
-        "hash": f"sha256:{qr_hash}",
-        "wallet_address": wallet_address,
-        "expires_at": (datetime.utcnow() + timedelta(hours=3)).isoformat() + "Z",
-        "expires_in_seconds": 3 * 60 * 60,  # 10800 saniye
-        "declared_types": [
-            {"type": "plastic", "label": "Plastik", "amount": plastic_kg, "unit": "kg", "reward_rate": 10},
-            {"type": "glass", "label": "Cam", "amount": glass_kg, "unit": "kg", "reward_rate": 12}
-        ],
-        "total_reward": int(plastic_kg * 10 + glass_kg * 12),
-        "status": "pending_validation",
-        "blockchain_hash_stored": True,
-        "note": "Bu QR hash blockchain'de saklanır, tekrar kullanılamaz"
-    }
+    # token_urlsafe(24) ile aynı biçim, tek os.urandom çağrısıyla
+    buf = secrets.token_bytes(24 * len(wallet_addresses))
+    sha256 = hashlib.sha256
+    
+    results = []
+    for i, wallet_address in enumerate(wallet_addresses):
+        token_id = base64.urlsafe_b64encode(buf[24 * i:24 * (i + 1)]).rstrip(b"=").decode("ascii")
+        # sha256 hexdigest() C tarafında hex üretir; digest().hex() daha hızlı değil
+        qr_hash = sha256(f"{token_id}:{wallet_address}:{now_iso}".encode()).hexdigest()
+        results.append({
+            "token_id": token_id,
+            "hash": f"sha256:{qr_hash}",
+            "wallet_address": wallet_address,
+            "expires_at": expires_at,
+            "expires_in_seconds": 3 * 60 * 60,  # 10800 saniye
+            "declared_types": [
+                {"type": "plastic", "label": "Plastik", "amount": plastic_kg, "unit": "kg", "reward_rate": 10},
+                {"type": "glass", "label": "Cam", "amount": glass_kg, "unit": "kg", "reward_rate": 12}
+            ],
+            "total_reward": total_reward,
+            "status": "pending_validation",
+            "blockchain_hash_stored": True,
+            "note": "Bu QR hash blockchain'de saklanır, tekrar kullanılamaz"
+        })
+    return results
 
 # Pre-generated demo QR examples
-DEMO_QR_DATA = [
-    {
-        "token_id": "xK9mN2pL8qR5tW3vY7zA_demo1",
-        "hash": "sha256:a5b4c3d2e1f09876543210fedcba9876543210fedcba9876543210fedcba9876",
-        "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
-        "expires_at": (datetime.utcnow() + timedelta(hours=3)).isoformat() + "Z",
-        "declared_types": [
-            {"type": "plastic", "label": "Plastik", "amount": 2.5, "unit": "kg"},
-            {"type": "glass", "label": "Cam", "amount": 1.0, "unit": "kg"}
-        ],
-        "total_reward": 37,  # 2.5*10 + 1.0*12
-        "status": "pending_validation"
-    },
-    {
-        "token_id": "yL0nO3qM9rS6uX4wZ8aB_demo2",
-        "hash": "sha256:b6c5d4e3f21a9876543210fedcba9876543210fedcba9876543210fedcba9877",
-        "wallet_address": "0xabcdef1234567890abcdef1234567890abcdef12",
-        "expires_at": (datetime.utcnow() + timedelta(hours=2)).isoformat() + "Z",
-        "declared_types": [
-            {"type": "metal", "label": "Metal", "amount": 3.0, "unit": "kg"},
-            {"type": "electronic", "label": "Elektronik", "amount": 2, "unit": "adet"}
-        ],
-        "total_reward": 95,  # 3.0*15 + 2*25
-        "status": "pending_validation"
-    },
-    {
-        "token_id": "zM1oP4rN0sT7vY5xA9bC_demo3",
-        "hash": "sha256:c7d6e5f4g32b9876543210fedcba9876543210fedcba9876543210fedcba9878",
-        "wallet_address": "0x9876543210fedcba9876543210fedcba98765432",
-        "expires_at": (datetime.utcnow() - timedelta(hours=1)).isoformat() + "Z",  # Expired
-        "declared_types": [
-            {"type": "paper", "label": "Kağıt", "amount": 5.0, "unit": "kg"}
-        ],
-        "total_reward": 40,  # 5.0*8
-        "status": "expired"
-    }
-]
+@lru_cache(maxsize=1)
+def demo_qr_data():
+    """Hazır demo QR örnekleri (ilk çağrıda oluşturulur)"""
+    now = datetime.utcnow()
+    return _frozen([
+        {
+            "token_id": "xK9mN2pL8qR5tW3vY7zA_demo1",
+            "hash": "sha256:a5b4c3d2e1f09876543210fedcba9876543210fedcba9876543210fedcba9876",
+            "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "expires_at": (now + timedelta(hours=3)).isoformat() + "Z",
+            "declared_types": [
+                {"type": "plastic", "label": "Plastik", "amount": 2.5, "unit": "kg"},
+                {"type": "glass", "label": "Cam", "amount": 1.0, "unit": "kg"}
+            ],
+            "total_reward": 37,  # 2.5*10 + 1.0*12
+            "status": "pending_validation"
+        },
+        {
+            "token_id": "yL0nO3qM9rS6uX4wZ8aB_demo2",
+            "hash": "sha256:b6c5d4e3f21a9876543210fedcba9876543210fedcba9876543210fedcba9877",
+            "wallet_address": "0xabcdef1234567890abcdef1234567890abcdef12",
+            "expires_at": (now + timedelta(hours=2)).isoformat() + "Z",
+            "declared_types": [
+                {"type": "metal", "label": "Metal", "amount": 3.0, "unit": "kg"},
+                {"type": "electronic", "label": "Elektronik", "amount": 2, "unit": "adet"}
+            ],
+            "total_reward": 95,  # 3.0*15 + 2*25
+            "status": "pending_validation"
+        },
+        {
+            "token_id": "zM1oP4rN0sT7vY5xA9bC_demo3",
+            "hash": "sha256:c7d6e5f4g32b9876543210fedcba9876543210fedcba9876543210fedcba9878",
+            "wallet_address": "0x9876543210fedcba9876543210fedcba98765432",
+            "expires_at": (now - timedelta(hours=1)).isoformat() + "Z",  # Expired
+            "declared_types": [
+                {"type": "paper", "label": "Kağıt", "amount": 5.0, "unit": "kg"}
+            ],
+            "total_reward": 40,  # 5.0*8
+            "status": "expired"
+        }
+    ])
 
 # ==============================
 # DEMO USER DATA
@@ -169,7 +213,7 @@ DEMO_QR_DATA = [
 Örnek kullanıcı verileri
 Farklı durumlar için test senaryoları
 """
-DEMO_USERS = [
+DEMO_USERS = _frozen([
     {
         "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
         "role": "citizen",
@@ -215,7 +259,7 @@ DEMO_USERS = [
         "is_blacklisted": False,
         "status_description": "Belediye yöneticisi"
     }
-]
+])
 
 # ==============================
 # DEMO WATER READINGS
@@ -224,7 +268,7 @@ DEMO_USERS = [
 Örnek su sayacı okumaları
 OCR + anomali tespiti test senaryoları
 """
-DEMO_WATER_READINGS = [
+DEMO_WATER_READINGS = _frozen([
     {
         "meter_no": "WSM-2024-001",
         "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
@@ -263,7 +307,7 @@ DEMO_WATER_READINGS = [
         "average_consumption": 30,
         "scenario": "Index decreased - imkansız durum, fraud sinyali"
     }
-]
+])
 
 # ==============================
 # DEMO STATISTICS
@@ -271,7 +315,7 @@ DEMO_WATER_READINGS = [
 """
 Admin dashboard için demo istatistikler
 """
-DEMO_ADMIN_STATS = {
+DEMO_ADMIN_STATS = _frozen({
     "totalDeclarations": 156,
     "approved": 128,
     "pending": 18,
@@ -285,38 +329,63 @@ DEMO_ADMIN_STATS = {
         {"wallet": "0xabcd...ef12", "total_kg": 38.2, "total_rewards": 445},
         {"wallet": "0x9876...5432", "total_kg": 32.8, "total_rewards": 390}
     ]
-}
+})
 
 # ==============================
 # HELPER FUNCTIONS
 # ==============================
 
+# Durum / senaryo -> demo kaydı (her çağrıda yeniden kurulmaz)
+_USER_BY_STATUS = {
+    "normal": DEMO_USERS[0],
+    "warned": DEMO_USERS[1],
+    "blacklisted": DEMO_USERS[2],
+    "staff": DEMO_USERS[3],
+    "admin": DEMO_USERS[4]
+}
+
+_READING_BY_SCENARIO = {
+    "normal": DEMO_WATER_READINGS[0],
+    "consumption_drop": DEMO_WATER_READINGS[1],
+    "index_decreased": DEMO_WATER_READINGS[2]
+}
+
+
+@lru_cache(maxsize=1)
+def _signals_by_type():
+    # Aynı türden birden fazla sinyal varsa ilki döner (önceki tarama davranışı)
+    signals = {}
+    for signal in demo_anomaly_signals():
+        signals.setdefault(signal["signal_type"], signal)
+    return signals
+
 def get_demo_signal_by_type(signal_type: str):
     """Belirli tür sinyal getir"""
-    for signal in DEMO_ANOMALY_SIGNALS:
-        if signal["signal_type"] == signal_type:
-            return signal
-    return None
+    return _signals_by_type().get(signal_type)
 
 def get_demo_user_by_status(status: str):
     """Belirli durumda kullanıcı getir"""
-    status_map = {
-        "normal": DEMO_USERS[0],
-        "warned": DEMO_USERS[1],
-        "blacklisted": DEMO_USERS[2],
-        "staff": DEMO_USERS[3],
-        "admin": DEMO_USERS[4]
-    }
-    return status_map.get(status)
+    return _USER_BY_STATUS.get(status)
 
 def get_demo_reading_scenario(scenario: str):
     """Belirli senaryo için okuma getir"""
-    scenario_map = {
-        "normal": DEMO_WATER_READINGS[0],
-        "consumption_drop": DEMO_WATER_READINGS[1],
-        "index_decreased": DEMO_WATER_READINGS[2]
-    }
-    return scenario_map.get(scenario)
+    return _READING_BY_SCENARIO.get(scenario)
+
+# Senaryo -> (geçmiş tüketimler, son ay tüketimi); okuma dict'lerinden bir kez çıkarılır
+_CONSUMPTION_SERIES = {
+    scenario: (
+        tuple(float(r["consumption"]) for r in data["readings"][:-1]),
+        float(data["readings"][-1]["consumption"]),
+    )
+    for scenario, data in _READING_BY_SCENARIO.items()
+}
+
+def get_demo_consumption_series(scenario: str):
+    """
+    Senaryonun tüketim serisini (geçmiş, mevcut) olarak getir.
+    UsageAnomalyDetector.calculate_signal_score'a doğrudan verilebilir.
+    """
+    return _CONSUMPTION_SERIES.get(scenario)
 
 
 # ==============================
@@ -327,78 +396,91 @@ Demo için hazır API response'ları
 Frontend test ve sunum için kullanılır
 """
 
-DEMO_API_RESPONSES = {
-    "/api/water/validate_success": {
-        "valid": True,
-        "meter_no": "WSM-2024-001",
-        "current_index": 1112,
-        "historical_avg": 22.3,
-        "reward_eligible": True,
-        "transaction_hash": DEMO_TX_HASHES["water_reading_success"],
-        "photo_validated": True,
-        "blockchain_recorded": True,
-        "anomaly_signal": {
-            "detected": False,
-            "signal_score": 0,
-            "signal_type": None
+@lru_cache(maxsize=1)
+def demo_api_responses():
+    """Demo API response'ları (ilk çağrıda oluşturulur)"""
+    now = datetime.utcnow()
+    return _frozen({
+        "/api/water/validate_success": {
+            "valid": True,
+            "meter_no": "WSM-2024-001",
+            "current_index": 1112,
+            "historical_avg": 22.3,
+            "reward_eligible": True,
+            "transaction_hash": DEMO_TX_HASHES["water_reading_success"],
+            "photo_validated": True,
+            "blockchain_recorded": True,
+            "anomaly_signal": {
+                "detected": False,
+                "signal_score": 0,
+                "signal_type": None
+            },
+            "message_for_user": "OCR doğrulaması tamamlandı. Sayaç kaydı blockchain'e yazıldı."
         },
-        "message_for_user": "OCR doğrulaması tamamlandı. Sayaç kaydı blockchain'e yazıldı."
-    },
     
-    "/api/water/validate_with_anomaly": {
-        "valid": False,
-        "requires_confirmation": True,
-        "reason": "consumption_drop_warning",
-        "current_consumption": 10,
-        "average_consumption": 25.6,
-        "drop_percent": 60.9,
-        "message": "Tüketiminiz geçmiş aylara göre %60.9 düştü",
-        "warning": "Tüketiminiz geçmiş aylara göre önemli ölçüde düştü. Devam etmek istediğinizden emin misiniz?",
-        "anomaly_signal": {
-            "detected": True,
-            "signal_score": 65,
-            "signal_type": "consumption_drop"
-        }
-    },
+        "/api/water/validate_with_anomaly": {
+            "valid": False,
+            "requires_confirmation": True,
+            "reason": "consumption_drop_warning",
+            "current_consumption": 10,
+            "average_consumption": 25.6,
+            "drop_percent": 60.9,
+            "message": "Tüketiminiz geçmiş aylara göre %60.9 düştü",
+            "warning": "Tüketiminiz geçmiş aylara göre önemli ölçüde düştü. Devam etmek istediğinizden emin misiniz?",
+            "anomaly_signal": {
+                "detected": True,
+                "signal_score": 65,
+                "signal_type": "consumption_drop"
+            }
+        },
     
-    "/api/recycling/declare_success": {
-        "success": True,
-        "declaration_id": 42,
-        "qr_data": DEMO_QR_DATA[0],
-        "expires_at": (datetime.utcnow() + timedelta(hours=3)).isoformat() + "Z",
-        "total_reward": 37,
-        "message": "Beyan oluşturuldu. 3 saat içinde geri dönüşüm merkezinde okutun."
-    },
+        "/api/recycling/declare_success": {
+            "success": True,
+            "declaration_id": 42,
+            "qr_data": demo_qr_data()[0],
+            "expires_at": (now + timedelta(hours=3)).isoformat() + "Z",
+            "total_reward": 37,
+            "message": "Beyan oluşturuldu. 3 saat içinde geri dönüşüm merkezinde okutun."
+        },
     
-    "/api/fraud/status_normal": {
-        "has_fraud": False,
-        "total_penalties": 0,
-        "recycling_warnings_remaining": 2,
-        "water_warnings_remaining": 2,
-        "is_recycling_blacklisted": False,
-        "is_water_blacklisted": False,
-        "pending_reward_balance": 150,
-        "records": []
-    },
+        "/api/fraud/status_normal": {
+            "has_fraud": False,
+            "total_penalties": 0,
+            "recycling_warnings_remaining": 2,
+            "water_warnings_remaining": 2,
+            "is_recycling_blacklisted": False,
+            "is_water_blacklisted": False,
+            "pending_reward_balance": 150,
+            "records": []
+        },
     
-    "/api/fraud/status_warned": {
-        "has_fraud": True,
-        "total_penalties": 50,
-        "recycling_warnings_remaining": 1,
-        "water_warnings_remaining": 2,
-        "is_recycling_blacklisted": False,
-        "is_water_blacklisted": False,
-        "pending_reward_balance": 45,
-        "records": [
-            {
-                "fraud_type": "recycling_mismatch",
-                "penalty_amount": 50,
-                "detected_at": (datetime.utcnow() - timedelta(days=15)).isoformat(),
-                "tx_hash": DEMO_TX_HASHES["fraud_penalty"]
-            }
-        ]
-    }
-}
+        "/api/fraud/status_warned": {
+            "has_fraud": True,
+            "total_penalties": 50,
+            "recycling_warnings_remaining": 1,
+            "water_warnings_remaining": 2,
+            "is_recycling_blacklisted": False,
+            "is_water_blacklisted": False,
+            "pending_reward_balance": 45,
+            "records": [
+                {
+                    "fraud_type": "recycling_mismatch",
+                    "penalty_amount": 50,
+                    "detected_at": (now - timedelta(days=15)).isoformat(),
+                    "tx_hash": DEMO_TX_HASHES["fraud_penalty"]
+                }
+            ]
+        }
+    })
+
+
+@lru_cache(maxsize=None)
+def demo_api_response_json(path: str) -> bytes:
+    """
+    Demo API response'unu JSON byte'ları olarak döndür.
+    Her path bir kez serialize edilir; handler'lar hazır gövdeyi döndürebilir.
+    """
+    return json.dumps(demo_api_responses()[path], ensure_ascii=False, default=dict).encode("utf-8")
 
 
 if __name__ == "__main__":
@@ -406,7 +488,7 @@ if __name__ == "__main__":
     print("=== EcoCivic v1 Demo Data ===\n")
     
     print("📊 Anomaly Signals:")
-    for signal in DEMO_ANOMALY_SIGNALS[:2]:
+    for signal in demo_anomaly_signals()[:2]:
         print(f"  - [{signal['signal_level'].upper()}] {signal['signal_type']}: {signal['details'][:50]}...")
     
     print("\n🔗 TX Hashes:")
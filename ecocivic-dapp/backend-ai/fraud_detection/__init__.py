@@ -2,12 +2,13 @@
 Fraud Detection Package
 Modüler fraud tespit sistemi
 """
-from fraud_detection.usage_anomaly import UsageAnomalyDetector, usage_anomaly_detector
+from fraud_detection.usage_anomaly import UsageAnomalyDetector, usage_anomaly_detector, RollingStats
 from fraud_detection.image_metadata_check import ImageMetadataChecker, image_metadata_checker
 
 __all__ = [
     "UsageAnomalyDetector",
     "usage_anomaly_detector",
+    "RollingStats",
     "ImageMetadataChecker", 
     "image_metadata_checker"
 ]
@@ -2,20 +2,60 @@
 Image Metadata Check
 Fotoğraf metadata doğrulaması - real-time capture kontrolü
 """
+import hashlib
 import logging
+import os
+import re
+import threading
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from io import BytesIO
 
-try:
-    from PIL import Image
-    from PIL.ExifTags import TAGS, GPSTAGS
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# Doğrulamanın baktığı EXIF tag'leri; diğerleri isimlendirilmez/saklanmaz
+WANTED_EXIF_TAGS = frozenset({
+    "DateTimeOriginal", "DateTime", "GPSInfo",
+    "Software", "ProcessingSoftware", "Make", "Model",
+})
+
+# Derece/dakika/saniye dönüşümü çarpanları
+_INV_60 = 1 / 60
+_INV_3600 = 1 / 3600
+
+# EXIF alt IFD işaretçileri ve Exif IFD içindeki DateTimeOriginal tag'i
+EXIF_IFD_POINTER = 0x8769
+GPS_IFD_POINTER = 0x8825
+DATETIME_ORIGINAL_TAG = 0x9003
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
 logger = logging.getLogger("image-metadata")
 
+# PIL ilk fotoğraf doğrulamasında yüklenir; fotoğrafa dokunmayan yollar
+# import maliyetini ödemez. None: henüz denenmedi
+PIL_AVAILABLE = None
+Image = None
+GPSTAGS = None
+_WANTED_TAG_IDS: Dict[int, str] = {}
+
+
+def _load_pil() -> bool:
+    """PIL'i bir kez import et; kullanılabilir mi döndür"""
+    global PIL_AVAILABLE, Image, GPSTAGS, _WANTED_TAG_IDS
+    if PIL_AVAILABLE is None:
+        try:
+            from PIL import Image as pil_image
+            from PIL.ExifTags import TAGS, GPSTAGS as gps_tags
+        except ImportError:
+            logger.warning("PIL/Pillow not available. Image metadata checking disabled.")
+            PIL_AVAILABLE = False
+        else:
+            Image, GPSTAGS = pil_image, gps_tags
+            # tag id -> isim, sadece istenen tag'ler için (bir kez)
+            _WANTED_TAG_IDS = {tag_id: name for tag_id, name in TAGS.items() if name in WANTED_EXIF_TAGS}
+            PIL_AVAILABLE = True
+    return PIL_AVAILABLE
+
 
 class ImageMetadataChecker:
     """
@@ -32,12 +72,27 @@ class ImageMetadataChecker:
         "afterlight", "vsco", "canva", "picsart", "adobe"
     ]
     
+    # Tüm yazılım adları için tek, büyük/küçük harf duyarsız arama
+    _EDITING_RE = re.compile("|".join(map(re.escape, EDITING_SOFTWARE)), re.IGNORECASE)
+    
     # Max fotoğraf yaşı (dakika)
     MAX_PHOTO_AGE_MINUTES = 5
     
+    # Başarısız kontrol başına skor düşüşü
+    PENALTY_NO_TIMESTAMP = 30
+    PENALTY_OLD_PHOTO = 40
+    PENALTY_NO_GPS = 15
+    PENALTY_EDITED = 35
+    PENALTY_NO_DEVICE = 10
+    
+    # İçerik hash'ine göre saklanan EXIF sonucu sayısı (LRU)
+    EXIF_CACHE_SIZE = 1024
+    
     def __init__(self):
-        if not PIL_AVAILABLE:
-            logger.warning("PIL/Pillow not available. Image metadata checking disabled.")
+        # Aynı fotoğraf tekrar doğrulandığında (retry, itiraz, admin inceleme)
+        # EXIF yeniden parse edilmez
+        self._exif_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._exif_cache_lock = threading.Lock()
     
     def extract_exif(self, image_path_or_bytes) -> Dict:
         """
@@ -49,24 +104,66 @@ class ImageMetadataChecker:
         Returns:
             EXIF dictionary
         """
-        if not PIL_AVAILABLE:
+        if not _load_pil():
             return {}
         
+        # Dosya yolları önbelleğe alınmaz (içerik değişebilir)
+        if not isinstance(image_path_or_bytes, bytes):
+            return self._parse_exif(image_path_or_bytes)
+        
+        fingerprint = hashlib.blake2b(image_path_or_bytes, digest_size=16).digest()
+        with self._exif_cache_lock:
+            cached = self._exif_cache.get(fingerprint)
+            if cached is not None:
+                self._exif_cache.move_to_end(fingerprint)
+                return dict(cached)
+        
+        exif = self._parse_exif(image_path_or_bytes)
+        with self._exif_cache_lock:
+            self._exif_cache[fingerprint] = exif
+            if len(self._exif_cache) > self.EXIF_CACHE_SIZE:
+                self._exif_cache.popitem(last=False)
+        return dict(exif)
+    
+    def _parse_exif(self, image_path_or_bytes) -> Dict:
+        """Fotoğrafı açıp doğrulamada kullanılan EXIF tag'lerini isimleriyle döndür"""
         try:
             if isinstance(image_path_or_bytes, bytes):
-                img = Image.open(BytesIO(image_path_or_bytes))
+                source = BytesIO(image_path_or_bytes)
             else:
-                img = Image.open(image_path_or_bytes)
-            
-            exif_data = img._getexif()
-            if not exif_data:
-                return {}
+                source = image_path_or_bytes
             
-            exif = {}
-            for tag_id, value in exif_data.items():
-                tag = TAGS.get(tag_id, tag_id)
-                exif[tag] = value
+            # getexif() sadece IFD0'ı okur; alt IFD'ler istendiğinde açılır.
+            # Private _getexif() ise thumbnail ve MakerNote dahil tüm bloğu çözer.
+            # Piksel verisi hiç çözülmez: load()/convert() çağrılmaz, sadece header okunur
+            with Image.open(source) as img:
+                # PNG'de IDAT'tan sonra gelen eXIf chunk'ını okumak için getexif()
+                # tüm görüntüyü decode eder; bunun yerine chunk başlıkları IEND'e
+                # kadar taranır, piksel verisi atlanır
+                if img.format == "PNG" and "exif" not in img.info:
+                    trailing = _find_png_exif_chunk(img.fp)
+                    if trailing is None:
+                        return {}
+                    exif_data = Image.Exif()
+                    exif_data.load(trailing)
+                else:
+                    exif_data = img.getexif()
+                if not exif_data:
+                    return {}
+                
+                wanted = _WANTED_TAG_IDS
+                exif = {wanted[tag_id]: value for tag_id, value in exif_data.items() if tag_id in wanted}
+                
+                # DateTimeOriginal Exif alt IFD'sinde, GPS tag'leri GPS IFD'sinde
+                if EXIF_IFD_POINTER in exif_data:
+                    datetime_original = exif_data.get_ifd(EXIF_IFD_POINTER).get(DATETIME_ORIGINAL_TAG)
+                    if datetime_original:
+                        exif["DateTimeOriginal"] = datetime_original
+                if GPS_IFD_POINTER in exif_data:
+                    exif["GPSInfo"] = exif_data.get_ifd(GPS_IFD_POINTER)
             
+            # İstenen tag olmasa da EXIF bloğunun varlığı korunur (boş dict = EXIF yok)
+            exif["ExifTagCount"] = len(exif_data)
             return exif
             
         except Exception as e:
@@ -78,7 +175,7 @@ class ImageMetadataChecker:
         GPS bilgilerini çıkar
         """
         gps_info = exif.get("GPSInfo", {})
-        if not gps_info:
+        if not gps_info or not _load_pil():
             return None
         
         try:
@@ -116,13 +213,18 @@ class ImageMetadataChecker:
     
     def _convert_to_degrees(self, value) -> float:
         """DMS to degrees conversion"""
+        # Pillow rational'leri float'a kendiliğinden yükselir; bölme yerine çarpma
         d, m, s = value
-        return float(d) + float(m) / 60 + float(s) / 3600
+        return d + m * _INV_60 + s * _INV_3600
     
-    def check_timestamp(self, exif: Dict) -> Tuple[bool, int, str]:
+    def check_timestamp(self, exif: Dict, now: Optional[datetime] = None) -> Tuple[bool, int, str]:
         """
         Timestamp kontrolü
         
+        Args:
+            exif: extract_exif sonucu
+            now: Karşılaştırma zamanı (parti doğrulamada bir kez alınır)
+        
         Returns:
             (is_recent, age_minutes, message)
         """
@@ -132,9 +234,9 @@ class ImageMetadataChecker:
             return False, -1, "Timestamp bilgisi yok"
         
         try:
-            # EXIF format: "2024:01:14 15:30:45"
-            photo_time = datetime.strptime(str(datetime_original), "%Y:%m:%d %H:%M:%S")
-            now = datetime.now()
+            photo_time = _parse_exif_datetime(datetime_original)
+            if now is None:
+                now = datetime.now()
             
             diff = now - photo_time
             age_minutes = int(diff.total_seconds() / 60)
@@ -155,28 +257,22 @@ class ImageMetadataChecker:
         Returns:
             (is_edited, software_name)
         """
-        software = exif.get("Software", "")
-        
-        if software:
-            software_lower = str(software).lower()
-            for editor in self.EDITING_SOFTWARE:
-                if editor in software_lower:
-                    return True, software
-        
-        # ProcessingSoftware kontrolü
-        processing = exif.get("ProcessingSoftware", "")
-        if processing:
-            processing_lower = str(processing).lower()
-            for editor in self.EDITING_SOFTWARE:
-                if editor in processing_lower:
-                    return True, processing
+        # Önce Software, sonra ProcessingSoftware kontrolü
+        for field in ("Software", "ProcessingSoftware"):
+            value = exif.get(field)
+            if value and self._EDITING_RE.search(str(value)):
+                return True, value
         
         return False, None
     
-    def validate_image(self, image_path_or_bytes) -> Dict:
+    def validate_image(self, image_path_or_bytes, now: Optional[datetime] = None) -> Dict:
         """
         Tam fotoğraf doğrulama
         
+        Args:
+            image_path_or_bytes: Dosya yolu veya bytes
+            now: Fotoğraf yaşı için referans zaman (varsayılan: şimdi)
+        
         Returns:
             {
                 "valid": bool,
@@ -185,7 +281,7 @@ class ImageMetadataChecker:
                 "metadata": dict
             }
         """
-        if not PIL_AVAILABLE:
+        if not _load_pil():
             return {
                 "valid": True,
                 "score": 50,
@@ -193,9 +289,6 @@ class ImageMetadataChecker:
                 "metadata": {}
             }
         
-        issues = []
-        score = 100
-        
         # EXIF çıkar
         exif = self.extract_exif(image_path_or_bytes)
         
@@ -210,34 +303,43 @@ class ImageMetadataChecker:
             }
         
         # 1. Timestamp kontrolü
-        is_recent, age_minutes, msg = self.check_timestamp(exif)
-        if not is_recent:
-            if age_minutes == -1:
-                score -= 30
-                issues.append("Timestamp yok")
-            else:
-                score -= 40
-                issues.append(msg)
+        is_recent, age_minutes, msg = self.check_timestamp(exif, now)
+        no_timestamp = age_minutes == -1
+        too_old = not is_recent and not no_timestamp
         
         # 2. GPS kontrolü
         gps = self.extract_gps_info(exif)
-        if not gps:
-            score -= 15
-            issues.append("GPS bilgisi yok")
         
         # 3. Düzenleme kontrolü
         is_edited, software = self.detect_editing_software(exif)
-        if is_edited:
-            score -= 35
-            issues.append(f"Düzenleme yazılımı tespit edildi: {software}")
         
         # 4. Cihaz bilgisi kontrolü
         make = exif.get("Make", "")
         model = exif.get("Model", "")
-        if not make and not model:
-            score -= 10
+        no_device = not make and not model
+        
+        issues = []
+        if no_timestamp:
+            issues.append("Timestamp yok")
+        elif too_old:
+            issues.append(msg)
+        if not gps:
+            issues.append("GPS bilgisi yok")
+        if is_edited:
+            issues.append(f"Düzenleme yazılımı tespit edildi: {software}")
+        if no_device:
             issues.append("Cihaz bilgisi yok")
         
+        # Başarısız kontrollerin cezaları tek ifadede düşülür (bool -> 0/1)
+        score = (
+            100
+            - self.PENALTY_NO_TIMESTAMP * no_timestamp
+            - self.PENALTY_OLD_PHOTO * too_old
+            - self.PENALTY_NO_GPS * (not gps)
+            - self.PENALTY_EDITED * is_edited
+            - self.PENALTY_NO_DEVICE * no_device
+        )
+        
         # Score'u 0-100 aralığına sınırla
         score = max(0, min(100, score))
         
@@ -259,5 +361,38 @@ class ImageMetadataChecker:
         }
 
 
+def _find_png_exif_chunk(fp) -> Optional[bytes]:
+    """
+    PNG chunk listesini IEND'e kadar tara, eXIf chunk'ının verisini döndür
+    (yoksa None). IDAT dahil diğer chunk'ların gövdesi okunmadan atlanır.
+    """
+    fp.seek(len(PNG_SIGNATURE))
+    while True:
+        header = fp.read(8)
+        if len(header) < 8:
+            return None
+        length = int.from_bytes(header[:4], "big")
+        chunk_type = header[4:]
+        if chunk_type == b"eXIf":
+            data = fp.read(length)
+            return data if len(data) == length else None
+        if chunk_type == b"IEND":
+            return None
+        # Gövde + 4 byte CRC
+        fp.seek(length + 4, os.SEEK_CUR)
+
+
+def _parse_exif_datetime(value) -> datetime:
+    """
+    EXIF zaman damgasını parse et - format: "2024:01:14 15:30:45"
+    Sabit 19 karakterlik biçim dilimlenerek okunur; uymazsa strptime
+    (ve onun hata mesajı) kullanılır.
+    """
+    s = str(value)
+    if len(s) == 19 and s[4] == ":" and s[7] == ":" and s[10] == " " and s[13] == ":" and s[16] == ":":
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]))
+    return datetime.strptime(s, "%Y:%m:%d %H:%M:%S")
+
+
 # Global instance
 image_metadata_checker = ImageMetadataChecker()
@@ -6,14 +6,93 @@ v1 Not: Bu sistem ML/AI modeli KULLANMAZ.
 İstatistiksel analiz (z-score, trend, standart sapma) ile çalışır.
 """
 import logging
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-import statistics
+from datetime import datetime
 import math
 
+from fraud_detection.usage_anomaly import RELATIVE_M2_EPSILON, mean_stdev
+
 logger = logging.getLogger("anomaly-signal-system")
 
 
+def _linear_trend(data: Tuple[float, ...]) -> Dict:
+    """
+    detect_trend çekirdeği (x = 0..n-1 üzerinde basit doğrusal regresyon)
+    """
+    if len(data) < 3:
+        return {
+            "trend": "unknown",
+            "slope": 0,
+            "r_squared": 0,
+            "forecast_next": data[-1] if data else 0
+        }
+
+    # Simple linear regression
+    # x = 0..n-1 oldugu icin x_mean ve sum((x - x_mean)^2) kapali
+    # formdan gelir; y tarafi tek geciste toplanir
+    n = len(data)
+    x_mean = (n - 1) / 2
+    y_mean = math.fsum(data) / n
+    denominator = n * (n * n - 1) / 12
+
+    numerator = 0.0
+    ss_tot = 0.0
+    dx = -x_mean
+    for value in data:
+        dy = value - y_mean
+        numerator += dx * dy
+        ss_tot += dy * dy
+        dx += 1
+
+    slope = numerator / denominator
+    intercept = y_mean - slope * x_mean
+
+    # Duz seride yuvarlamadan kalan ~1e-30'luk ss_tot sapma sayilmaz;
+    # aksi halde r_squared 0/0'a yakin bir orandan rastgele cikardi
+    if ss_tot <= RELATIVE_M2_EPSILON * n * y_mean * y_mean:
+        ss_tot = 0
+
+    # R-squared (ss_res = ss_tot - slope * numerator)
+    ss_res = max(0.0, ss_tot - slope * numerator)
+    r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+
+    # Forecast
+    forecast = slope * n + intercept
+
+    # Trend direction
+    if slope > 0.5:
+        trend = "increasing"
+    elif slope < -0.5:
+        trend = "decreasing"
+    else:
+        trend = "stable"
+
+    return {
+        "trend": trend,
+        "slope": slope,
+        "r_squared": abs(r_squared),
+        "forecast_next": max(0, forecast)
+    }
+
+
+# Bir kullanicinin gecmisi yalnizca yeni okuma geldiginde degisir; ayni
+# gecmisin tekrar puanlanmasinda istatistikler onbellekten gelir. Anahtar
+# gecmisin tuple halidir, yeni okuma eklenince anahtar da degisir.
+HISTORY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=HISTORY_CACHE_SIZE)
+def _cached_trend(history: Tuple[float, ...]) -> Dict:
+    return _linear_trend(history)
+
+
+@lru_cache(maxsize=HISTORY_CACHE_SIZE)
+def _cached_mean_stdev(history: Tuple[float, ...]) -> Tuple[float, float]:
+    return mean_stdev(history)
+
+
 class AnomalySignalDetector:
     """
     İstatistiksel Anomali Sinyal Tespit Sistemi
@@ -28,11 +107,58 @@ class AnomalySignalDetector:
     - Mevsimsel düzeltme
     """
     
-    def __init__(self):
+    # Z-score kademeleri: |z| kaç eşiği aşıyorsa o kademenin (puan, tip)
+    # değeri kullanılır (eşikler artan sırada, karşılaştırma ">")
+    Z_SCORE_THRESHOLDS = (1.5, 2, 3)
+    Z_SCORE_TIERS = (
+        (0, None),
+        (10, None),
+        (25, "outlier"),
+        (40, "extreme_outlier"),
+    )
+    
+    def __init__(self, alpha: float = 0.3, beta: float = 0.1, phi: float = 1.0):
         # Model parametreleri
-        self.alpha = 0.3  # Exponential smoothing factor
-        self.beta = 0.1   # Trend smoothing factor
-        
+        self._alpha = alpha  # Exponential smoothing factor
+        self._beta = beta    # Trend smoothing factor
+        self._phi = phi      # Trend damping factor (1.0 = sönümsüz Holt)
+        self._update_coefficients()
+    
+    def _update_coefficients(self):
+        """
+        Döngü değişmezlerini (1 - alpha, (1 - beta) * phi) bir kez hesapla;
+        parametre setter'ları her değişimde yeniden çağırır
+        """
+        self._one_minus_alpha = 1 - self._alpha
+        self._damped_trend_weight = (1 - self._beta) * self._phi
+    
+    @property
+    def alpha(self) -> float:
+        return self._alpha
+    
+    @alpha.setter
+    def alpha(self, value: float):
+        self._alpha = value
+        self._update_coefficients()
+    
+    @property
+    def beta(self) -> float:
+        return self._beta
+    
+    @beta.setter
+    def beta(self, value: float):
+        self._beta = value
+        self._update_coefficients()
+    
+    @property
+    def phi(self) -> float:
+        return self._phi
+    
+    @phi.setter
+    def phi(self, value: float):
+        self._phi = value
+        self._update_coefficients()
+    
     def exponential_smoothing(self, data: List[float]) -> List[float]:
         """
         Basit üstel düzleştirme (Simple Exponential Smoothing)
@@ -40,9 +166,16 @@ class AnomalySignalDetector:
         if not data:
             return []
         
-        smoothed = [data[0]]
-        for i in range(1, len(data)):
-            smoothed.append(self.alpha * data[i] + (1 - self.alpha) * smoothed[i-1])
+        # Katsayilar dongu disinda yerel degiskene alinir; onceki deger
+        # listeden indekslenmek yerine tek bir yerelde tasinir
+        alpha = self._alpha
+        one_minus_alpha = self._one_minus_alpha
+        level = data[0]
+        smoothed = [level]
+        append = smoothed.append
+        for value in data[1:]:
+            level = alpha * value + one_minus_alpha * level
+            append(level)
         
         return smoothed
     
@@ -51,24 +184,34 @@ class AnomalySignalDetector:
         Holt's Linear Trend Method
         Trend ve tahmin hesaplama
         
+        phi < 1 ise sönümlü (damped) trend kullanılır: azalan tüketim
+        desenlerinde trend ileriye sonsuza kadar taşınmaz.
+        
         Returns:
             (smoothed_values, next_forecast)
         """
         if len(data) < 2:
             return data, data[-1] if data else 0
         
-        # Initialize
-        level = [data[0]]
-        trend = [data[1] - data[0]]
+        alpha, beta, phi = self._alpha, self._beta, self._phi
+        one_minus_alpha = self._one_minus_alpha
+        damped_trend_weight = self._damped_trend_weight
+        
+        # Initialize - trend serisi disari donmedigi icin yalnizca son
+        # durum (prev_level, trend) yerel degiskenlerde tasinir
+        prev_level = data[0]
+        trend = data[1] - data[0]
+        level = [prev_level]
+        append = level.append
         
-        for i in range(1, len(data)):
-            new_level = self.alpha * data[i] + (1 - self.alpha) * (level[i-1] + trend[i-1])
-            new_trend = self.beta * (new_level - level[i-1]) + (1 - self.beta) * trend[i-1]
-            level.append(new_level)
-            trend.append(new_trend)
+        for value in data[1:]:
+            new_level = alpha * value + one_minus_alpha * (prev_level + phi * trend)
+            trend = beta * (new_level - prev_level) + damped_trend_weight * trend
+            prev_level = new_level
+            append(new_level)
         
         # Forecast
-        forecast = level[-1] + trend[-1]
+        forecast = prev_level + phi * trend
         
         return level, forecast
     
@@ -84,49 +227,8 @@ class AnomalySignalDetector:
                 "forecast_next": float
             }
         """
-        if len(data) < 3:
-            return {
-                "trend": "unknown",
-                "slope": 0,
-                "r_squared": 0,
-                "forecast_next": data[-1] if data else 0
-            }
-        
-        # Simple linear regression
-        n = len(data)
-        x = list(range(n))
-        
-        x_mean = sum(x) / n
-        y_mean = sum(data) / n
-        
-        numerator = sum((x[i] - x_mean) * (data[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        slope = numerator / denominator if denominator != 0 else 0
-        intercept = y_mean - slope * x_mean
-        
-        # R-squared
-        ss_tot = sum((data[i] - y_mean) ** 2 for i in range(n))
-        ss_res = sum((data[i] - (slope * x[i] + intercept)) ** 2 for i in range(n))
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        
-        # Forecast
-        forecast = slope * n + intercept
-        
-        # Trend direction
-        if slope > 0.5:
-            trend = "increasing"
-        elif slope < -0.5:
-            trend = "decreasing"
-        else:
-            trend = "stable"
-        
-        return {
-            "trend": trend,
-            "slope": slope,
-            "r_squared": abs(r_squared),
-            "forecast_next": max(0, forecast)
-        }
+        # Onbellekteki sozluk cagirana kopyalanarak verilir
+        return dict(_cached_trend(tuple(data)))
     
     def calculate_anomaly_score(
         self,
@@ -157,25 +259,25 @@ class AnomalySignalDetector:
         anomaly_type = "none"
         details = {}
         
+        history = tuple(historical_data)
+        
         # 1. Statistical analysis
-        mean = statistics.mean(historical_data)
-        std = statistics.stdev(historical_data)
+        mean, std = _cached_mean_stdev(history)
+        deviation = current_value - mean
         
         if std > 0:
-            z_score = (current_value - mean) / std
+            z_score = deviation / std
             details["z_score"] = z_score
             
-            if abs(z_score) > 3:
-                score += 40
-                anomaly_type = "extreme_outlier"
-            elif abs(z_score) > 2:
-                score += 25
-                anomaly_type = "outlier"
-            elif abs(z_score) > 1.5:
-                score += 10
+            tier_score, tier_type = self.Z_SCORE_TIERS[
+                bisect_left(self.Z_SCORE_THRESHOLDS, abs(z_score))
+            ]
+            score += tier_score
+            if tier_type:
+                anomaly_type = tier_type
         
         # 2. Trend analysis
-        trend = self.detect_trend(historical_data)
+        trend = dict(_cached_trend(history))
         details["trend"] = trend
         
         # Compare with forecast
@@ -206,7 +308,7 @@ class AnomalySignalDetector:
             cv = std / mean
             details["coefficient_of_variation"] = cv
             
-            if cv < 0.1 and abs(current_value - mean) / mean > 0.3:
+            if cv < 0.1 and abs(deviation) / mean > 0.3:
                 # Normalde çok tutarlı, şimdi farklı
                 score += 15
         
@@ -222,6 +324,31 @@ class AnomalySignalDetector:
             "details": details
         }
     
+    def calculate_anomaly_score_batch(
+        self,
+        current_values: List[float],
+        histories: List[List[float]]
+    ) -> List[Dict]:
+        """
+        Birden çok kullanıcıyı tek çağrıda puanla (periyodik tarama)
+        
+        Geçmiş serileri farklı uzunlukta olabilir; her biri kendi
+        önbellek anahtarıyla işlendiğinden aynı geçmişi paylaşan ya da
+        tekrar taranan kullanıcılar istatistikleri yeniden hesaplatmaz.
+        
+        Args:
+            current_values: Kullanıcı başına mevcut tüketim
+            histories: Kullanıcı başına tüketim geçmişi (aynı sırada)
+            
+        Returns:
+            Her kullanıcı için calculate_anomaly_score sonucu (aynı sırada)
+        """
+        if len(current_values) != len(histories):
+            raise ValueError("current_values ve histories aynı uzunlukta olmalı")
+        
+        score = self.calculate_anomaly_score
+        return [score(value, history) for value, history in zip(current_values, histories)]
+    
     def calculate_anomaly_signal(
         self,
         user_history: List[Dict],
@@ -246,9 +373,6 @@ class AnomalySignalDetector:
                 "recommendation": str
             }
         """
-        signal_factors = []
-        signal_strength = 0.0
-        
         if not user_history:
             return {
                 "signal_strength": 0.0,
@@ -257,12 +381,41 @@ class AnomalySignalDetector:
                 "recommendation": "Veri toplamaya devam"
             }
         
-        # Extract consumption data
-        consumptions = [h.get("consumption", 0) for h in user_history if h.get("consumption")]
+        # Extract consumption data (eksik / boş / sıfır tüketimler atlanır,
+        # satır başına tek dict.get)
+        consumptions = [c for h in user_history if (c := h.get("consumption"))]
+        last_reading = user_history[-1].get("reading", current_reading)
+        
+        return self.calculate_anomaly_signal_series(
+            consumptions, last_reading, current_reading, metadata
+        )
+    
+    def calculate_anomaly_signal_series(
+        self,
+        consumptions: List[float],
+        last_reading: float,
+        current_reading: float,
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Anomali sinyal gücü hesaplama - hazır seriler üzerinden
+        
+        Geçmişi sütun halinde tutan çağıranlar (toplu tarama, DB'den
+        doğrudan çekilen tüketim listesi) kayıt başına sözlük kurmadan
+        bu metodu çağırabilir. calculate_anomaly_signal ile aynı sonucu verir.
+        
+        Args:
+            consumptions: Sıfır olmayan geçmiş tüketimler (eskiden yeniye)
+            last_reading: Geçmişteki son sayaç okuması
+            current_reading: Mevcut okuma
+            metadata: Ek bilgiler (fotoğraf age, GPS, vb.)
+        """
+        signal_factors = []
+        signal_strength = 0.0
         
         if consumptions:
             # Anomaly analysis (istatistiksel)
-            last_consumption = current_reading - (user_history[-1].get("reading", current_reading) if user_history else current_reading)
+            last_consumption = current_reading - last_reading
             if last_consumption > 0:
                 anomaly = self.calculate_anomaly_score(last_consumption, consumptions)
                 
@@ -6,12 +6,136 @@ v1 Not: Bu sistem ML/AI modeli KULLANMAZ.
 Sadece istatistiksel yöntemler (z-score, standart sapma, trend) kullanır.
 """
 import logging
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+import math
 import statistics
+from bisect import bisect_right
+from collections import deque
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 logger = logging.getLogger("usage-anomaly-signal")
 
+# Ortalamaya göre m2 / (n * mean^2) bu değerin altındaysa sapma yok kabul
+# edilir: sabit ama ikilik tabanda tam gösterilemeyen tüketimlerde (0.1 gibi)
+# yuvarlama ~1e-17'lik bir std üretip z-score'u patlatmasın
+RELATIVE_M2_EPSILON = 1e-10
+
+
+def _mean_m2(data: Iterable[float]) -> Tuple[float, float]:
+    """Ortalama (statistics.mean) ve ona merkezlenmiş kareler toplamı"""
+    mean = statistics.mean(data)
+    m2 = 0.0
+    for value in data:
+        diff = value - mean
+        m2 += diff * diff
+    return mean, m2
+
+
+def mean_stdev(data: List[float]) -> Tuple[float, float]:
+    """
+    Ortalama ve örneklem standart sapması (n >= 2)
+    
+    Ortalama statistics.mean ile (tam yuvarlanmış) bulunur: eşik
+    karşılaştırmaları (change_percent >= 200 gibi) ona göre yapılır ve
+    fsum(data) / n'nin son basamak farkı sınırdaki bayrağı değiştirir.
+    statistics.stdev'in ikinci Fraction geçişi yerine sapma, bu ortalamaya
+    merkezlenmiş kareler toplamından tek geçişte hesaplanır.
+    """
+    n = len(data)
+    mean, m2 = _mean_m2(data)
+    if m2 <= RELATIVE_M2_EPSILON * n * mean * mean:
+        return mean, 0.0
+    return mean, math.sqrt(m2 / (n - 1))
+
+
+class RollingStats:
+    """
+    Kayan pencerede ortalama / standart sapma
+    
+    Sürekli çalışan tarama servisinde her yeni okuma push ile eklenir;
+    pencere doluysa en eski değer çıkarılır. mean/std okumaları O(1)'dir,
+    her istekte geçmiş listesi yeniden kurulup taranmaz.
+    
+    Pencereler küçük olduğundan mean ve m2 her değişiklikte pencereden
+    yeniden hesaplanır (mean_stdev ile aynı sonuç). Welford silme adımı
+    büyük bir aykırı değer pencereden çıkınca m2'nin neredeyse tüm
+    hassasiyetini yok ediyor ve normal okumada sahte Z_SCORE_FLAG
+    üretiyordu.
+    """
+    
+    def __init__(self, maxlen: int = 12, values: Iterable[float] = ()):
+        self.maxlen = maxlen
+        self.values = deque(maxlen=maxlen)
+        self.mean = 0.0
+        self.m2 = 0.0
+        # Son değere kadar kesintisiz azalan ardışık okuma çifti sayısı
+        self.decreasing_streak = 0
+        for value in values:
+            self._append(value)
+        self._recompute()
+    
+    def _append(self, value: float) -> None:
+        if self.values and value < self.values[-1]:
+            self.decreasing_streak += 1
+        else:
+            self.decreasing_streak = 0
+        # deque(maxlen) doluysa en eski değeri kendisi düşürür
+        self.values.append(value)
+    
+    def _recompute(self) -> None:
+        if self.values:
+            self.mean, self.m2 = _mean_m2(self.values)
+        else:
+            self.mean = self.m2 = 0.0
+    
+    @property
+    def n(self) -> int:
+        return len(self.values)
+    
+    def push(self, value: float) -> None:
+        """Yeni değeri ekle, pencere doluysa en eskisini çıkar"""
+        self._append(value)
+        self._recompute()
+    
+    def pop(self) -> float:
+        """En eski değeri çıkar ve döndür"""
+        value = self.values.popleft()
+        self._recompute()
+        return value
+    
+    @property
+    def std(self) -> float:
+        """Örneklem standart sapması (statistics.stdev ile aynı tanım)"""
+        n = len(self.values)
+        if n < 2:
+            return 0
+        if self.m2 <= RELATIVE_M2_EPSILON * n * self.mean * self.mean:
+            return 0
+        return math.sqrt(self.m2 / (n - 1))
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __iter__(self):
+        return iter(self.values)
+
+
+# calculate_signal_score sinyal bayrakları (skor tablosu indeksinin bitleri)
+DROP_FLAG = 1 << 0
+SPIKE_FLAG = 1 << 1
+Z_SCORE_FLAG = 1 << 2
+TREND_FLAG = 1 << 3
+OLD_PHOTO_FLAG = 1 << 4
+NO_GPS_FLAG = 1 << 5
+EDITED_FLAG = 1 << 6
+
+# calculate_signal_code seviye kodları (SIGNAL_LEVELS indeksleri)
+LEVEL_UNKNOWN = -1
+LEVEL_LOW = 0
+LEVEL_MEDIUM = 1
+LEVEL_HIGH = 2
+LEVEL_CRITICAL = 3
+
 
 class UsageAnomalySignalDetector:
     """
@@ -30,130 +154,247 @@ class UsageAnomalySignalDetector:
     Z_SCORE_THRESHOLD = 2.5           # Standart sapma eşiği
     MIN_HISTORY_MONTHS = 3            # Minimum geçmiş veri
     
+    # Skor kademeleri: skor eşiğe ulaştıkça (">=") seviye yükselir
+    SIGNAL_LEVEL_THRESHOLDS = (30, 50, 70)
+    SIGNAL_LEVELS = (
+        ("low", "Normal işlem"),
+        ("medium", "İzlemeye devam, bilgilendirme gönder"),
+        ("high", "Personel incelemesi önerilir"),
+        ("critical", "Personel incelemesi gerekli"),
+    )
+    
+    # Sinyal bayrağı başına skor katkısı
+    SIGNAL_WEIGHTS = (
+        (DROP_FLAG, 40),
+        (SPIKE_FLAG, 20),
+        (Z_SCORE_FLAG, 25),
+        (TREND_FLAG, 15),
+        (OLD_PHOTO_FLAG, 10),
+        (NO_GPS_FLAG, 5),
+        (EDITED_FLAG, 20),
+    )
+    
     def __init__(self):
-        pass
+        # Her bayrak kombinasyonunun 0-100'e sınırlanmış skoru bir kez
+        # hesaplanır; puanlama tek bir tablo okumasına iner
+        self._score_table = tuple(
+            min(100, sum(weight for flag, weight in self.SIGNAL_WEIGHTS if mask & flag))
+            for mask in range(1 << len(self.SIGNAL_WEIGHTS))
+        )
     
-    def calculate_signal_score(
+    def _signal_state(
         self,
         current_consumption: float,
-        historical_data: List[float],
-        metadata: Optional[Dict] = None
-    ) -> Dict:
+        historical_data: Union[List[float], RollingStats],
+        metadata: Optional[Dict]
+    ) -> Optional[Tuple[int, float, float, float, float]]:
         """
-        Anomali sinyal skoru hesapla (0-100) - İstatistiksel analiz
-        
-        NOT: Bu metod ML/AI KULLANMAZ. Sadece istatistiksel hesaplama yapar.
+        Sinyal bayraklarını hesapla (metin ve sözlük üretmeden)
         
-        Args:
-            current_consumption: Mevcut ay tüketimi
-            historical_data: Geçmiş tüketim listesi (son 6-12 ay)
-            metadata: Ek bilgiler (fotoğraf metadata, GPS, vb.)
-            
         Returns:
-            {
-                "signal_score": int (0-100),
-                "signal_level": str (low/medium/high/critical),
-                "anomalies": list,
-                "recommendation": str
-            }
+            (flags, avg_consumption, std_dev, change_percent, z_score)
+            ya da geçmiş veri yetersizse None
         """
-        score = 0
-        anomalies = []
-        
         if not historical_data or len(historical_data) < self.MIN_HISTORY_MONTHS:
-            return {
-                "signal_score": 0,
-                "signal_level": "unknown",
-                "anomalies": ["Yetersiz geçmiş veri"],
-                "recommendation": "Daha fazla veri toplanana kadar izlemeye devam"
-            }
+            return None
+        
+        flags = 0
         
         # 1. Ortalama ve standart sapma hesapla
-        avg_consumption = statistics.mean(historical_data)
-        std_dev = statistics.stdev(historical_data) if len(historical_data) > 1 else 0
+        if isinstance(historical_data, RollingStats):
+            avg_consumption = historical_data.mean
+            std_dev = historical_data.std
+            last_value = historical_data.values[-1]
+            # Son 3 değer kesintisiz azalıyor mu (push sırasında O(1) izlenir)
+            decreasing = historical_data.decreasing_streak >= 2
+        else:
+            avg_consumption, std_dev = mean_stdev(historical_data)
+            last_value = historical_data[-1]
+            decreasing = (
+                len(historical_data) >= 3
+                and historical_data[-3] > historical_data[-2] > last_value
+            )
+        
+        # 2. Yüzdesel değişim kontrolü (details için de bir kez hesaplanır)
+        deviation = current_consumption - avg_consumption
+        change_percent = (deviation / avg_consumption) * 100 if avg_consumption > 0 else 0
         
-        # 2. Yüzdesel değişim kontrolü
         if avg_consumption > 0:
-            change_percent = ((current_consumption - avg_consumption) / avg_consumption) * 100
-            
             # Büyük düşüş
             if change_percent <= -self.DROP_THRESHOLD_PERCENT:
-                score += 40
-                anomalies.append(f"Tüketim %{abs(change_percent):.1f} düştü")
+                flags |= DROP_FLAG
             
             # Büyük artış (da şüpheli olabilir)
             if change_percent >= self.SPIKE_THRESHOLD_PERCENT:
-                score += 20
-                anomalies.append(f"Tüketim %{change_percent:.1f} arttı")
+                flags |= SPIKE_FLAG
         
-        # 3. Z-Score kontrolü
-        if std_dev > 0:
-            z_score = (current_consumption - avg_consumption) / std_dev
-            
-            if abs(z_score) > self.Z_SCORE_THRESHOLD:
-                score += 25
-                anomalies.append(f"Z-score: {z_score:.2f} (eşik: ±{self.Z_SCORE_THRESHOLD})")
+        # 3. Z-Score kontrolü (details'e de yazılır)
+        z_score = deviation / std_dev if std_dev > 0 else 0
+        if std_dev > 0 and abs(z_score) > self.Z_SCORE_THRESHOLD:
+            flags |= Z_SCORE_FLAG
         
         # 4. Trend analizi (son 3 ay sürekli düşüş?)
-        if len(historical_data) >= 3:
-            recent = historical_data[-3:]
-            if all(recent[i] > recent[i+1] for i in range(len(recent)-1)):
-                if current_consumption < recent[-1]:
-                    score += 15
-                    anomalies.append("Son 4 ayda sürekli düşüş trendi")
+        if len(historical_data) >= 3 and decreasing:
+            if current_consumption < last_value:
+                flags |= TREND_FLAG
         
         # 5. Metadata kontrolleri
         if metadata:
             # Fotoğraf timestamp kontrolü
             if metadata.get("photo_age_minutes", 0) > 5:
-                score += 10
-                anomalies.append("Fotoğraf 5 dakikadan eski")
+                flags |= OLD_PHOTO_FLAG
             
             # GPS yoksa
             if not metadata.get("has_gps", True):
-                score += 5
-                anomalies.append("GPS bilgisi yok")
+                flags |= NO_GPS_FLAG
             
             # Düzenleme yazılımı tespiti
             if metadata.get("edited", False):
-                score += 20
-                anomalies.append("Fotoğraf düzenleme tespiti")
+                flags |= EDITED_FLAG
+        
+        return flags, avg_consumption, std_dev, change_percent, z_score
+    
+    def _anomaly_messages(self, flags: int, change_percent: float, z_score: float) -> List[str]:
+        """Bayrak maskesini okunur anomali listesine çevir (bit sırasıyla)"""
+        anomalies = []
+        if flags & DROP_FLAG:
+            anomalies.append(f"Tüketim %{abs(change_percent):.1f} düştü")
+        if flags & SPIKE_FLAG:
+            anomalies.append(f"Tüketim %{change_percent:.1f} arttı")
+        if flags & Z_SCORE_FLAG:
+            anomalies.append(f"Z-score: {z_score:.2f} (eşik: ±{self.Z_SCORE_THRESHOLD})")
+        if flags & TREND_FLAG:
+            anomalies.append("Son 4 ayda sürekli düşüş trendi")
+        if flags & OLD_PHOTO_FLAG:
+            anomalies.append("Fotoğraf 5 dakikadan eski")
+        if flags & NO_GPS_FLAG:
+            anomalies.append("GPS bilgisi yok")
+        if flags & EDITED_FLAG:
+            anomalies.append("Fotoğraf düzenleme tespiti")
+        return anomalies
+    
+    def calculate_signal_code(
+        self,
+        current_consumption: float,
+        historical_data: Union[List[float], RollingStats],
+        metadata: Optional[Dict] = None
+    ) -> Tuple[int, int, int]:
+        """
+        Kompakt anomali sinyali - toplu tarama / filtreleme için
+        
+        calculate_signal_score ile aynı puanlamayı yapar ama metin ve
+        sözlük üretmez; seviye adı, öneri ve anomali metinleri yalnızca
+        API sınırında calculate_signal_score ile üretilir.
+        
+        Returns:
+            (signal_score, level kodu, bayrak maskesi); level kodu
+            SIGNAL_LEVELS indeksidir (LEVEL_LOW..LEVEL_CRITICAL), geçmiş
+            veri yetersizse LEVEL_UNKNOWN
+        """
+        state = self._signal_state(current_consumption, historical_data, metadata)
+        if state is None:
+            return 0, LEVEL_UNKNOWN, 0
+        flags = state[0]
+        score = self._score_table[flags]
+        return score, bisect_right(self.SIGNAL_LEVEL_THRESHOLDS, score), flags
+    
+    def calculate_signal_score(
+        self,
+        current_consumption: float,
+        historical_data: Union[List[float], RollingStats],
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Anomali sinyal skoru hesapla (0-100) - İstatistiksel analiz
+        
+        NOT: Bu metod ML/AI KULLANMAZ. Sadece istatistiksel hesaplama yapar.
+        
+        Args:
+            current_consumption: Mevcut ay tüketimi
+            historical_data: Geçmiş tüketim listesi (son 6-12 ay) ya da
+                kullanıcının RollingStats penceresi (mean/std O(1) okunur)
+            metadata: Ek bilgiler (fotoğraf metadata, GPS, vb.)
+            
+        Returns:
+            {
+                "signal_score": int (0-100),
+                "signal_level": str (low/medium/high/critical),
+                "anomalies": list,
+                "recommendation": str
+            }
+        """
+        state = self._signal_state(current_consumption, historical_data, metadata)
+        if state is None:
+            return {
+                "signal_score": 0,
+                "signal_level": "unknown",
+                "anomalies": ["Yetersiz geçmiş veri"],
+                "recommendation": "Daha fazla veri toplanana kadar izlemeye devam"
+            }
+        flags, avg_consumption, std_dev, change_percent, z_score = state
         
-        # Score'u 0-100 aralığına sınırla
-        score = min(100, max(0, score))
+        # Score (0-100 aralığına sınırlanmış tablo değeri)
+        score = self._score_table[flags]
         
         # Sinyal seviyesi (KARAR DEĞİL, sadece sinyal)
-        if score >= 70:
-            signal_level = "critical"
-            recommendation = "Personel incelemesi gerekli"
-        elif score >= 50:
-            signal_level = "high"
-            recommendation = "Personel incelemesi önerilir"
-        elif score >= 30:
-            signal_level = "medium"
-            recommendation = "İzlemeye devam, bilgilendirme gönder"
-        else:
-            signal_level = "low"
-            recommendation = "Normal işlem"
+        signal_level, recommendation = self.SIGNAL_LEVELS[
+            bisect_right(self.SIGNAL_LEVEL_THRESHOLDS, score)
+        ]
         
         return {
             "signal_score": score,
             "signal_level": signal_level,
-            "anomalies": anomalies,
+            "anomalies": self._anomaly_messages(flags, change_percent, z_score),
             "recommendation": recommendation,
             "details": {
                 "current_consumption": current_consumption,
                 "average_consumption": avg_consumption,
                 "std_deviation": std_dev,
-                "change_percent": ((current_consumption - avg_consumption) / avg_consumption * 100) if avg_consumption > 0 else 0
+                "change_percent": change_percent,
+                "z_score": z_score
             }
         }
     
+    def calculate_signal_scores_batch(
+        self,
+        current_consumptions: List[float],
+        histories: List[Union[List[float], RollingStats]],
+        metadatas: Optional[List[Optional[Dict]]] = None
+    ) -> List[Dict]:
+        """
+        Birden çok sayacı tek çağrıda puanla (toplu tarama)
+        
+        Geçmişler farklı uzunlukta listeler ya da kullanıcı başına tutulan
+        RollingStats pencereleri olabilir; pencereli geçmişlerde mean/std
+        ve trend O(1) okunduğundan toplu tarama geçmiş uzunluğundan
+        bağımsız kalır.
+        
+        Args:
+            current_consumptions: Sayaç başına mevcut ay tüketimi
+            histories: Sayaç başına geçmiş (aynı sırada)
+            metadatas: Sayaç başına ek bilgiler (opsiyonel, aynı sırada)
+            
+        Returns:
+            Her sayaç için calculate_signal_score sonucu (aynı sırada)
+        """
+        if len(current_consumptions) != len(histories):
+            raise ValueError("current_consumptions ve histories aynı uzunlukta olmalı")
+        if metadatas is None:
+            metadatas = repeat(None)
+        elif len(metadatas) != len(histories):
+            raise ValueError("metadatas ve histories aynı uzunlukta olmalı")
+        
+        score = self.calculate_signal_score
+        return [
+            score(current, history, metadata)
+            for current, history, metadata in zip(current_consumptions, histories, metadatas)
+        ]
+    
     def detect_seasonal_anomaly(
         self,
         current_consumption: float,
         current_month: int,
-        yearly_data: Dict[int, List[float]]
+        yearly_data: Dict[int, Union[List[float], RollingStats]]
     ) -> Tuple[bool, str]:
         """
         Mevsimsel anomali tespiti
@@ -161,15 +402,21 @@ class UsageAnomalySignalDetector:
         Args:
             current_consumption: Mevcut tüketim
             current_month: Mevcut ay (1-12)
-            yearly_data: Yıllık geçmiş veri {month: [values]}
+            yearly_data: Yıllık geçmiş veri {month: [values]}; değerler
+                ingest sırasında güncellenen RollingStats da
+                olabilir, bu durumda ay ortalaması O(1) okunur
             
         Returns:
             (is_anomaly, reason)
         """
-        if current_month not in yearly_data or not yearly_data[current_month]:
+        month_data = yearly_data.get(current_month)
+        if not month_data:
             return False, "Karşılaştırmalı veri yok"
         
-        same_month_avg = statistics.mean(yearly_data[current_month])
+        if isinstance(month_data, RollingStats):
+            same_month_avg = month_data.mean
+        else:
+            same_month_avg = statistics.mean(month_data)
         
         if same_month_avg > 0:
             deviation = abs(current_consumption - same_month_avg) / same_month_avg * 100
@@ -2,8 +2,11 @@
 Periodic Physical Inspection Module
 6 aylık fiziksel kontrol yönetimi
 """
+import heapq
 import logging
-from typing import Dict, List, Optional
+from bisect import bisect_left
+from itertools import count
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -22,6 +25,19 @@ class InspectionStatus(Enum):
 
 class InspectionResult:
     """Kontrol sonucu"""
+    # Geçmiş sonuçlar bellekte çok sayıda tutulabilir; örnek başına __dict__ yok
+    __slots__ = (
+        "inspection_id",
+        "user_address",
+        "inspector_wallet",
+        "reported_reading",
+        "actual_reading",
+        "fraud_found",
+        "notes",
+        "reading_difference",
+        "completed_at",
+    )
+    
     def __init__(
         self,
         inspection_id: int,
@@ -69,12 +85,21 @@ class PeriodicInspectionManager:
     INSPECTION_INTERVAL_DAYS = 180  # 6 ay
     PRIORITY_INTERVAL_DAYS = 30     # Fraud uyarısı alanlar için 1 ay
     
+    # Tolerans üstü fark için ciddiyet kademeleri (%, karşılaştırma ">")
+    SEVERITY_THRESHOLDS = (20, 50)
+    SEVERITY_LEVELS = ("minor", "major", "critical")
+    
     def __init__(self):
         # Inspector whitelist (in-memory, production'da DB'den gelir)
         self.inspector_whitelist: set = set()
         
-        # Pending inspections queue
-        self.inspection_queue: List[Dict] = []
+        # Pending inspections queue - min-heap:
+        # (-priority, -days_overdue, sıra, user_address, priority_info)
+        self.inspection_queue: List[Tuple] = []
+        # Kullanıcının kuyruktaki geçerli kaydının sırası; öncelik
+        # güncellenince eski heap kaydı silinmez, pop sırasında atlanır
+        self._queued_entries: Dict[str, int] = {}
+        self._queue_sequence = count()
     
     def add_inspector_to_whitelist(self, wallet_address: str) -> bool:
         """
@@ -101,19 +126,29 @@ class PeriodicInspectionManager:
     def is_inspector_authorized(self, wallet_address: str) -> bool:
         """
         Inspector yetkili mi kontrol et
+        
+        Whitelist küçük harfle tutulur; JWT'den gelen adresler zaten
+        küçük harf olduğundan önce adresin kendisi denenir ve .lower()
+        kopyası yalnızca checksum'lı (karışık harfli) girdide üretilir.
         """
-        return wallet_address.lower() in self.inspector_whitelist
+        whitelist = self.inspector_whitelist
+        return wallet_address in whitelist or wallet_address.lower() in whitelist
     
     def get_inspection_priority(
         self,
         user_address: str,
         last_inspection_date: Optional[datetime],
         fraud_warning_count: int = 0,
-        fraud_score: int = 0
+        fraud_score: int = 0,
+        now: Optional[datetime] = None
     ) -> Dict:
         """
         Kullanıcının kontrol önceliğini hesapla
         
+        Args:
+            now: Karşılaştırma zamanı (toplu taramada bir kez alınıp
+                tüm kullanıcılara geçirilir)
+        
         Returns:
             {
                 "priority": int (1-5, 5 = en yüksek),
@@ -121,8 +156,6 @@ class PeriodicInspectionManager:
                 "reason": str
             }
         """
-        now = datetime.utcnow()
-        
         # Hiç kontrol yapılmamış
         if not last_inspection_date:
             return {
@@ -131,6 +164,8 @@ class PeriodicInspectionManager:
                 "reason": "Hiç kontrol yapılmamış"
             }
         
+        if now is None:
+            now = datetime.utcnow()
         days_since_inspection = (now - last_inspection_date).days
         
         # Fraud uyarısı varsa yüksek öncelik
@@ -173,6 +208,43 @@ class PeriodicInspectionManager:
             "reason": f"Kontrol zamanına {days_until} gün var"
         }
     
+    def enqueue_inspection(self, user_address: str, priority_info: Dict) -> None:
+        """
+        Kullanıcıyı kontrol kuyruğuna ekle ya da önceliğini güncelle
+        
+        Args:
+            user_address: Kullanıcı adresi
+            priority_info: get_inspection_priority sonucu
+        """
+        sequence = next(self._queue_sequence)
+        self._queued_entries[user_address] = sequence
+        heapq.heappush(self.inspection_queue, (
+            -priority_info["priority"],
+            -priority_info["days_overdue"],
+            sequence,
+            user_address,
+            priority_info
+        ))
+    
+    def pop_next_inspection(self) -> Optional[Dict]:
+        """
+        En öncelikli kontrolü kuyruktan al (O(log N))
+        
+        Öncelik sırası: priority, sonra gecikme günü, sonra ekleme sırası.
+        
+        Returns:
+            {"user_address": str, "priority": int, "days_overdue": int, "reason": str}
+            ya da kuyruk boşsa None
+        """
+        queue = self.inspection_queue
+        while queue:
+            _, _, sequence, user_address, priority_info = heapq.heappop(queue)
+            # Sonradan güncellenmiş kullanıcının eski kaydı atlanır
+            if self._queued_entries.get(user_address) == sequence:
+                del self._queued_entries[user_address]
+                return {"user_address": user_address, **priority_info}
+        return None
+    
     def validate_inspection_result(
         self,
         reported_reading: int,
@@ -212,12 +284,8 @@ class PeriodicInspectionManager:
             }
         
         # Ciddiyet belirleme
-        if diff_percent > 50:
-            severity = "critical"
-        elif diff_percent > 20:
-            severity = "major"
-        elif diff_percent > tolerance_percent:
-            severity = "minor"
+        if diff_percent > tolerance_percent:
+            severity = self.SEVERITY_LEVELS[bisect_left(self.SEVERITY_THRESHOLDS, diff_percent)]
         else:
             severity = "none"
         
@@ -259,6 +327,47 @@ class PeriodicInspectionManager:
             "interest": interest,
             "total": base_amount + interest
         }
+    
+    def calculate_penalties(
+        self,
+        differences: List[int],
+        months_late: List[int],
+        unit_price: float = 10.0,
+        interest_rate: float = 0.05
+    ) -> Dict[str, List[float]]:
+        """
+        Toplu ceza hesabı (dönemsel faturalama)
+        
+        Kullanıcı başına sözlük yerine sütun listeleri döner; her değer
+        calculate_penalty ile aynı formülle hesaplanır.
+        
+        Args:
+            differences: Kullanıcı başına tüketim farkı (m³)
+            months_late: Kullanıcı başına gecikme ay sayısı (aynı sırada)
+            unit_price: Birim fiyat
+            interest_rate: Aylık faiz oranı
+            
+        Returns:
+            {
+                "base_amount": [float, ...],
+                "interest": [float, ...],
+                "total": [float, ...]
+            }
+        """
+        if len(differences) != len(months_late):
+            raise ValueError("differences ve months_late aynı uzunlukta olmalı")
+        
+        base_amounts = [difference * unit_price for difference in differences]
+        interests = [
+            base_amount * interest_rate * months
+            for base_amount, months in zip(base_amounts, months_late)
+        ]
+        
+        return {
+            "base_amount": base_amounts,
+            "interest": interests,
+            "total": [base + interest for base, interest in zip(base_amounts, interests)]
+        }
 
 
 # Global instance
@@ -4,8 +4,10 @@ import os
 # Add current directory to path so we can import modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database.db import engine
-from sqlalchemy import text, inspect
+from database.db import engine, Base
+from database.models import WalletAddress, USER_ROLE_CODES, RISK_LEVEL_CODES, updated_at_trigger_ddl, HOT_UPDATE_TABLES, fillfactor_ddl
+from sqlalchemy import text, inspect, Index
+from sqlalchemy.schema import DropIndex
 
 def migrate():
     inspector = inspect(engine)
@@ -19,21 +21,367 @@ def migrate():
         ('water_fraud_warnings_remaining', 'INTEGER DEFAULT 2'),
     ]
     
+    missing = []
+    for col_name, col_type in columns_to_add:
+        if col_name in columns:
+            print(f"Column '{col_name}' already exists. Skipping.")
+        else:
+            print(f"Column '{col_name}' not found. Adding it...")
+            missing.append((col_name, col_type))
+    
     with engine.connect() as conn:
-        for col_name, col_type in columns_to_add:
-            if col_name not in columns:
-                print(f"Column '{col_name}' not found. Adding it...")
-                try:
-                    conn.execute(text(f"ALTER TABLE users ADD COLUMN {col_name} {col_type}"))
-                    conn.commit()
-                    print(f"  Added '{col_name}' successfully.")
-                except Exception as e:
-                    print(f"  Error adding '{col_name}': {e}")
-            else:
-                print(f"Column '{col_name}' already exists. Skipping.")
+        if missing:
+            add_user_columns(conn, missing)
+        
+        migrate_fraud_report_anomalies(conn, inspector)
+        migrate_wallet_columns(conn, inspector)
+        migrate_small_int_enums(conn, inspector)
+        migrate_user_references(conn, inspector)
+        migrate_scaled_amounts(conn, inspector)
+        migrate_updated_at_triggers(conn, inspector)
+        migrate_fillfactor(conn, inspector)
+        migrate_indexes(conn, inspector)
     
     print("\nMigration complete!")
 
+
+def add_user_columns(conn, missing):
+    """Eksik users kolonlarini ekle (MySQL/Postgres: tek ALTER TABLE)"""
+    if engine.dialect.name == 'sqlite':
+        # SQLite tek ifadede birden fazla ADD COLUMN desteklemiyor
+        for col_name, col_type in missing:
+            try:
+                conn.execute(text(f"ALTER TABLE users ADD COLUMN {col_name} {col_type}"))
+                conn.commit()
+                print(f"  Added '{col_name}' successfully.")
+            except Exception as e:
+                conn.rollback()
+                print(f"  Error adding '{col_name}': {e}")
+        return
+    
+    # Tek kilit alimi ve tek tablo yeniden yazimi; hepsi eklenir ya da hicbiri
+    additions = ', '.join(f"ADD COLUMN {col_name} {col_type}" for col_name, col_type in missing)
+    names = ', '.join(f"'{col_name}'" for col_name, _ in missing)
+    try:
+        conn.execute(text(f"ALTER TABLE users {additions}"))
+        conn.commit()
+        print(f"  Added {names} successfully.")
+    except Exception as e:
+        conn.rollback()
+        print(f"  Error adding {names}: {e}")
+
+
+def migrate_fraud_report_anomalies(conn, inspector):
+    """fraud_reports.anomalies: TEXT -> JSONB (Postgres) / JSON (MySQL)"""
+    if 'fraud_reports' not in inspector.get_table_names():
+        return
+    
+    dialect = engine.dialect.name
+    if dialect == 'postgresql':
+        statements = [
+            "ALTER TABLE fraud_reports ALTER COLUMN anomalies TYPE JSONB USING anomalies::jsonb",
+            "CREATE INDEX IF NOT EXISTS idx_fraud_report_anomalies_gin "
+            "ON fraud_reports USING gin (anomalies jsonb_path_ops)",
+        ]
+    elif dialect == 'mysql':
+        statements = ["ALTER TABLE fraud_reports MODIFY anomalies JSON NULL"]
+    else:
+        # SQLite JSON'u TEXT olarak saklar, mevcut veri zaten uyumlu
+        return
+    
+    print("Converting 'fraud_reports.anomalies' to JSON...")
+    try:
+        for statement in statements:
+            conn.execute(text(statement))
+        conn.commit()
+        print("  Converted 'anomalies' successfully.")
+    except Exception as e:
+        conn.rollback()
+        print(f"  Error converting 'anomalies': {e}")
+
+
+# WalletAddress tipini kullanan (tablo, kolon) ciftleri (Postgres'te BYTEA)
+WALLET_COLUMNS = [
+    (table.name, column.name)
+    for table in Base.metadata.sorted_tables
+    for column in table.columns
+    if isinstance(column.type, WalletAddress)
+]
+
+# Adresler 20 byte'a, adres olmayan isaret degerleri ("ADMIN", "unknown")
+# UTF-8 byte'larina cevrilir; 20 byte'lik metne NUL eklenir (WalletAddress ile ayni)
+_WALLET_TO_BYTEA = (
+    "CASE WHEN {col} ~ '^0[xX][0-9a-fA-F]{{40}}$' THEN decode(substring({col} from 3), 'hex') "
+    "WHEN octet_length({col}) = 20 THEN convert_to({col}, 'UTF8') || '\\x00'::bytea "
+    "ELSE convert_to({col}, 'UTF8') END"
+)
+
+
+def migrate_wallet_columns(conn, inspector):
+    """
+    Cuzdan kolonlari: Postgres'te VARCHAR(42) -> BYTEA,
+    diger dialect'lerde mevcut adresler kucuk harfe cevrilir
+    """
+    dialect = engine.dialect.name
+    existing = set(inspector.get_table_names())
+    for table, column in WALLET_COLUMNS:
+        if table not in existing:
+            continue
+        col_type = next((c['type'] for c in inspector.get_columns(table) if c['name'] == column), None)
+        if col_type is None:
+            continue
+        
+        if dialect == 'postgresql':
+            if col_type.python_type is bytes:
+                print(f"'{table}.{column}' already BYTEA. Skipping.")
+                continue
+            print(f"Converting '{table}.{column}' to BYTEA...")
+            statement = (
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BYTEA "
+                f"USING {_WALLET_TO_BYTEA.format(col=column)}"
+            )
+        else:
+            print(f"Lowercasing wallet addresses in '{table}.{column}'...")
+            statement = (
+                f"UPDATE {table} SET {column} = LOWER({column}) "
+                f"WHERE {column} LIKE '0x%' AND {column} <> LOWER({column})"
+            )
+        
+        try:
+            conn.execute(text(statement))
+            conn.commit()
+            print(f"  Migrated '{table}.{column}' successfully.")
+        except Exception as e:
+            conn.rollback()
+            print(f"  Error migrating '{table}.{column}': {e}")
+
+
+def _code_case(column, mapping):
+    """Eski string degerleri SMALLINT kodlarina ceviren CASE ifadesi"""
+    whens = []
+    for value, code in mapping.items():
+        names = {value.name, value.value} if hasattr(value, 'name') else {value}
+        whens.extend(f"WHEN '{name}' THEN {code}" for name in sorted(names))
+    return f"CASE {column} {' '.join(whens)} END"
+
+
+def migrate_small_int_enums(conn, inspector):
+    """users.role ve fraud_reports.risk_level: string/ENUM -> SMALLINT kodu"""
+    dialect = engine.dialect.name
+    existing = set(inspector.get_table_names())
+    targets = [('users', 'role', USER_ROLE_CODES), ('fraud_reports', 'risk_level', RISK_LEVEL_CODES)]
+    
+    for table, column, mapping in targets:
+        if table not in existing:
+            continue
+        col_type = next(c['type'] for c in inspector.get_columns(table) if c['name'] == column)
+        if col_type.python_type is int:
+            print(f"'{table}.{column}' already SMALLINT. Skipping.")
+            continue
+        
+        case = _code_case(f"{column}::text" if dialect == 'postgresql' else column, mapping)
+        if dialect == 'postgresql':
+            statements = [f"ALTER TABLE {table} ALTER COLUMN {column} TYPE SMALLINT USING {case}"]
+            if column == 'role':
+                statements.append("DROP TYPE IF EXISTS userrole")
+        elif dialect == 'mysql':
+            statements = [
+                f"ALTER TABLE {table} MODIFY {column} VARCHAR(32) NOT NULL",
+                f"UPDATE {table} SET {column} = {case}",
+                f"ALTER TABLE {table} MODIFY {column} SMALLINT NOT NULL",
+            ]
+        else:
+            # SQLite: kolon tipi esnek, sadece degerleri kodla
+            statements = [f"UPDATE {table} SET {column} = {case} WHERE {column} NOT GLOB '[0-9]*'"]
+        
+        print(f"Converting '{table}.{column}' to SMALLINT codes...")
+        try:
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.commit()
+            print(f"  Converted '{table}.{column}' successfully.")
+        except Exception as e:
+            conn.rollback()
+            print(f"  Error converting '{table}.{column}': {e}")
+
+
+# Wallet string'i yerine users.id tutan kolonlar: (tablo, eski kolon, yeni kolon)
+USER_REFERENCE_COLUMNS = [
+    ('water_meter_readings', 'validated_by', 'validated_by_id'),
+    ('recycling_submissions', 'validated_by', 'validated_by_id'),
+    ('penalty_records', 'created_by', 'created_by_id'),
+]
+
+
+def migrate_user_references(conn, inspector):
+    """validated_by / created_by: wallet VARCHAR(42) -> users.id INTEGER FK"""
+    dialect = engine.dialect.name
+    existing = set(inspector.get_table_names())
+    if 'users' not in existing:
+        return
+    # Taze inspector: wallet kolonu bu calismada BYTEA'ya cevrilmis olabilir
+    wallet_type = next(c['type'] for c in inspect(engine).get_columns('users') if c['name'] == 'wallet_address')
+    
+    for table_name, old_col, new_col in USER_REFERENCE_COLUMNS:
+        if table_name not in existing:
+            continue
+        columns = [c['name'] for c in inspector.get_columns(table_name)]
+        if new_col in columns and old_col not in columns:
+            print(f"'{table_name}.{new_col}' already exists. Skipping.")
+            continue
+        
+        # users.wallet_address Postgres'te BYTEA olabilir
+        if wallet_type.python_type is bytes:
+            wallet_expr = f"decode(substring(lower({table_name}.{old_col}) from 3), 'hex')"
+        else:
+            wallet_expr = f"lower({table_name}.{old_col})"
+        
+        statements = []
+        if new_col not in columns:
+            statements.append(f"ALTER TABLE {table_name} ADD COLUMN {new_col} INTEGER NULL")
+            if dialect != 'sqlite':
+                # SQLite mevcut tabloya sonradan constraint eklemeyi desteklemiyor
+                statements.append(
+                    f"ALTER TABLE {table_name} ADD CONSTRAINT fk_{table_name}_{new_col} "
+                    f"FOREIGN KEY ({new_col}) REFERENCES users (id)"
+                )
+            statements.append(f"CREATE INDEX ix_{table_name}_{new_col} ON {table_name} ({new_col})")
+        if old_col in columns:
+            statements.extend([
+                f"UPDATE {table_name} SET {new_col} = "
+                f"(SELECT users.id FROM users WHERE users.wallet_address = {wallet_expr}) "
+                f"WHERE {old_col} IS NOT NULL",
+                f"ALTER TABLE {table_name} DROP COLUMN {old_col}",
+            ])
+        
+        print(f"Converting '{table_name}.{old_col}' to '{new_col}'...")
+        try:
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.commit()
+            print(f"  Converted '{table_name}.{old_col}' successfully.")
+        except Exception as e:
+            conn.rollback()
+            print(f"  Error converting '{table_name}.{old_col}': {e}")
+
+
+# Float -> tam sayi alt birim kolonlari: (tablo, eski kolon, yeni kolon, carpan)
+SCALED_AMOUNT_COLUMNS = [
+    ('water_meter_readings', 'consumption_m3', 'consumption_milli_m3', 1000),
+    ('water_meter_readings', 'bill_amount', 'bill_amount_kurus', 100),
+    ('recycling_submissions', 'amount_kg', 'amount_g', 1000),
+    ('user_deposits', 'deposit_amount', 'deposit_amount_kurus', 100),
+    ('penalty_records', 'penalty_amount', 'penalty_amount_kurus', 100),
+]
+
+
+def migrate_scaled_amounts(conn, inspector):
+    """Miktar/tutar kolonlari: FLOAT -> INTEGER (milli-m3, kurus, gram)"""
+    dialect = engine.dialect.name
+    existing = set(inspector.get_table_names())
+    
+    for table_name, old_col, new_col, scale in SCALED_AMOUNT_COLUMNS:
+        if table_name not in existing:
+            continue
+        columns = [c['name'] for c in inspector.get_columns(table_name)]
+        if old_col not in columns:
+            print(f"'{table_name}.{new_col}' already exists. Skipping.")
+            continue
+        
+        statements = []
+        if new_col not in columns:
+            statements.append(f"ALTER TABLE {table_name} ADD COLUMN {new_col} INTEGER NULL")
+        statements.append(f"UPDATE {table_name} SET {new_col} = ROUND({old_col} * {scale})")
+        if dialect == 'postgresql':
+            statements.append(f"ALTER TABLE {table_name} ALTER COLUMN {new_col} SET NOT NULL")
+        elif dialect == 'mysql':
+            statements.append(f"ALTER TABLE {table_name} MODIFY {new_col} INTEGER NOT NULL")
+        statements.append(f"ALTER TABLE {table_name} DROP COLUMN {old_col}")
+        
+        print(f"Converting '{table_name}.{old_col}' to '{new_col}'...")
+        try:
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.commit()
+            print(f"  Converted '{table_name}.{old_col}' successfully.")
+        except Exception as e:
+            conn.rollback()
+            print(f"  Error converting '{table_name}.{old_col}': {e}")
+
+
+def migrate_updated_at_triggers(conn, inspector):
+    """Mevcut tablolara updated_at trigger'larini kur (model'de onupdate yok)"""
+    existing = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing or 'updated_at' not in table.c:
+            continue
+        try:
+            for statement in updated_at_trigger_ddl(table.name, engine.dialect.name):
+                conn.exec_driver_sql(statement)
+            conn.commit()
+            print(f"updated_at trigger installed on '{table.name}'.")
+        except Exception as e:
+            conn.rollback()
+            print(f"  Error installing trigger on '{table.name}': {e}")
+
+
+def migrate_fillfactor(conn, inspector):
+    """Sik guncellenen tablolarda fillfactor ayari (sadece Postgres, yeni sayfalara etki eder)"""
+    existing = set(inspector.get_table_names())
+    for table_name in HOT_UPDATE_TABLES:
+        statements = fillfactor_ddl(table_name, engine.dialect.name)
+        if table_name not in existing or not statements:
+            continue
+        try:
+            for statement in statements:
+                conn.exec_driver_sql(statement)
+            conn.commit()
+            print(f"fillfactor set on '{table_name}'.")
+        except Exception as e:
+            conn.rollback()
+            print(f"  Error setting fillfactor on '{table_name}': {e}")
+
+
+# Model'den kaldirilan index'ler
+OBSOLETE_INDEXES = {
+    'fraud_reports': [
+        'ix_fraud_reports_wallet_address',
+        'idx_fraud_report_wallet',
+        'idx_fraud_report_score',
+        'idx_fraud_report_confirmed',
+        'idx_fraud_report_created',
+    ],
+    'water_meter_readings': [
+        'ix_water_meter_readings_wallet_address',
+        'idx_created_at',
+    ],
+}
+
+
+def migrate_indexes(conn, inspector):
+    """Eski index'leri dusur, model'de tanimli eksik index'leri olustur"""
+    existing = set(inspector.get_table_names())
+    for table_name, obsolete in OBSOLETE_INDEXES.items():
+        if table_name not in existing:
+            continue
+        table = Base.metadata.tables[table_name]
+        present = {ix['name'] for ix in inspector.get_indexes(table_name)}
+        try:
+            for name in obsolete:
+                if name in present:
+                    conn.execute(DropIndex(Index(name, table.c.id)))
+                    print(f"Dropped index '{name}'.")
+            for index in table.indexes:
+                if index.name not in present:
+                    # ddl_if ile dialect'e ozel index'ler burada atlanabilir
+                    index.create(conn, checkfirst=True)
+                    if engine.dialect.has_index(conn, table_name, index.name):
+                        print(f"Created index '{index.name}'.")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"  Error migrating indexes on '{table_name}': {e}")
+
 if __name__ == "__main__":
     try:
         migrate()
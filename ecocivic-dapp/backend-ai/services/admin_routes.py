@@ -93,13 +93,15 @@ def system_statistics():
     try:
         with get_db() as db:
             # En çok geri dönüşüm yapanlar (top 5)
+            # Toplama gram (tam sayi) uzerinden, kg'a cevirme Python tarafinda
+            total_g = func.sum(RecyclingSubmission.amount_g)
             top_recyclers_query = db.query(
                 RecyclingSubmission.wallet_address,
-                func.sum(RecyclingSubmission.amount_kg).label('total_amount')
-            ).group_by(RecyclingSubmission.wallet_address).order_by(func.sum(RecyclingSubmission.amount_kg).desc()).limit(5).all()
+                total_g.label('total_amount')
+            ).group_by(RecyclingSubmission.wallet_address).order_by(total_g.desc()).limit(5).all()
             
             top_recyclers = [
-                {"wallet": r[0], "total_amount": r[1]} for r in top_recyclers_query
+                {"wallet": r[0], "total_amount": r[1] / 1000} for r in top_recyclers_query
             ]
             
             return jsonify({
@@ -0,0 +1,116 @@
+"""
+Material Multiplier Cache
+material_multipliers tablosunun süreç içi önbelleği
+
+Tablo çok küçük (5 satır) ve her ödül hesaplamasında okunur; bu yüzden
+ilk kullanımda bir kez yüklenir, sonrasında ödül yolu sadece dict lookup yapar.
+MaterialMultiplier satırı eklenince/güncellenince/silinince önbellek
+geçersiz kılınır ve bir sonraki okumada yeniden yüklenir.
+"""
+import logging
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from database.db import get_db
+from database.models import MaterialMultiplier, DEFAULT_MATERIAL_MULTIPLIERS
+
+logger = logging.getLogger(__name__)
+
+# material_type -> (multiplier, base_token_rate)
+# Yerinde değiştirilmez; yeniden yüklemede yeni dict tek atamayla yerine
+# konur, böylece eşzamanlı okuyucular hiçbir zaman yarım/boş tablo görmez.
+# None: henüz yüklenmedi veya geçersiz kılındı.
+_multiplier_cache: Optional[Dict[str, Tuple[float, int]]] = None
+
+
+def _defaults() -> Dict[str, Tuple[float, int]]:
+    return {
+        material: (data["multiplier"], data["base_rate"])
+        for material, data in DEFAULT_MATERIAL_MULTIPLIERS.items()
+    }
+
+
+def load_multiplier_cache(db=None) -> Dict[str, Tuple[float, int]]:
+    """
+    Aktif çarpanları tek sorguda önbelleğe yükle.
+    Tablo boşsa DEFAULT_MATERIAL_MULTIPLIERS önbelleğe alınır. Tablo
+    okunamıyorsa varsayılanlar döner ama önbelleğe alınmaz; bir sonraki
+    okuma tabloyu yeniden dener.
+    """
+    global _multiplier_cache
+
+    try:
+        if db is None:
+            with get_db() as session:
+                rows = _fetch_active(session)
+        else:
+            rows = _fetch_active(db)
+    except Exception as e:
+        logger.warning(f"Material multipliers could not be loaded, using defaults: {e}")
+        return _defaults()
+
+    cache = {material: (float(multiplier), int(rate)) for material, multiplier, rate in rows}
+    _multiplier_cache = cache or _defaults()
+    return _multiplier_cache
+
+
+def _fetch_active(db):
+    return db.query(
+        MaterialMultiplier.material_type,
+        MaterialMultiplier.multiplier,
+        MaterialMultiplier.base_token_rate,
+    ).filter(MaterialMultiplier.is_active == True).order_by(MaterialMultiplier.id).all()
+
+
+def invalidate_multiplier_cache():
+    """Önbelleği boşalt; bir sonraki okuma tabloyu yeniden yükler"""
+    global _multiplier_cache
+    _multiplier_cache = None
+
+
+def get_material_multipliers() -> Dict[str, Tuple[float, int]]:
+    """
+    Aktif materyaller: material_type -> (multiplier, base_token_rate)
+    Dönen dict paylaşılır, değiştirilmemelidir.
+    """
+    cache = _multiplier_cache
+    if cache is None:
+        cache = load_multiplier_cache()
+    return cache
+
+
+def get_material_multiplier(material_type: str) -> Optional[Tuple[float, int]]:
+    """
+    Materyal için (multiplier, base_token_rate) döndür, bilinmiyorsa None
+    """
+    return get_material_multipliers().get(material_type)
+
+
+def get_token_rate(material_type: str) -> int:
+    """Materyal için birim başına token oranı (bilinmiyorsa 0)"""
+    entry = get_material_multiplier(material_type)
+    return entry[1] if entry else 0
+
+
+@event.listens_for(MaterialMultiplier, "after_insert")
+@event.listens_for(MaterialMultiplier, "after_update")
+@event.listens_for(MaterialMultiplier, "after_delete")
+def _on_multiplier_change(mapper, connection, target):
+    # Flush anında değil commit sonrası boşalt; aksi halde araya giren bir
+    # okuma commit edilmemiş eski değerleri yeniden önbelleğe alabilir
+    session = object_session(target)
+    if session is not None:
+        session.info["material_multipliers_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _on_commit(session):
+    if session.info.pop("material_multipliers_changed", False):
+        invalidate_multiplier_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_rollback(session):
+    session.info.pop("material_multipliers_changed", None)
@@ -12,18 +12,10 @@ import logging
 from database.db import get_db
 from database.models import RecyclingDeclaration, User
 from config import QR_TOKEN_EXPIRY_HOURS
+from services.material_multipliers import get_token_rate
 
 logger = logging.getLogger(__name__)
 
-# Ödül oranları (BELT/birim)
-REWARD_RATES = {
-    "plastic": 10,   # BELT per kg
-    "glass": 12,     # BELT per kg
-    "metal": 15,     # BELT per kg
-    "paper": 8,      # BELT per kg
-    "electronic": 25 # BELT per adet
-}
-
 
 class RecyclingDeclarationService:
     """Çoklu atık türü beyanı servisi"""
@@ -74,11 +66,11 @@ class RecyclingDeclarationService:
         
         # Toplam ödülü hesapla
         total_reward = (
-            plastic_kg * REWARD_RATES["plastic"] +
-            glass_kg * REWARD_RATES["glass"] +
-            metal_kg * REWARD_RATES["metal"] +
-            paper_kg * REWARD_RATES["paper"] +
-            electronic_count * REWARD_RATES["electronic"]
+            plastic_kg * get_token_rate("plastic") +
+            glass_kg * get_token_rate("glass") +
+            metal_kg * get_token_rate("metal") +
+            paper_kg * get_token_rate("paper") +
+            electronic_count * get_token_rate("electronic")
         )
         
         # QR token oluştur
@@ -5,6 +5,7 @@ Geri dönüşüm doğrulama ve ödül hesaplama servisi
 """
 from typing import Dict, Optional, Tuple
 from services.qr_service import verify_qr_token
+from services.material_multipliers import get_material_multipliers, get_token_rate
 from enum import Enum
 
 
@@ -17,14 +18,8 @@ class WasteType(Enum):
     ELECTRONIC = "electronic" # Elektronik - 25 token/adet
 
 
-# Token rates per kg (elektronik için adet)
-TOKEN_RATES: Dict[str, int] = {
-    "plastic": 10,      # 10 token/kg
-    "glass": 12,        # 12 token/kg
-    "metal": 15,        # 15 token/kg
-    "paper": 8,         # 8 token/kg
-    "electronic": 25,   # 25 token/adet
-}
+# Token oranları (kg başına, elektronik için adet) material_multipliers
+# tablosundan okunur; bkz. services.material_multipliers
 
 # Alt kategoriler (doğru etiketleme kontrolü için)
 SUBCATEGORIES: Dict[str, list] = {
@@ -35,9 +30,6 @@ SUBCATEGORIES: Dict[str, list] = {
     "electronic": ["pcb", "battery", "cable", "phone", "small_appliance"],
 }
 
-# Geçerli atık türleri listesi
-VALID_WASTE_TYPES = list(TOKEN_RATES.keys())
-
 
 def validate_waste_type(waste_type: str) -> Tuple[bool, Optional[str]]:
     """
@@ -50,8 +42,9 @@ def validate_waste_type(waste_type: str) -> Tuple[bool, Optional[str]]:
         return False, "Atık türü belirtilmedi"
     
     normalized = waste_type.lower().strip()
-    if normalized not in VALID_WASTE_TYPES:
-        return False, f"Geçersiz atık türü: {waste_type}. Geçerli türler: {', '.join(VALID_WASTE_TYPES)}"
+    valid_types = get_material_multipliers()
+    if normalized not in valid_types:
+        return False, f"Geçersiz atık türü: {waste_type}. Geçerli türler: {', '.join(valid_types)}"
     
     return True, None
 
@@ -90,7 +83,7 @@ def calculate_token_reward(waste_type: str, amount: float) -> int:
         Token miktarı
     """
     normalized = waste_type.lower().strip()
-    rate = TOKEN_RATES.get(normalized, 0)
+    rate = get_token_rate(normalized)
     
     if rate == 0 or amount <= 0:
         return 0
@@ -188,7 +181,7 @@ def validate_recycling_submission(
     
     # Calculate reward
     reward_amount = calculate_token_reward(material_type, base_amount)
-    token_rate = TOKEN_RATES.get(material_type.lower(), 0)
+    token_rate = get_token_rate(material_type.lower())
     
     return {
         "valid": True,
@@ -209,7 +202,7 @@ def get_all_waste_types() -> Dict[str, dict]:
     Tüm atık türlerini ve token oranlarını getir
     """
     result = {}
-    for waste_type, rate in TOKEN_RATES.items():
+    for waste_type, (_, rate) in get_material_multipliers().items():
         result[waste_type] = {
             "token_rate": rate,
             "unit": "adet" if waste_type == "electronic" else "kg",
@@ -0,0 +1,9 @@
+"""
+Pytest ayarları
+Testler backend-ai kökünden (`python -m pytest tests`) veya doğrudan
+`pytest` ile çalıştırılabilsin diye kök dizin import yoluna eklenir.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
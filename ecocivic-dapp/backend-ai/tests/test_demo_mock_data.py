@@ -0,0 +1,47 @@
+"""
+demo_mock_data testleri
+Önbellekli ve modül seviyesindeki demo verisi iç içe salt okunur olmalı.
+"""
+import json
+
+import pytest
+
+import demo_mock_data as demo
+
+
+@pytest.mark.parametrize("data", [
+    demo.demo_anomaly_signals(),
+    demo.demo_api_responses(),
+    demo.demo_qr_data(),
+    demo.DEMO_USERS,
+    demo.DEMO_WATER_READINGS,
+    demo.DEMO_ADMIN_STATS,
+])
+def test_nested_data_is_read_only(data):
+    def walk(value):
+        if isinstance(value, tuple):
+            for item in value:
+                walk(item)
+        elif hasattr(value, "items"):
+            with pytest.raises(TypeError):
+                value["__test__"] = 1
+            for item in value.values():
+                walk(item)
+        else:
+            assert not isinstance(value, (list, dict, set))
+
+    walk(data)
+
+
+def test_readings_list_cannot_be_mutated():
+    readings = demo.get_demo_reading_scenario("normal")["readings"]
+    with pytest.raises(AttributeError):
+        readings.append({"month": "2026-02"})
+    with pytest.raises(TypeError):
+        readings[0]["consumption"] = 0
+
+
+def test_api_response_json_round_trips():
+    body = json.loads(demo.demo_api_response_json("/api/recycling/declare_success"))
+    assert body["qr_data"]["declared_types"][0]["type"] == "plastic"
+    assert body["qr_data"]["hash"].startswith("sha256:")
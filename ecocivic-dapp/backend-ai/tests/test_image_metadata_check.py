@@ -0,0 +1,69 @@
+"""
+ImageMetadataChecker EXIF çıkarma testleri
+"""
+import struct
+from io import BytesIO
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from fraud_detection.image_metadata_check import ImageMetadataChecker
+
+EXPECTED_EXIF = {"Make": "Canon", "Model": "EOS", "Software": "Adobe Photoshop", "ExifTagCount": 3}
+
+
+def _png_chunks(data):
+    chunks, pos = [], 8
+    while pos < len(data):
+        length = struct.unpack(">I", data[pos:pos + 4])[0]
+        chunks.append((data[pos + 4:pos + 8], data[pos:pos + 12 + length]))
+        pos += 12 + length
+    return chunks
+
+
+def _png_with_exif():
+    exif = Image.Exif()
+    exif[0x010F] = "Canon"
+    exif[0x0110] = "EOS"
+    exif[0x0131] = "Adobe Photoshop"
+    buffer = BytesIO()
+    Image.new("RGB", (32, 32), (10, 200, 30)).save(buffer, "PNG", exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def _reorder(data, exif_position):
+    """eXIf chunk'ını IDAT'tan önce/sonra yerleştir ya da ("none") çıkar"""
+    chunks = _png_chunks(data)
+    exif = [chunk for kind, chunk in chunks if kind == b"eXIf"]
+    rest = [chunk for kind, chunk in chunks if kind != b"eXIf"]
+    head, iend = rest[:-1], rest[-1]
+    if exif_position == "none":
+        return data[:8] + b"".join(rest)
+    if exif_position == "after_idat":
+        return data[:8] + b"".join(head) + exif[0] + iend
+    return data[:8] + rest[0] + exif[0] + b"".join(head[1:]) + iend
+
+
+@pytest.mark.parametrize("position", ["before_idat", "after_idat"])
+def test_png_exif_is_read_wherever_the_chunk_is(position):
+    data = _reorder(_png_with_exif(), position)
+
+    assert ImageMetadataChecker().extract_exif(data) == EXPECTED_EXIF
+
+
+def test_png_exif_after_idat_from_file_path(tmp_path):
+    path = tmp_path / "late_exif.png"
+    path.write_bytes(_reorder(_png_with_exif(), "after_idat"))
+
+    assert ImageMetadataChecker().extract_exif(str(path)) == EXPECTED_EXIF
+
+
+def test_png_without_exif_returns_empty():
+    assert ImageMetadataChecker().extract_exif(_reorder(_png_with_exif(), "none")) == {}
+
+
+def test_truncated_png_after_idat_returns_empty():
+    data = _reorder(_png_with_exif(), "none")
+
+    assert ImageMetadataChecker().extract_exif(data[:-12]) == {}
@@ -0,0 +1,87 @@
+"""
+AnomalySignalDetector toplu / seri API testleri
+Toplu ve seri giriş noktaları tekil puanlama yolu ile aynı sonucu vermeli.
+"""
+import pytest
+
+from fraud_detection.ml_fraud_detector import AnomalySignalDetector
+
+HISTORIES = [
+    [],
+    [15.0],
+    [15.0, 16.0],
+    [20.0, 20.0, 20.0],                 # sıfır std
+    [0.1, 0.1, 0.1, 0.1],               # sıfır std, ikilik tabanda tam değil
+    [0, 0, 0],                          # sıfır ortalama
+    [40, 35, 30, 25, 20, 15],           # düşüş trendi
+    [10.5, 11.2, 9.8, 10.1, 55.0, 10.4, 10.0, 9.9, 10.3, 10.6, 11.0, 10.2],
+]
+CURRENTS = [0, 3, 10, 20, 80]
+
+
+def test_score_batch_matches_per_item_score():
+    detector = AnomalySignalDetector()
+    currents = [current for _ in HISTORIES for current in CURRENTS]
+    histories = [list(history) for history in HISTORIES for _ in CURRENTS]
+
+    batch = detector.calculate_anomaly_score_batch(currents, histories)
+
+    assert len(batch) == len(currents)
+    for result, current, history in zip(batch, currents, histories):
+        assert result == detector.calculate_anomaly_score(current, history)
+
+
+def test_score_batch_empty():
+    assert AnomalySignalDetector().calculate_anomaly_score_batch([], []) == []
+
+
+def test_score_batch_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        AnomalySignalDetector().calculate_anomaly_score_batch([1, 2], [[1, 2, 3]])
+
+
+# Sabit sayaç geçmişi: eksik ve sıfır tüketimli satırlar scalar yolda atlanır
+USER_HISTORY = [
+    {"reading": 100, "consumption": 12.0},
+    {"reading": 111, "consumption": 11.0},
+    {"reading": 111, "consumption": 0},
+    {"reading": 124},
+    {"reading": 134, "consumption": 10.0},
+    {"reading": 142, "consumption": 8.0},
+    {"reading": 147, "consumption": 5.0},
+]
+SERIES = [12.0, 11.0, 10.0, 8.0, 5.0]
+
+
+@pytest.mark.parametrize("current_reading", [140, 147, 148, 150, 160, 200])
+@pytest.mark.parametrize("metadata", [None, {"photo_age_minutes": 10, "has_gps": False}, {"edited": True}])
+def test_signal_series_matches_scalar(current_reading, metadata):
+    detector = AnomalySignalDetector()
+
+    series = detector.calculate_anomaly_signal_series(SERIES, 147, current_reading, metadata)
+
+    assert series == detector.calculate_anomaly_signal(USER_HISTORY, current_reading, metadata)
+
+
+def test_signal_series_fixed_result():
+    detector = AnomalySignalDetector()
+
+    result = detector.calculate_anomaly_signal_series(SERIES, 147, 148)
+
+    assert result == {
+        "signal_strength": 0.448,
+        "signal_level": "medium",
+        "signal_factors": ["Anomali sinyal: sudden_drop", "Z-score sapması: -2.96"],
+        "recommendation": "İzlemeye devam",
+    }
+    assert result == detector.calculate_anomaly_signal(USER_HISTORY, 148)
+
+
+def test_signal_series_empty_consumptions_uses_metadata_only():
+    detector = AnomalySignalDetector()
+    history = [{"reading": 10}, {"reading": 20, "consumption": 0}]
+
+    result = detector.calculate_anomaly_signal_series([], 20, 25, {"edited": True})
+
+    assert result == detector.calculate_anomaly_signal(history, 25, {"edited": True})
+    assert result["signal_factors"] == ["Fotoğraf düzenlenmiş"]
@@ -0,0 +1,57 @@
+"""
+PeriodicInspectionManager.calculate_penalties testleri
+Toplu (sütun) hesap, satır bazlı calculate_penalty ile aynı sonucu vermeli.
+"""
+import pytest
+
+from inspections.periodic_physical_inspection import PeriodicInspectionManager
+
+
+@pytest.mark.parametrize("unit_price, interest_rate", [
+    (10.0, 0.05),
+    (12.5, 0.0),
+    (7.3, 0.125),
+])
+def test_matches_per_row_penalty(unit_price, interest_rate):
+    manager = PeriodicInspectionManager()
+    differences = [0, 1, 17, 250, 3, 99]
+    months_late = [0, 3, 1, 12, 0, 7]
+
+    columns = manager.calculate_penalties(differences, months_late, unit_price, interest_rate)
+
+    rows = [
+        manager.calculate_penalty(difference, months, unit_price, interest_rate)
+        for difference, months in zip(differences, months_late)
+    ]
+    assert columns == {
+        "base_amount": [row["base_amount"] for row in rows],
+        "interest": [row["interest"] for row in rows],
+        "total": [row["total"] for row in rows],
+    }
+
+
+def test_default_rates_match_per_row_penalty():
+    manager = PeriodicInspectionManager()
+
+    columns = manager.calculate_penalties([40], [2])
+
+    row = manager.calculate_penalty(40, 2)
+    assert columns == {key: [value] for key, value in row.items()}
+
+
+def test_empty_columns():
+    manager = PeriodicInspectionManager()
+
+    assert manager.calculate_penalties([], []) == {"base_amount": [], "interest": [], "total": []}
+
+
+@pytest.mark.parametrize("differences, months_late", [
+    ([10, 20], [1]),
+    ([10], [1, 2]),
+    ([], [1]),
+])
+def test_unequal_column_lengths_raise(differences, months_late):
+    manager = PeriodicInspectionManager()
+
+    with pytest.raises(ValueError):
+        manager.calculate_penalties(differences, months_late)
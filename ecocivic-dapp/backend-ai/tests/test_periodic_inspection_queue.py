@@ -0,0 +1,105 @@
+"""
+PeriodicInspectionManager kontrol kuyruğu testleri
+(heapq + lazy deletion: enqueue_inspection / pop_next_inspection)
+"""
+import pytest
+
+from inspections.periodic_physical_inspection import InspectionResult, PeriodicInspectionManager
+
+
+def _info(priority, days_overdue=0, reason=""):
+    return {"priority": priority, "days_overdue": days_overdue, "reason": reason}
+
+
+def _drain(manager):
+    popped = []
+    while True:
+        item = manager.pop_next_inspection()
+        if item is None:
+            return popped
+        popped.append(item["user_address"])
+
+
+def test_empty_queue_returns_none():
+    manager = PeriodicInspectionManager()
+    assert manager.pop_next_inspection() is None
+
+
+def test_pops_by_priority_then_overdue_then_insertion_order():
+    manager = PeriodicInspectionManager()
+    manager.enqueue_inspection("0xlow", _info(1))
+    manager.enqueue_inspection("0xhigh_a", _info(5, days_overdue=10))
+    manager.enqueue_inspection("0xmid", _info(3, days_overdue=40))
+    manager.enqueue_inspection("0xhigh_b", _info(5, days_overdue=30))
+    manager.enqueue_inspection("0xhigh_c", _info(5, days_overdue=10))
+
+    assert _drain(manager) == ["0xhigh_b", "0xhigh_a", "0xhigh_c", "0xmid", "0xlow"]
+
+
+def test_popped_entry_carries_priority_info():
+    manager = PeriodicInspectionManager()
+    manager.enqueue_inspection("0xuser", _info(4, days_overdue=999, reason="Hiç kontrol yapılmamış"))
+
+    assert manager.pop_next_inspection() == {
+        "user_address": "0xuser",
+        "priority": 4,
+        "days_overdue": 999,
+        "reason": "Hiç kontrol yapılmamış",
+    }
+
+
+def test_reprioritising_moves_user_and_keeps_single_entry():
+    manager = PeriodicInspectionManager()
+    manager.enqueue_inspection("0xa", _info(2))
+    manager.enqueue_inspection("0xb", _info(3))
+    manager.enqueue_inspection("0xa", _info(5, reason="Fraud uyarısı var (1)"))
+
+    first = manager.pop_next_inspection()
+    assert first["user_address"] == "0xa"
+    assert first["priority"] == 5
+    assert first["reason"] == "Fraud uyarısı var (1)"
+    # Eski (priority 2) kaydı ikinci kez dönmez
+    assert _drain(manager) == ["0xb"]
+
+
+def test_lowering_priority_skips_stale_higher_entry():
+    manager = PeriodicInspectionManager()
+    manager.enqueue_inspection("0xa", _info(5))
+    manager.enqueue_inspection("0xb", _info(3))
+    manager.enqueue_inspection("0xa", _info(1))
+
+    # Heap'in başındaki eski priority 5 kaydı atlanır
+    assert _drain(manager) == ["0xb", "0xa"]
+
+
+def test_stale_entries_are_dropped_lazily():
+    manager = PeriodicInspectionManager()
+    for priority in (1, 2, 3):
+        manager.enqueue_inspection("0xa", _info(priority))
+
+    # Güncellemeler heap'te kalır, sadece en son kayıt geçerli sayılır
+    assert len(manager.inspection_queue) == 3
+    assert manager.pop_next_inspection()["priority"] == 3
+    assert manager.pop_next_inspection() is None
+    assert manager.inspection_queue == []
+    assert manager._queued_entries == {}
+
+
+def test_user_can_be_requeued_after_pop():
+    manager = PeriodicInspectionManager()
+    manager.enqueue_inspection("0xa", _info(2))
+    assert manager.pop_next_inspection()["user_address"] == "0xa"
+
+    manager.enqueue_inspection("0xa", _info(4))
+    assert manager.pop_next_inspection()["priority"] == 4
+    assert manager.pop_next_inspection() is None
+
+
+def test_inspection_result_uses_slots():
+    result = InspectionResult(1, "0xuser", "0xinspector", 100, 130, True, "fark")
+
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(AttributeError):
+        result.unexpected = True
+    assert result.reading_difference == 30
+    assert result.to_dict()["notes"] == "fark"
@@ -0,0 +1,96 @@
+"""
+RollingStats testleri
+Her push/pop sonrası pencere istatistikleri statistics.mean/stdev ile
+aynı olmalı; aykırı değerin pencereden çıkması hassasiyeti bozmamalı.
+"""
+import random
+import statistics
+
+import pytest
+
+from fraud_detection.usage_anomaly import RollingStats, UsageAnomalySignalDetector
+
+
+def _assert_matches_window(stats, window):
+    assert list(stats) == window
+    assert len(stats) == len(window)
+    if not window:
+        assert (stats.mean, stats.std) == (0.0, 0)
+        return
+    assert stats.mean == statistics.mean(window)
+    if len(window) < 2:
+        assert stats.std == 0
+    else:
+        assert stats.std == pytest.approx(statistics.stdev(window), rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_push_and_pop_sequences_match_statistics(seed):
+    rng = random.Random(seed)
+    maxlen = rng.randint(2, 12)
+    stats = RollingStats(maxlen=maxlen)
+    window = []
+
+    for _ in range(200):
+        if window and rng.random() < 0.2:
+            assert stats.pop() == window.pop(0)
+        else:
+            value = rng.choice((
+                round(rng.uniform(0, 60), rng.choice((0, 1, 3))),
+                rng.uniform(1e6, 1e9),  # ara sıra aykırı değer
+                0.1,
+            ))
+            stats.push(value)
+            window.append(value)
+            del window[:-maxlen]
+        _assert_matches_window(stats, window)
+
+
+def test_evicting_outlier_restores_precision():
+    history = [20.1, 19.7, 1e8, 21.3, 20.8, 19.9]
+    stats = RollingStats(maxlen=6, values=history)
+    for value in (20.4, 20.2, 19.6):
+        stats.push(value)
+
+    window = history[3:] + [20.4, 20.2, 19.6]
+    _assert_matches_window(stats, window)
+
+
+def test_outlier_eviction_does_not_flag_normal_reading():
+    history = [20.1, 19.7, 1e8, 21.3, 20.8, 19.9]
+    stats = RollingStats(maxlen=6, values=history)
+    for value in (20.4, 20.2, 19.6):
+        stats.push(value)
+    detector = UsageAnomalySignalDetector()
+
+    assert detector.calculate_signal_score(20.5, stats)["signal_score"] == 0
+    assert detector.calculate_signal_code(20.5, stats) == detector.calculate_signal_code(20.5, list(stats))
+
+
+@pytest.mark.parametrize("value", [0.1, 0.7, 20.3, 1e8])
+def test_constant_window_has_zero_std(value):
+    stats = RollingStats(maxlen=3, values=[value + 5, value * 3])
+    for _ in range(6):
+        stats.push(value)
+
+    assert list(stats) == [value] * 3
+    assert stats.mean == value
+    assert stats.std == 0
+
+
+def test_decreasing_streak_tracks_last_readings():
+    stats = RollingStats(maxlen=4, values=[30, 25, 20])
+    assert stats.decreasing_streak == 2
+
+    stats.push(22)
+    assert stats.decreasing_streak == 0
+
+    stats.push(21)
+    assert stats.decreasing_streak == 1
+
+
+def test_pop_until_empty():
+    stats = RollingStats(maxlen=3, values=[1, 2, 3])
+
+    assert [stats.pop(), stats.pop(), stats.pop()] == [1, 2, 3]
+    _assert_matches_window(stats, [])
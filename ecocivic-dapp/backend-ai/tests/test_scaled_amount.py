@@ -0,0 +1,56 @@
+"""
+scaled_amount hybrid testleri
+Toplu UPDATE hem öznitelik hem de string anahtarla tam sayı kolonu yazmalı.
+"""
+import os
+
+import pytest
+
+# config import sırasında zorunlu ayarlar; modüldeki engine hiç bağlanmaz
+os.environ.setdefault("QR_SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite:///unused.db")
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from database.models import Base, WaterMeterReading
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[WaterMeterReading.__table__])
+    with Session(engine) as session:
+        session.add(WaterMeterReading(
+            meter_no="M-1",
+            wallet_address="0x" + "a" * 40,
+            reading_index=10,
+            consumption_m3=1.0,
+            bill_amount=5.0,
+        ))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def _stored(session):
+    return session.query(
+        WaterMeterReading.consumption_milli_m3,
+        WaterMeterReading.bill_amount_kurus,
+    ).one()
+
+
+@pytest.mark.parametrize("key", [WaterMeterReading.consumption_m3, "consumption_m3"])
+def test_query_update_key(session, key):
+    session.query(WaterMeterReading).update({key: 2.345}, synchronize_session=False)
+    assert _stored(session) == (2345, 500)
+
+
+def test_core_update_attribute_key(session):
+    session.execute(update(WaterMeterReading).values({WaterMeterReading.bill_amount: 12.34}))
+    assert _stored(session) == (1000, 1234)
+
+
+def test_expression_reads_scaled_value(session):
+    value = session.query(WaterMeterReading.consumption_m3).scalar()
+    assert value == pytest.approx(1.0)
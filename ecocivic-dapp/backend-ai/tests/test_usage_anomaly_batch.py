@@ -0,0 +1,79 @@
+"""
+UsageAnomalySignalDetector.calculate_signal_scores_batch testleri
+Toplu sonuç, calculate_signal_score döngüsüyle eleman eleman aynı olmalı.
+"""
+import random
+
+import pytest
+
+from fraud_detection.usage_anomaly import RollingStats, UsageAnomalySignalDetector
+
+HISTORIES = [
+    [],
+    [12.0],
+    [12.0, 14.0],
+    [20.0, 20.0, 20.0],            # sıfır std
+    [0.1] * 6,                     # sıfır std, ikilik tabanda tam değil
+    [0, 0, 0, 0],                  # sıfır ortalama
+    [30, 25, 20, 15],              # düşüş trendi
+    [10.5, 11.2, 9.8, 10.1, 55.0, 10.4, 10.0, 9.9, 10.3, 10.6, 11.0, 10.2],
+]
+CURRENTS = [0, 2, 10, 20, 65]
+METADATAS = [None, {}, {"photo_age_minutes": 9, "has_gps": False}, {"edited": True}]
+
+
+def _mixed_cases():
+    rng = random.Random(3)
+    currents, histories, metadatas = [], [], []
+    for history in HISTORIES:
+        for current in CURRENTS:
+            currents.append(current)
+            histories.append(list(history))
+            metadatas.append(rng.choice(METADATAS))
+    return currents, histories, metadatas
+
+
+def test_matches_loop_of_signal_score():
+    detector = UsageAnomalySignalDetector()
+    currents, histories, metadatas = _mixed_cases()
+
+    batch = detector.calculate_signal_scores_batch(currents, histories, metadatas)
+
+    assert batch == [
+        detector.calculate_signal_score(current, history, metadata)
+        for current, history, metadata in zip(currents, histories, metadatas)
+    ]
+
+
+def test_without_metadata_matches_loop():
+    detector = UsageAnomalySignalDetector()
+    currents, histories, _ = _mixed_cases()
+
+    batch = detector.calculate_signal_scores_batch(currents, histories)
+
+    assert batch == [
+        detector.calculate_signal_score(current, history)
+        for current, history in zip(currents, histories)
+    ]
+
+
+def test_rolling_windows_match_plain_lists():
+    detector = UsageAnomalySignalDetector()
+    currents, histories, metadatas = _mixed_cases()
+    windows = [RollingStats(maxlen=12, values=history) for history in histories]
+
+    assert detector.calculate_signal_scores_batch(currents, windows, metadatas) == \
+        detector.calculate_signal_scores_batch(currents, histories, metadatas)
+
+
+def test_empty_batch():
+    assert UsageAnomalySignalDetector().calculate_signal_scores_batch([], []) == []
+
+
+@pytest.mark.parametrize("currents, histories, metadatas", [
+    ([1, 2], [[1, 2, 3]], None),
+    ([1], [[1, 2, 3]], [None, None]),
+])
+def test_length_mismatch_raises(currents, histories, metadatas):
+    with pytest.raises(ValueError):
+        UsageAnomalySignalDetector().calculate_signal_scores_batch(currents, histories, metadatas)
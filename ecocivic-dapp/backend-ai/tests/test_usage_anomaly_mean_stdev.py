@@ -0,0 +1,45 @@
+"""
+mean_stdev testleri
+Ortalama statistics.mean ile birebir aynı olmalı (eşik karşılaştırmaları
+ona göre yapılır); sapma statistics.stdev'e yuvarlama farkı kadar yakın.
+"""
+import random
+import statistics
+
+import pytest
+
+from fraud_detection.usage_anomaly import SPIKE_FLAG, UsageAnomalySignalDetector, mean_stdev
+
+
+def _histories(seed=7, count=500):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield [round(rng.uniform(0, 80), rng.choice((0, 1, 2))) for _ in range(rng.randint(2, 12))]
+
+
+@pytest.mark.parametrize("history", list(_histories()))
+def test_matches_statistics(history):
+    mean, std = mean_stdev(history)
+
+    assert mean == statistics.mean(history)
+    assert std == pytest.approx(statistics.stdev(history), rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("history", [[0.1] * 3, [20.3] * 12, [0, 0], [7] * 5])
+def test_constant_history_has_zero_std(history):
+    assert mean_stdev(history) == (statistics.mean(history), 0.0)
+
+
+def test_spike_boundary_follows_statistics_mean():
+    # fsum(history) / 3 bir ulp küçük çıkar ve change_percent
+    # 199.99999999999997 olurdu; statistics.mean ile tam 200'ün üstü
+    history = [24.9, 22.2, 35.1]
+    detector = UsageAnomalySignalDetector()
+
+    score, _, flags = detector.calculate_signal_code(82.2, history)
+    result = detector.calculate_signal_score(82.2, history)
+
+    assert result["details"]["change_percent"] >= detector.SPIKE_THRESHOLD_PERCENT
+    assert flags & SPIKE_FLAG
+    assert "Tüketim %200.0 arttı" in result["anomalies"]
+    assert result["signal_score"] == score
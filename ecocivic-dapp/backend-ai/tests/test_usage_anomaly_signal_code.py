@@ -0,0 +1,123 @@
+"""
+UsageAnomalySignalDetector.calculate_signal_code testleri
+Kompakt (score, level, flags) sonucu calculate_signal_score ile birebir
+aynı sinyali taşımalı.
+"""
+import random
+
+import pytest
+
+from fraud_detection.usage_anomaly import (
+    DROP_FLAG,
+    EDITED_FLAG,
+    LEVEL_CRITICAL,
+    LEVEL_LOW,
+    LEVEL_UNKNOWN,
+    NO_GPS_FLAG,
+    OLD_PHOTO_FLAG,
+    SPIKE_FLAG,
+    TREND_FLAG,
+    Z_SCORE_FLAG,
+    RollingStats,
+    UsageAnomalySignalDetector,
+)
+
+# Bayrak -> calculate_signal_score anomali metninin başı
+FLAG_MESSAGES = (
+    (DROP_FLAG, "Tüketim %", "düştü"),
+    (SPIKE_FLAG, "Tüketim %", "arttı"),
+    (Z_SCORE_FLAG, "Z-score:", ""),
+    (TREND_FLAG, "Son 4 ayda", ""),
+    (OLD_PHOTO_FLAG, "Fotoğraf 5 dakikadan", ""),
+    (NO_GPS_FLAG, "GPS bilgisi yok", ""),
+    (EDITED_FLAG, "Fotoğraf düzenleme", ""),
+)
+
+METADATAS = (
+    None,
+    {},
+    {"photo_age_minutes": 12},
+    {"has_gps": False},
+    {"edited": True},
+    {"photo_age_minutes": 30, "has_gps": False, "edited": True},
+)
+
+
+def _cases(seed=1234, count=300):
+    rng = random.Random(seed)
+    for _ in range(count):
+        history = [round(rng.uniform(0, 60), rng.choice((0, 1, 3))) for _ in range(rng.randint(0, 12))]
+        if history and rng.random() < 0.2:
+            history = sorted(history, reverse=True)  # trend bayrağı için
+        base = history[-1] if history else 10
+        current = rng.choice((0, base * 0.3, base * 0.95, base * 3.5, rng.uniform(0, 200)))
+        yield current, history, rng.choice(METADATAS)
+
+
+def _decode(detector, code):
+    score, level, flags = code
+    if level == LEVEL_UNKNOWN:
+        return score, "unknown", flags
+    return score, detector.SIGNAL_LEVELS[level][0], flags
+
+
+def _assert_round_trip(detector, code, result):
+    score, level_name, flags = _decode(detector, code)
+    assert score == result["signal_score"]
+    assert level_name == result["signal_level"]
+
+    if code[1] == LEVEL_UNKNOWN:
+        assert flags == 0
+        assert "details" not in result
+        return
+
+    assert LEVEL_LOW <= code[1] <= LEVEL_CRITICAL
+    assert detector.SIGNAL_LEVELS[code[1]][1] == result["recommendation"]
+
+    # Maskedeki her bayrak, bit sırasıyla tam bir anomali metnine karşılık gelir
+    expected = [(prefix, suffix) for flag, prefix, suffix in FLAG_MESSAGES if flags & flag]
+    assert len(expected) == len(result["anomalies"])
+    for (prefix, suffix), message in zip(expected, result["anomalies"]):
+        assert message.startswith(prefix)
+        assert message.endswith(suffix)
+
+    details = result["details"]
+    assert detector._anomaly_messages(flags, details["change_percent"], details["z_score"]) == result["anomalies"]
+
+
+@pytest.mark.parametrize("current, history, metadata", list(_cases()))
+def test_code_round_trips_with_signal_score(current, history, metadata):
+    detector = UsageAnomalySignalDetector()
+
+    code = detector.calculate_signal_code(current, history, metadata)
+
+    _assert_round_trip(detector, code, detector.calculate_signal_score(current, history, metadata))
+
+
+@pytest.mark.parametrize("current, history, metadata", list(_cases(seed=99, count=100)))
+def test_code_round_trips_with_rolling_stats(current, history, metadata):
+    detector = UsageAnomalySignalDetector()
+    window = RollingStats(maxlen=12, values=history)
+
+    code = detector.calculate_signal_code(current, window, metadata)
+
+    assert code == detector.calculate_signal_code(current, history, metadata)
+    _assert_round_trip(detector, code, detector.calculate_signal_score(current, window, metadata))
+
+
+def test_insufficient_history_is_unknown():
+    detector = UsageAnomalySignalDetector()
+
+    assert detector.calculate_signal_code(10, [5, 6]) == (0, LEVEL_UNKNOWN, 0)
+    assert detector.calculate_signal_score(10, [5, 6])["signal_level"] == "unknown"
+
+
+def test_flags_and_level_for_known_drop():
+    detector = UsageAnomalySignalDetector()
+    history = [30, 25, 20]
+
+    score, level, flags = detector.calculate_signal_code(2, history, {"has_gps": False})
+
+    assert flags == DROP_FLAG | Z_SCORE_FLAG | TREND_FLAG | NO_GPS_FLAG
+    assert score == 40 + 25 + 15 + 5
+    assert level == LEVEL_CRITICAL
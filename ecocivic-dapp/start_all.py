@@ -122,10 +122,10 @@ MetaMask Ayarlari:
    * Symbol:    ETH
 
 Test Kullanicilari:
-   * Vatandas 1:  0xCitizen00100000000000000000000000000001
-   * Vatandas 2:  0xCitizen00200000000000000000000000000002
-   * Admin:       0xAdmin00100000000000000000000000000000001
-   * Personel:    0xStaff00100000000000000000000000000000001
+   * Vatandas 1:  0xc100000000000000000000000000000000000001
+   * Vatandas 2:  0xc200000000000000000000000000000000000002
+   * Admin:       0xad00000000000000000000000000000000000001
+   * Personel:    0x5f00000000000000000000000000000000000001
         """)
         
         # Tarayiciyi ac